@@ -0,0 +1,83 @@
+"""
+Import and construct time of the contract wrappers.
+
+Import time is measured in a fresh interpreter per module. Construct time compares
+the shared contract classes of the ABI registry with building a web3 contract from
+the ABI per instance, as the wrappers did before.
+
+Usage: python benchmarks/bench_abi.py [iterations]
+"""
+import asyncio
+import os
+import subprocess
+import sys
+import timeit
+
+from eth_account import Account
+
+from zksync2_async.manage_contracts.erc20_contract import AsyncERC20Contract
+from zksync2_async.manage_contracts.eth_token import AsyncEthToken
+from zksync2_async.manage_contracts.l1_bridge import AsyncL1Bridge
+from zksync2_async.manage_contracts.l2_bridge import AsyncL2Bridge
+from zksync2_async.manage_contracts.nonce_holder import AsyncNonceHolder
+from zksync2_async.manage_contracts.zksync_contract import AsyncZkSyncContract
+from zksync2_async.module.module_builder import AsyncZkSyncBuilder
+from zksync2_async.module.zksync_provider import AsyncZkSyncProvider
+from zksync2_async.utils.abi import erc_20_abi_default, eth_token_abi_default, l1_bridge_abi_default, \
+    l2_bridge_abi_default, nonce_holder_abi_default, zksync_abi_default
+from zksync2_async.utils.deploy_addresses import ZkSyncAddresses
+
+MODULES = [
+    "zksync2_async.manage_contracts.erc20_contract",
+    "zksync2_async.manage_contracts.l1_bridge",
+    "zksync2_async.manage_contracts.l2_bridge",
+    "zksync2_async.manage_contracts.nonce_holder",
+    "zksync2_async.manage_contracts.zksync_contract",
+]
+
+
+def import_time(module: str) -> float:
+    code = f"import time; s = time.perf_counter(); import {module}; print(time.perf_counter() - s)"
+    output = subprocess.check_output([sys.executable, "-c", code], env=dict(os.environ, PYTHONPATH="."))
+    return float(output)
+
+
+def report(name: str, legacy, fast, iterations: int):
+    legacy_time = timeit.timeit(legacy, number=iterations)
+    fast_time = timeit.timeit(fast, number=iterations)
+    print(f"{name:20} per instance abi: {legacy_time / iterations * 1e3:7.2f} ms, "
+          f"shared: {fast_time / iterations * 1e3:7.2f} ms, speedup: {legacy_time / fast_time:5.1f}x")
+
+
+async def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    for module in MODULES:
+        print(f"import {module:50} {import_time(module) * 1e3:7.1f} ms")
+
+    web3 = await AsyncZkSyncBuilder.build(AsyncZkSyncProvider("http://127.0.0.1:3050"))
+    account = Account.create()
+    address = "0x" + os.urandom(20).hex()
+    checksum_address = web3.to_checksum_address(address)
+
+    report("AsyncERC20Contract",
+           lambda: web3.eth.contract(checksum_address, abi=erc_20_abi_default()),
+           lambda: AsyncERC20Contract(web3.eth, address, account), iterations)
+    report("AsyncEthToken",
+           lambda: web3.eth.contract(checksum_address, abi=eth_token_abi_default()),
+           lambda: AsyncEthToken(web3.eth, address, account), iterations)
+    report("AsyncL1Bridge",
+           lambda: web3.eth.contract(checksum_address, abi=l1_bridge_abi_default()),
+           lambda: AsyncL1Bridge(address, web3, account), iterations)
+    report("AsyncL2Bridge",
+           lambda: web3.eth.contract(checksum_address, abi=l2_bridge_abi_default()),
+           lambda: AsyncL2Bridge(address, web3, account), iterations)
+    report("AsyncNonceHolder",
+           lambda: web3.zksync.contract(ZkSyncAddresses.NONCE_HOLDER_ADDRESS.value, abi=nonce_holder_abi_default()),
+           lambda: AsyncNonceHolder(web3, account), iterations)
+    report("AsyncZkSyncContract",
+           lambda: web3.eth.contract(checksum_address, abi=zksync_abi_default()),
+           lambda: AsyncZkSyncContract(address, web3, account), iterations)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
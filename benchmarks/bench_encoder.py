@@ -0,0 +1,45 @@
+"""
+Calldata encoding microbenchmark of the compiled encoder against web3 encodeABI.
+
+Usage: python benchmarks/bench_encoder.py [iterations]
+"""
+import os
+import sys
+import timeit
+
+from web3 import AsyncWeb3, AsyncHTTPProvider
+
+from zksync2_async.manage_contracts.erc20_contract import ERC20Encoder
+from zksync2_async.manage_contracts.paymaster_utils import AsyncPaymasterFlowEncoder
+from zksync2_async.manage_contracts.precompute_contract_deployer import AsyncPrecomputeContractDeployer
+
+
+def report(name: str, encoder, fn_name: str, args: tuple, iterations: int):
+    legacy = lambda: encoder.instance_contract.encodeABI(fn_name, args)
+    encoder.validate = True
+    assert legacy() == encoder.encode_method(fn_name, args), f"{name}: outputs differ"
+    legacy_time = timeit.timeit(legacy, number=iterations)
+    compiled_time = timeit.timeit(lambda: encoder.encode_method_bytes(fn_name, args), number=iterations)
+    encoder.validate = False
+    assert legacy() == encoder.encode_method(fn_name, args), f"{name}: outputs differ"
+    unchecked_time = timeit.timeit(lambda: encoder.encode_method_bytes(fn_name, args), number=iterations)
+    print(f"{name:16} encodeABI: {legacy_time / iterations * 1e6:8.1f} us/op, "
+          f"compiled: {compiled_time / iterations * 1e6:6.1f} us/op ({legacy_time / compiled_time:5.1f}x), "
+          f"no validation: {unchecked_time / iterations * 1e6:6.1f} us/op ({legacy_time / unchecked_time:5.1f}x)")
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    web3 = AsyncWeb3(AsyncHTTPProvider("http://127.0.0.1:3050"))
+    address = AsyncWeb3.to_checksum_address("0x" + os.urandom(20).hex())
+
+    report("transfer", ERC20Encoder(web3), "transfer", (address, 10 ** 18), iterations)
+    report("approvalBased", AsyncPaymasterFlowEncoder(web3), "approvalBased",
+           (address, 10 ** 18, os.urandom(100)), iterations)
+    report("general", AsyncPaymasterFlowEncoder(web3), "general", (os.urandom(100),), iterations)
+    report("create2", AsyncPrecomputeContractDeployer(web3).contract_encoder, "create2",
+           (os.urandom(32), os.urandom(32), os.urandom(68)), iterations)
+
+
+if __name__ == "__main__":
+    main()
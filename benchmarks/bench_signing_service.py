@@ -0,0 +1,61 @@
+"""
+AsyncSigningService throughput benchmark for 1/4/16 workers, thread and process pools.
+
+Usage: python benchmarks/bench_signing_service.py [transactions]
+"""
+import asyncio
+import os
+import sys
+import time
+
+from eth_account import Account
+
+from zksync2_async.core.request_types import EIP712Meta
+from zksync2_async.signer.eth_signer import PrivateKeyEthSigner
+from zksync2_async.signer.signing_service import AsyncSigningService
+from zksync2_async.transaction.transaction712 import Transaction712
+
+
+def make_transactions(count: int, sender: str):
+    to = "0x" + os.urandom(20).hex()
+    return [Transaction712(chain_id=280,
+                           nonce=nonce,
+                           gas_limit=1000000,
+                           to=to,
+                           value=1,
+                           data="0x",
+                           maxPriorityFeePerGas=100000000,
+                           maxFeePerGas=250000000,
+                           from_=sender,
+                           meta=EIP712Meta()) for nonce in range(count)]
+
+
+async def run(signer: PrivateKeyEthSigner, txs, workers: int, use_processes: bool) -> float:
+    async with AsyncSigningService(signer, max_workers=workers, use_processes=use_processes) as service:
+        # INFO: warm up the pool before measuring
+        await service.sign_many(txs[:workers])
+        started = time.perf_counter()
+        await service.sign_many(txs)
+        return len(txs) / (time.perf_counter() - started)
+
+
+async def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    account = Account.create()
+    signer = PrivateKeyEthSigner(account, 280)
+    txs = make_transactions(count, account.address)
+
+    started = time.perf_counter()
+    for tx in txs:
+        tx.encode(signer.sign_transaction712(tx))
+    print(f"{'inline':10} {'':>2}  {count / (time.perf_counter() - started):9.0f} tx/s")
+
+    for use_processes in (False, True):
+        for workers in (1, 4, 16):
+            rate = await run(signer, txs, workers, use_processes)
+            kind = "processes" if use_processes else "threads"
+            print(f"{kind:10} {workers:2}  {rate:9.0f} tx/s")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,53 @@
+"""
+Bulk token amount conversion benchmark of Token.format_many/parse_many against
+the scalar format_token/to_int path.
+
+Usage: python benchmarks/bench_token_amounts.py [amounts]
+"""
+import random
+import sys
+import time
+from decimal import Decimal
+
+from zksync2_async.core.types import Token
+
+
+def measure(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def report(name: str, scalar_time: float, bulk_time: float, count: int):
+    print(f"{name:8} scalar: {scalar_time / count * 1e9:8.0f} ns/amount, "
+          f"bulk: {bulk_time / count * 1e9:6.0f} ns/amount ({scalar_time / bulk_time:4.1f}x)")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(1)
+    token = Token.create_eth()
+    amounts = [rng.randrange(0, 10 ** 24) for _ in range(count)]
+
+    texts = token.format_many(amounts)
+    assert [Decimal(t) for t in texts[:1000]] == [Decimal(token.format_token(a)) for a in amounts[:1000]]
+    report("format",
+           measure(lambda: [token.format_token(a) for a in amounts]),
+           measure(lambda: token.format_many(amounts)),
+           count)
+
+    decimals = [Decimal(t) for t in texts]
+    assert token.parse_many(texts) == amounts
+    report("parse",
+           measure(lambda: [token.to_int(d) for d in decimals]),
+           measure(lambda: token.parse_many(texts)),
+           count)
+
+    report("scale",
+           measure(lambda: [Decimal(a) / Decimal(10) ** token.decimals for a in amounts]),
+           measure(lambda: token.scale_many(amounts)),
+           count)
+
+
+if __name__ == "__main__":
+    main()
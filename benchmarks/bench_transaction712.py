@@ -0,0 +1,104 @@
+"""
+Transaction712 hashing/encoding microbenchmark.
+
+Compares the precompiled struct_hash()/encode() path with the EIP712Struct based
+to_eip712_struct().hash_struct() and the former per-call rlp.Serializable encoder.
+
+Usage: python benchmarks/bench_transaction712.py [iterations]
+"""
+import os
+import sys
+import timeit
+
+import rlp
+from eth_account.datastructures import SignedMessage
+from eth_utils import remove_0x_prefix
+from rlp.sedes import big_endian_int, binary
+from rlp.sedes import List as rlpList
+
+from zksync2_async.core.request_types import EIP712Meta
+from zksync2_async.core.types import PaymasterParams
+from zksync2_async.core.utils import encode_address, to_bytes, int_to_bytes
+from zksync2_async.transaction.transaction712 import Transaction712
+
+
+def legacy_encode(tx: Transaction712, signature: SignedMessage) -> bytes:
+    factory_deps = tx.meta.factory_deps or []
+    factory_deps_elements = [binary for _ in factory_deps] if len(factory_deps) > 0 else None
+    paymaster_params = tx.meta.paymaster_params
+    paymaster_params_data = [bytes.fromhex(remove_0x_prefix(paymaster_params.paymaster)),
+                             paymaster_params.paymaster_input]
+
+    class InternalRepresentation(rlp.Serializable):
+        fields = [
+            ('nonce', big_endian_int),
+            ('maxPriorityFeePerGas', big_endian_int),
+            ('maxFeePerGas', big_endian_int),
+            ('gasLimit', big_endian_int),
+            ('to', binary),
+            ('value', big_endian_int),
+            ('data', binary),
+            ('chain_id', big_endian_int),
+            ('unknown1', binary),
+            ('unknown2', binary),
+            ('chain_id2', big_endian_int),
+            ('from', binary),
+            ('gasPerPubdata', big_endian_int),
+            ('factoryDeps', rlpList(elements=factory_deps_elements, strict=False)),
+            ('signature', binary),
+            ('paymaster_params', rlpList(elements=[binary, binary], strict=False))
+        ]
+
+    representation = InternalRepresentation(nonce=tx.nonce,
+                                            maxPriorityFeePerGas=tx.maxPriorityFeePerGas,
+                                            maxFeePerGas=tx.maxFeePerGas,
+                                            gasLimit=tx.gas_limit,
+                                            to=encode_address(tx.to),
+                                            value=tx.value,
+                                            data=to_bytes(tx.data),
+                                            chain_id=tx.chain_id,
+                                            unknown1=b'',
+                                            unknown2=b'',
+                                            chain_id2=tx.chain_id,
+                                            **{"from": encode_address(tx.from_)},
+                                            gasPerPubdata=tx.meta.gas_per_pub_data,
+                                            factoryDeps=factory_deps,
+                                            signature=signature.signature,
+                                            paymaster_params=paymaster_params_data)
+    return int_to_bytes(tx.EIP_712_TX_TYPE) + rlp.encode(representation, infer_serializer=True, cache=False)
+
+
+def make_transaction() -> Transaction712:
+    meta = EIP712Meta(factory_deps=[os.urandom(32 * 64)],
+                      paymaster_params=PaymasterParams(paymaster="0x" + os.urandom(20).hex(),
+                                                       paymaster_input=os.urandom(100)))
+    return Transaction712(chain_id=280,
+                          nonce=42,
+                          gas_limit=1000000,
+                          to="0x" + os.urandom(20).hex(),
+                          value=10 ** 18,
+                          data="0x" + os.urandom(68).hex(),
+                          maxPriorityFeePerGas=100000000,
+                          maxFeePerGas=250000000,
+                          from_="0x" + os.urandom(20).hex(),
+                          meta=meta)
+
+
+def report(name: str, legacy, fast, iterations: int):
+    assert legacy() == fast(), f"{name}: outputs differ"
+    legacy_time = timeit.timeit(legacy, number=iterations)
+    fast_time = timeit.timeit(fast, number=iterations)
+    print(f"{name:12} legacy: {legacy_time / iterations * 1e6:9.1f} us/op, "
+          f"fast: {fast_time / iterations * 1e6:9.1f} us/op, speedup: {legacy_time / fast_time:5.1f}x")
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    tx = make_transaction()
+    signature = SignedMessage(messageHash=b'', r=0, s=0, v=0, signature=os.urandom(65))
+    report("struct hash", lambda: tx.to_eip712_struct().hash_struct(), tx.struct_hash, iterations)
+    report("encode", lambda: legacy_encode(tx, signature), lambda: tx.encode(signature), iterations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import gc
+import weakref
+from unittest import TestCase
+
+from eth_account import Account
+from web3 import AsyncWeb3, AsyncHTTPProvider
+
+from zksync2_async.manage_contracts.erc20_contract import AsyncERC20Contract
+from zksync2_async.utils.abi import contract_abi, contract_factory, erc_20_abi_default, zksync_abi_default, \
+    nonce_holder_abi_default, ERC20_ABI, ZKSYNC_ABI
+
+
+class AbiRegistryTests(TestCase):
+
+    def test_first_call_returns_abi(self):
+        self.assertIsInstance(zksync_abi_default(), list)
+        self.assertIs(zksync_abi_default(), zksync_abi_default())
+        self.assertIsInstance(nonce_holder_abi_default(), list)
+
+    def test_selectors_and_topics(self):
+        erc20 = contract_abi(ERC20_ABI)
+        self.assertEqual(bytes.fromhex("a9059cbb"), erc20.selector("transfer"))
+        self.assertEqual(bytes.fromhex("a9059cbb"), erc20.selectors["transfer(address,uint256)"])
+        self.assertEqual(bytes.fromhex("ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"),
+                         erc20.event_topic("Transfer"))
+        self.assertIs(erc20, contract_abi(ERC20_ABI))
+
+    def test_unknown_function(self):
+        with self.assertRaises(ValueError):
+            contract_abi(ZKSYNC_ABI).selector("noSuchFunction")
+
+    def test_shared_factory(self):
+        web3 = AsyncWeb3(AsyncHTTPProvider("http://127.0.0.1:3050"))
+        account = Account.create()
+        first = AsyncERC20Contract(web3.eth, "0x" + "11" * 20, account)
+        second = AsyncERC20Contract(web3.eth, "0x" + "22" * 20, account)
+        self.assertIs(type(first.contract), type(second.contract))
+        self.assertIs(contract_factory(web3.eth, ERC20_ABI), type(first.contract))
+        self.assertEqual(erc_20_abi_default(), first.contract.abi)
+        self.assertNotEqual(first.contract.address, second.contract.address)
+
+    def test_factory_freed_with_web3(self):
+        web3 = AsyncWeb3(AsyncHTTPProvider("http://127.0.0.1:3050"))
+        contract_factory(web3.eth, ERC20_ABI)
+        ref = weakref.ref(web3)
+        del web3
+        gc.collect()
+        self.assertIsNone(ref())
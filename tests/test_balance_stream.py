@@ -0,0 +1,84 @@
+import asyncio
+import json
+import os
+import tempfile
+from unittest import IsolatedAsyncioTestCase
+
+from zksync2_async.module.balance_stream import stream_account_balances, write_balance_columns, BalanceRecord
+
+ETH = "0x000000000000000000000000000000000000800a"
+USDC = "0x" + "11" * 20
+
+
+class FakeManager:
+    def __init__(self):
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def coro_request(self, method, params):
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        index = int(params[0], 16)
+        balances = {ETH: hex(index)}
+        if index % 2 == 0:
+            balances[USDC] = hex(index * 10)
+        return balances
+
+
+class FakeWeb3:
+    def __init__(self):
+        self.manager = FakeManager()
+
+
+class FakeZkSync:
+    def __init__(self):
+        self.w3 = FakeWeb3()
+
+
+def addresses(count: int):
+    for i in range(count):
+        yield "0x" + f"{i:040x}"
+
+
+async def async_addresses(count: int):
+    for address in addresses(count):
+        yield address
+
+
+class TestBalanceStream(IsolatedAsyncioTestCase):
+
+    async def test_records_in_order(self):
+        zksync = FakeZkSync()
+        records = [r async for r in stream_account_balances(zksync, async_addresses(7), batch_size=3)]
+        self.assertEqual(11, len(records))
+        self.assertEqual(BalanceRecord("0x" + f"{0:040x}", ETH, 0), records[0])
+        self.assertEqual(BalanceRecord("0x" + f"{6:040x}", USDC, 60), records[-1])
+        self.assertEqual(sorted(r.address for r in records), [r.address for r in records])
+
+    async def test_bounded_fan_out(self):
+        zksync = FakeZkSync()
+        stream = stream_account_balances(zksync, addresses(10 ** 9), batch_size=10, concurrency=2)
+        count = 0
+        async for _ in stream:
+            count += 1
+            if count == 300:
+                break
+        await stream.aclose()
+        self.assertLessEqual(zksync.w3.manager.max_in_flight, 20)
+        self.assertLessEqual(zksync.w3.manager.requests, 220)
+
+    async def test_columns(self):
+        zksync = FakeZkSync()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "balances.jsonl")
+            written = await write_balance_columns(stream_account_balances(zksync, addresses(4)), path, chunk_size=4)
+            with open(path) as output:
+                chunks = [json.loads(line) for line in output]
+        self.assertEqual(6, written)
+        self.assertEqual([4, 2], [len(c["amount"]) for c in chunks])
+        self.assertEqual([ETH, USDC], chunks[0]["token"][:2])
+        self.assertEqual(["20", "3"], chunks[1]["amount"])
@@ -0,0 +1,55 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from zksync2_async.module.block_tracker import AsyncBlockTracker
+
+
+class FakeManager:
+    def __init__(self):
+        self.blocks = {"committed": 10, "finalized": 5}
+        self.calls = 0
+
+    async def coro_request(self, method, params):
+        self.calls += 1
+        return {"number": hex(self.blocks[params[0]])}
+
+
+class FakeWeb3:
+    def __init__(self):
+        self.manager = FakeManager()
+
+
+class FakeEth:
+    def __init__(self):
+        self.w3 = FakeWeb3()
+
+
+class TestBlockTracker(IsolatedAsyncioTestCase):
+
+    async def test_until_finalized_shared_refresh(self):
+        eth = FakeEth()
+        tracker = AsyncBlockTracker(eth, refresh_interval=0.01)
+        waiters = asyncio.gather(*[tracker.until_finalized(8, timeout=5) for _ in range(1000)])
+        await asyncio.sleep(0.05)
+        calls = eth.w3.manager.calls
+        eth.w3.manager.blocks["finalized"] = 9
+        self.assertEqual([9] * 1000, await waiters)
+        self.assertEqual(10, tracker.committed_block)
+        # INFO: two calls per refresh, independent of the number of waiters
+        self.assertLess(calls, 20)
+        self.assertEqual(9, await tracker.until_finalized(3))
+        await tracker.stop()
+
+    async def test_until_finalized_timeout(self):
+        tracker = AsyncBlockTracker(FakeEth(), refresh_interval=0.01)
+        with self.assertRaises(asyncio.TimeoutError):
+            await tracker.until_finalized(100, timeout=0.05)
+        await tracker.stop()
+
+    async def test_timed_out_waiters_compacted(self):
+        tracker = AsyncBlockTracker(FakeEth(), refresh_interval=10)
+        for _ in range(3 * AsyncBlockTracker.COMPACT_THRESHOLD):
+            with self.assertRaises(asyncio.TimeoutError):
+                await tracker.until_finalized(10 ** 9, timeout=0)
+        self.assertLessEqual(len(tracker._finalized_waiters), AsyncBlockTracker.COMPACT_THRESHOLD + 1)
+        await tracker.stop()
@@ -0,0 +1,117 @@
+import os
+import random
+from unittest import TestCase
+
+from web3 import AsyncWeb3, AsyncHTTPProvider
+from web3.exceptions import Web3ValidationError, InvalidAddress
+
+from zksync2_async.manage_contracts.contract_encoder_base import BaseContractEncoder
+from zksync2_async.manage_contracts.erc20_contract import ERC20Encoder
+from zksync2_async.manage_contracts.paymaster_utils import AsyncPaymasterFlowEncoder
+
+TEST_ABI = [
+    {
+        "type": "function",
+        "name": "mixed",
+        "inputs": [
+            {"name": "a", "type": "uint8"},
+            {"name": "b", "type": "int128"},
+            {"name": "c", "type": "bool"},
+            {"name": "d", "type": "bytes4"},
+            {"name": "e", "type": "string"},
+            {"name": "f", "type": "bytes"},
+            {"name": "g", "type": "address"},
+        ],
+        "outputs": [],
+        "stateMutability": "nonpayable"
+    },
+    {
+        "type": "function",
+        "name": "withArray",
+        "inputs": [{"name": "values", "type": "uint256[]"}],
+        "outputs": [],
+        "stateMutability": "nonpayable"
+    },
+    {
+        "type": "function",
+        "name": "withAddresses",
+        "inputs": [{"name": "accounts", "type": "address[]"}],
+        "outputs": [],
+        "stateMutability": "nonpayable"
+    },
+    {
+        "type": "function",
+        "name": "withTuple",
+        "inputs": [{"name": "pair", "type": "tuple",
+                    "components": [{"name": "x", "type": "uint256"}, {"name": "y", "type": "address"}]}],
+        "outputs": [],
+        "stateMutability": "nonpayable"
+    }
+]
+
+
+class CompiledEncoderTests(TestCase):
+
+    def setUp(self) -> None:
+        self.web3 = AsyncWeb3(AsyncHTTPProvider("http://127.0.0.1:3050"))
+        self.address = AsyncWeb3.to_checksum_address("0x" + os.urandom(20).hex())
+
+    def assertSameEncoding(self, encoder: BaseContractEncoder, fn_name: str, args: tuple):
+        self.assertEqual(encoder.instance_contract.encodeABI(fn_name, args), encoder.encode_method(fn_name, args))
+
+    def test_bundled_functions(self):
+        self.assertSameEncoding(ERC20Encoder(self.web3), "transfer", (self.address, 10 ** 18))
+        paymaster = AsyncPaymasterFlowEncoder(self.web3)
+        for length in (0, 1, 31, 32, 33, 100):
+            self.assertSameEncoding(paymaster, "approvalBased", (self.address, 1, os.urandom(length)))
+            self.assertSameEncoding(paymaster, "general", (os.urandom(length),))
+
+    def test_random_arguments(self):
+        rng = random.Random(1)
+        encoder = BaseContractEncoder(self.web3, TEST_ABI)
+        for _ in range(200):
+            args = (rng.randrange(256),
+                    rng.randrange(-2 ** 127, 2 ** 127),
+                    rng.random() < 0.5,
+                    os.urandom(4),
+                    "".join(rng.choice("abcdé€") for _ in range(rng.randrange(40))),
+                    os.urandom(rng.randrange(70)),
+                    AsyncWeb3.to_checksum_address("0x" + os.urandom(20).hex()))
+            self.assertSameEncoding(encoder, "mixed", args)
+
+    def test_codec_functions(self):
+        encoder = BaseContractEncoder(self.web3, TEST_ABI)
+        self.assertSameEncoding(encoder, "withArray", ([1, 2, 3],))
+        self.assertSameEncoding(encoder, "withTuple", ((1, self.address),))
+
+    def test_normalized_arguments_fall_back(self):
+        encoder = BaseContractEncoder(self.web3, TEST_ABI)
+        self.assertSameEncoding(encoder, "withTuple", ({"x": 1, "y": self.address},))
+        self.assertSameEncoding(AsyncPaymasterFlowEncoder(self.web3), "general", ("0x1234",))
+        with self.assertRaises(Web3ValidationError):
+            encoder.encode_method("mixed", (1, 1, True, b'\x01', "", b'', self.address))
+
+    def test_invalid_arguments_rejected_by_web3(self):
+        encoder = ERC20Encoder(self.web3)
+        with self.assertRaises(InvalidAddress):
+            encoder.encode_method("transfer", (self.address.lower(), 1))
+        with self.assertRaises(Web3ValidationError):
+            encoder.encode_method("transfer", (self.address, -1))
+
+    def test_invalid_array_address_rejected_by_web3(self):
+        encoder = BaseContractEncoder(self.web3, TEST_ABI)
+        self.assertSameEncoding(encoder, "withAddresses", ([self.address, self.address],))
+        with self.assertRaises(InvalidAddress):
+            encoder.encode_method("withAddresses", ([self.address, self.address.lower()],))
+        with self.assertRaises(InvalidAddress):
+            encoder.encode_method("withTuple", ((1, self.address.lower()),))
+
+    def test_without_validation(self):
+        encoder = ERC20Encoder(self.web3)
+        encoder.validate = False
+        self.assertSameEncoding(encoder, "transfer", (self.address, 10 ** 18))
+
+    def test_compiled_disabled(self):
+        encoder = ERC20Encoder(self.web3)
+        encoder.compiled = False
+        self.assertSameEncoding(encoder, "transfer", (self.address, 1))
@@ -0,0 +1,63 @@
+import gc
+from unittest import TestCase
+
+from eth_account import Account
+
+from zksync2_async.manage_contracts.erc20_contract import AsyncERC20Contract
+from zksync2_async.manage_contracts.l1_bridge import AsyncL1Bridge
+from zksync2_async.module.contract_cache import ContractWrapperCache
+from zksync2_async.module.zksync_provider import AsyncZkSyncProvider
+from zksync2_async.module.zksync_web3 import AsyncZkSyncWeb3
+from zksync2_async.provider.provider import AsyncEthereumProvider
+
+
+class Wrapper:
+    pass
+
+
+class ContractWrapperCacheTests(TestCase):
+
+    def test_get_or_create(self):
+        cache = ContractWrapperCache()
+        first = cache.get_or_create("a", Wrapper)
+        self.assertIs(first, cache.get_or_create("a", Wrapper))
+        self.assertIsNot(first, cache.get_or_create("b", Wrapper))
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(2, cache.misses)
+
+    def test_lru_eviction(self):
+        cache = ContractWrapperCache(max_size=2)
+        cache.get_or_create("a", Wrapper)
+        cache.get_or_create("b", Wrapper)
+        cache.get_or_create("c", Wrapper)
+        gc.collect()
+        self.assertEqual(2, len(cache))
+        cache.get_or_create("a", Wrapper)
+        self.assertEqual(4, cache.misses)
+
+    def test_referenced_wrapper_survives_eviction(self):
+        cache = ContractWrapperCache(max_size=1)
+        kept = cache.get_or_create("a", Wrapper)
+        cache.get_or_create("b", Wrapper)
+        self.assertIs(kept, cache.get_or_create("a", Wrapper))
+
+
+class ProviderWrapperReuseTests(TestCase):
+
+    def setUp(self) -> None:
+        self.web3 = AsyncZkSyncWeb3(AsyncZkSyncProvider("http://127.0.0.1:3050"))
+        self.provider = AsyncEthereumProvider(self.web3, Account.create())
+
+    def test_shared_wrappers(self):
+        token = "0x" + "11" * 20
+        erc20 = self.provider._erc20(token)
+        self.assertIsInstance(erc20, AsyncERC20Contract)
+        self.assertIs(erc20, self.provider._erc20(token.upper().replace("0X", "0x")))
+        bridge = self.provider._l1_bridge_at("0x" + "22" * 20)
+        self.assertIsInstance(bridge, AsyncL1Bridge)
+        self.assertIs(bridge, self.provider._l1_bridge_at("0x" + "22" * 20))
+
+    def test_accounts_not_shared(self):
+        token = "0x" + "11" * 20
+        other = AsyncEthereumProvider(self.web3, Account.create())
+        self.assertIsNot(self.provider._erc20(token), other._erc20(token))
@@ -0,0 +1,96 @@
+from unittest import IsolatedAsyncioTestCase
+
+from hexbytes import HexBytes
+
+from zksync2_async.core.request_types import EIP712Meta
+from zksync2_async.core.types import Fee, PaymasterParams
+from zksync2_async.module.estimate_cache import GasEstimateCache, estimate_key
+from zksync2_async.transaction.transaction_builders import TxFunctionCall
+
+TOKEN = "0x" + "aa" * 20
+SENDER = "0x" + "11" * 20
+TRANSFER = "0xa9059cbb" + "00" * 64
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def transfer_tx(data: str = TRANSFER, paymaster: str = None) -> dict:
+    tx = TxFunctionCall(chain_id=280, nonce=0, from_=SENDER, to=TOKEN, data=data).tx
+    if paymaster is not None:
+        tx["eip712Meta"] = EIP712Meta(paymaster_params=PaymasterParams(paymaster=paymaster, paymaster_input=b''))
+    return tx
+
+
+class TestGasEstimateCache(IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.estimates = 0
+
+    async def fetch(self):
+        self.estimates += 1
+        return 1000
+
+    async def test_shape_key(self):
+        self.assertEqual(estimate_key(transfer_tx()), estimate_key(transfer_tx(TRANSFER[:-2] + "01")))
+        self.assertNotEqual(estimate_key(transfer_tx()), estimate_key(transfer_tx("0x095ea7b3" + "00" * 64)))
+        self.assertNotEqual(estimate_key(transfer_tx()), estimate_key(transfer_tx(TRANSFER + "00" * 64)))
+        self.assertNotEqual(estimate_key(transfer_tx()), estimate_key(transfer_tx(paymaster="0x" + "22" * 20)))
+
+    async def test_margin_and_ttl(self):
+        clock = FakeClock()
+        cache = GasEstimateCache(margin=0.1, ttl=10, clock=clock)
+        self.assertEqual(1100, await cache.estimate("eth_estimateGas", transfer_tx(), self.fetch))
+        self.assertEqual(1100, await cache.estimate("eth_estimateGas", transfer_tx(TRANSFER[:-2] + "05"), self.fetch))
+        self.assertEqual(1, self.estimates)
+        clock.now = 11
+        await cache.estimate("eth_estimateGas", transfer_tx(), self.fetch)
+        self.assertEqual(2, self.estimates)
+
+    async def test_fee_margin(self):
+        cache = GasEstimateCache(margin=0.5)
+
+        async def fetch_fee():
+            return Fee(gas_limit=100, max_fee_per_gas=7)
+
+        async def prices():
+            return 9, 1
+
+        fee = await cache.estimate("zks_estimateFee", transfer_tx(), fetch_fee, prices)
+        self.assertEqual(150, fee.gas_limit)
+        self.assertEqual(7, fee.max_fee_per_gas)
+
+        fee = await cache.estimate("zks_estimateFee", transfer_tx(), fetch_fee, prices)
+        self.assertEqual(150, fee.gas_limit)
+        self.assertEqual(9, fee.max_fee_per_gas)
+        self.assertEqual(1, fee.max_priority_fee_per_gas)
+
+    async def test_fee_without_prices_not_cached(self):
+        cache = GasEstimateCache()
+
+        async def fetch_fee():
+            self.estimates += 1
+            return Fee(gas_limit=100, max_fee_per_gas=7)
+
+        await cache.estimate("zks_estimateFee", transfer_tx(), fetch_fee)
+        await cache.estimate("zks_estimateFee", transfer_tx(), fetch_fee)
+        self.assertEqual(2, self.estimates)
+
+    async def test_reverted_receipt_invalidates(self):
+        cache = GasEstimateCache()
+        await cache.estimate("eth_estimateGas", transfer_tx(), self.fetch)
+        cache.track(HexBytes("0x01"), transfer_tx())
+        cache.track(HexBytes("0x02"), transfer_tx())
+        cache.observe({"transactionHash": HexBytes("0x01"), "status": 1})
+        await cache.estimate("eth_estimateGas", transfer_tx(), self.fetch)
+        self.assertEqual(1, self.estimates)
+
+        cache.observe({"transactionHash": HexBytes("0x02"), "status": 0})
+        self.assertEqual(1, cache.invalidations)
+        await cache.estimate("eth_estimateGas", transfer_tx(), self.fetch)
+        self.assertEqual(2, self.estimates)
@@ -1,10 +1,14 @@
+import warnings
 from unittest import TestCase
 from eth_typing import HexStr
 from zksync2_async.signer import PrivateKeyEthSigner
+from zksync2_async.signer.eth_signer import EthSignerBase
 from eth_account.signers.local import LocalAccount
 from eth_account import Account
 from eip712_structs import make_domain, EIP712Struct, String, Address
 from eth_utils.crypto import keccak_256
+from zksync2_async.core.request_types import EIP712Meta
+from zksync2_async.transaction.transaction712 import Transaction712
 
 
 class Person(EIP712Struct):
@@ -29,6 +33,17 @@ def make_mail(from_, to, content) -> Mail:
     return Mail(**kwargs)
 
 
+class TypedDataOnlySigner(EthSignerBase):
+    def __init__(self, signer: PrivateKeyEthSigner):
+        self.signer = signer
+
+    def sign_typed_data(self, typed_data: EIP712Struct, domain=None):
+        return self.signer.sign_typed_data(typed_data, domain)
+
+    def verify_typed_data(self, sig: HexStr, typed_data: EIP712Struct) -> bool:
+        return self.signer.verify_typed_data(sig, typed_data)
+
+
 class TestEthSigner(TestCase):
     _TEST_TYPED_EXPECTED_SIGNATURE = HexStr("0x4355c47d63924e8a72e509b65029052eb6c299d53a04e167c5775fd466751"
                                             "c9d07299936d304c153f6443dfa05f40ff007d72911b6f72307f996231605b915621c")
@@ -53,3 +68,43 @@ class TestEthSigner(TestCase):
     def test_verify_signed_typed_data(self):
         ret = self.signer.verify_typed_data(self._TEST_TYPED_EXPECTED_SIGNATURE, self.mail, self.domain)
         self.assertTrue(ret)
+
+    def _tx712(self, nonce: int) -> Transaction712:
+        return Transaction712(chain_id=1,
+                              nonce=nonce,
+                              gas_limit=54321,
+                              to=HexStr("0xCcCCccccCCCCcCCCCCCcCcCccCcCCCcCcccccccC"),
+                              value=0,
+                              data=HexStr("0x7cf5dab0"),
+                              maxPriorityFeePerGas=0,
+                              maxFeePerGas=250000000,
+                              from_=self.account.address,
+                              meta=EIP712Meta())
+
+    def test_sign_transaction712(self):
+        tx = self._tx712(0)
+        expected = self.signer.sign_typed_data(tx.to_eip712_struct())
+        self.assertEqual(expected.signature, self.signer.sign_transaction712(tx).signature)
+
+    def test_sign_transaction712_default(self):
+        tx = self._tx712(0)
+        signer = TypedDataOnlySigner(self.signer)
+        self.assertEqual(self.signer.sign_transaction712(tx).signature, signer.sign_transaction712(tx).signature)
+        with self.assertRaises(NotImplementedError):
+            signer.sign_digest(keccak_256(b"digest"))
+
+    def test_sign_many(self):
+        txs = [self._tx712(nonce) for nonce in range(4)]
+        expected = [self.signer.sign_typed_data(tx.to_eip712_struct()).signature for tx in txs]
+        self.assertEqual(expected, [sm.signature for sm in self.signer.sign_many(txs)])
+
+    def test_sign_digest_matches_account(self):
+        digest = keccak_256(b"digest")
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            signed = self.signer.sign_digest(digest)
+        expected = self.account.signHash(digest)
+        self.assertEqual(expected.signature, signed.signature)
+        self.assertEqual((expected.v, expected.r, expected.s), (signed.v, signed.r, signed.s))
+        other = PrivateKeyEthSigner(Account.from_key(keccak_256(b"other")), 1)
+        self.assertFalse(other.verify_typed_data(self._TEST_TYPED_EXPECTED_SIGNATURE, self.mail, self.domain))
@@ -0,0 +1,166 @@
+import asyncio
+import gc
+import weakref
+from unittest import IsolatedAsyncioTestCase
+
+from zksync2_async.core.types import Fee
+from zksync2_async.module.fee_oracle import AsyncFeeOracle, PercentileStrategy, suggested_gas_price, fee_oracle
+
+
+class FakeManager:
+    def __init__(self, prices):
+        self.prices = list(prices)
+        self.calls = 0
+
+    async def coro_request(self, method, params):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return hex(self.prices.pop(0))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeWeb3:
+    def __init__(self, prices):
+        self.manager = FakeManager(prices)
+
+
+class FakeEth:
+    def __init__(self, prices, node_price: int = 0):
+        self.w3 = FakeWeb3(prices)
+        self.node_price = node_price
+        self.estimates = 0
+
+    @property
+    async def gas_price(self):
+        return self.node_price
+
+    async def _zks_estimate_fee(self, tx):
+        self.estimates += 1
+        return Fee(gas_limit=1, max_fee_per_gas=self.estimates * 100)
+
+
+class TestFeeOracle(IsolatedAsyncioTestCase):
+
+    async def test_percentiles(self):
+        l2 = FakeEth(range(1, 11))
+        oracle = AsyncFeeOracle(l2, window=10)
+        for _ in range(10):
+            await oracle.sample()
+        self.assertEqual(10, l2.w3.manager.calls)
+        self.assertEqual(9, await oracle.gas_price("fast"))
+        self.assertEqual(5, await oracle.gas_price())
+        self.assertEqual(1, await oracle.gas_price("cheap"))
+        self.assertEqual(20, await oracle.gas_price(PercentileStrategy(100, multiplier=2)))
+        self.assertEqual(10, l2.w3.manager.calls)
+        with self.assertRaises(ValueError):
+            await oracle.gas_price("instant")
+
+    async def test_rolling_window(self):
+        oracle = AsyncFeeOracle(FakeEth([100, 1, 2, 3]), window=3)
+        for _ in range(4):
+            await oracle.sample()
+        self.assertEqual(3, await oracle.gas_price("fast"))
+
+    async def test_first_suggestion_samples(self):
+        oracle = AsyncFeeOracle(FakeEth([7]))
+        self.assertEqual(7, await oracle.gas_price())
+
+    async def test_l1_and_estimates(self):
+        l2 = FakeEth([5, 5])
+        l1 = FakeEth([30, 40])
+        oracle = AsyncFeeOracle(l2, l1_module=l1, estimate_tx={"to": "0x"})
+        await oracle.sample()
+        await oracle.sample()
+        self.assertEqual(40, await oracle.l1_gas_price("fast"))
+        self.assertEqual(200, await oracle.max_fee_per_gas("fast"))
+
+    async def test_suggested_gas_price(self):
+        l2 = FakeEth([5], node_price=1)
+        l1 = FakeEth([30], node_price=2)
+        self.assertEqual(1, await suggested_gas_price(l2))
+        oracle = AsyncFeeOracle(l2, l1_module=l1)
+        oracle.attach()
+        self.assertIs(oracle, fee_oracle(l2))
+        self.assertEqual(5, await suggested_gas_price(l2))
+        self.assertEqual(30, await suggested_gas_price(l1))
+        oracle.detach()
+        self.assertEqual(2, await suggested_gas_price(l1))
+
+    async def test_stale_samples_dropped(self):
+        clock = FakeClock()
+        l2 = FakeEth([100, 7])
+        oracle = AsyncFeeOracle(l2, max_sample_age=10, clock=clock)
+        await oracle.sample()
+        clock.now = 11
+        self.assertEqual(7, await oracle.gas_price())
+        self.assertEqual(2, l2.w3.manager.calls)
+
+    async def test_send_price_not_below_latest(self):
+        l2 = FakeEth([1, 2, 3, 4, 10])
+        oracle = AsyncFeeOracle(l2)
+        for _ in range(5):
+            await oracle.sample()
+        self.assertEqual(3, await oracle.gas_price())
+        oracle.attach()
+        self.assertEqual(10, await suggested_gas_price(l2))
+        oracle.detach()
+
+    async def test_failing_source_keeps_others(self):
+        l2 = FakeEth([5, 6])
+        oracle = AsyncFeeOracle(l2, l1_module=FakeEth([]), estimate_tx={"to": "0x"})
+        with self.assertLogs("FeeOracle", level="WARNING"):
+            await oracle.sample()
+        self.assertEqual(5, await oracle.gas_price())
+        self.assertEqual(100, await oracle.max_fee_per_gas())
+        with self.assertRaises(RuntimeError):
+            await oracle.l1_gas_price()
+
+    async def test_cheap_price_below_latest(self):
+        l2 = FakeEth([1, 2, 3, 4, 10])
+        oracle = AsyncFeeOracle(l2, strategy="cheap")
+        for _ in range(5):
+            await oracle.sample()
+        oracle.attach()
+        self.assertEqual(1, await suggested_gas_price(l2, at_least_latest=False))
+        self.assertEqual(10, await suggested_gas_price(l2))
+        oracle.detach()
+
+    async def test_attached_oracle_freed_with_module(self):
+        l2 = FakeEth([1])
+        AsyncFeeOracle(l2).attach()
+        module = weakref.ref(l2)
+        del l2
+        gc.collect()
+        self.assertIsNone(module())
+
+    async def test_failing_oracle_falls_back_to_node(self):
+        l2 = FakeEth([], node_price=4)
+        oracle = AsyncFeeOracle(l2)
+        oracle.attach()
+        self.assertEqual(4, await suggested_gas_price(l2))
+        oracle.detach()
+
+    async def test_concurrent_first_calls_sample_once(self):
+        l2 = FakeEth([7, 8])
+        oracle = AsyncFeeOracle(l2)
+        self.assertEqual([7] * 5, await asyncio.gather(*[oracle.gas_price() for _ in range(5)]))
+        self.assertEqual(1, l2.w3.manager.calls)
+
+    async def test_default_strategy_and_stop(self):
+        oracle = AsyncFeeOracle(FakeEth([5] * 10), strategy=None, sample_interval=0.01)
+        self.assertIs(oracle.strategy, oracle._strategy("normal"))
+        self.assertTrue(oracle.configured_as(None, 0.01, 60, "normal", None))
+        self.assertFalse(oracle.configured_as(None, 0.01, 60, "fast", None))
+        oracle.start()
+        task = oracle._task
+        await asyncio.sleep(0.02)
+        await oracle.stop()
+        self.assertTrue(task.done())
+        self.assertFalse(oracle.running)
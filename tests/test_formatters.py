@@ -0,0 +1,67 @@
+import gc
+import weakref
+from unittest import TestCase
+
+from web3._utils.rpc_abi import RPC
+
+from zksync2_async.core.request_types import EIP712Meta
+from zksync2_async.core.types import PaymasterParams
+from zksync2_async.utils.formatters import meta_formatter, meta_bytes_formatter, bytes_to_hex, \
+    zksync_get_request_formatters, zksync_get_result_formatters, zksync_transaction_munger
+from zksync2_async.utils.rpc_endpoints import eth_estimate_gas_rpc, zks_estimate_fee_rpc, \
+    zks_get_all_account_balances_rpc
+
+
+class FakeModule:
+    meta_bytes_encoding = "list"
+
+
+class TestFormatters(TestCase):
+
+    def meta(self) -> EIP712Meta:
+        return EIP712Meta(factory_deps=[b'\x01\x02\xff'],
+                          paymaster_params=PaymasterParams(paymaster="0x" + "11" * 20,
+                                                           paymaster_input=b'\x0a\x0b'))
+
+    def test_request_formatters_memoized(self):
+        self.assertIs(zksync_get_request_formatters(eth_estimate_gas_rpc),
+                      zksync_get_request_formatters(eth_estimate_gas_rpc))
+        self.assertIsNot(zksync_get_request_formatters(eth_estimate_gas_rpc),
+                         zksync_get_request_formatters(zks_estimate_fee_rpc))
+
+    def test_result_formatters_memoized_per_module(self):
+        module = FakeModule()
+        formatter = zksync_get_result_formatters(zks_get_all_account_balances_rpc, module)
+        self.assertIs(formatter, zksync_get_result_formatters(zks_get_all_account_balances_rpc, module))
+        self.assertEqual({"0x01": 16}, formatter({"0x01": "0x10"}))
+
+    def test_result_formatters_freed_with_module(self):
+        module = FakeModule()
+        zksync_get_result_formatters(RPC.eth_newFilter, module)
+        ref = weakref.ref(module)
+        del module
+        gc.collect()
+        self.assertIsNone(ref())
+
+    def test_meta_bytes_as_list(self):
+        ret = meta_formatter(self.meta())
+        self.assertEqual([[1, 2, 255]], ret["factoryDeps"])
+        self.assertEqual([10, 11], ret["paymasterParams"]["paymasterInput"])
+
+    def test_meta_bytes_as_hex(self):
+        ret = meta_formatter(self.meta(), bytes_to_hex)
+        self.assertEqual(["0x0102ff"], ret["factoryDeps"])
+        self.assertEqual("0x0a0b", ret["paymasterParams"]["paymasterInput"])
+        with self.assertRaises(ValueError):
+            meta_bytes_formatter("base64")
+
+    def test_meta_encoding_per_module(self):
+        tx = {"to": "0x" + "22" * 20, "eip712Meta": self.meta()}
+        hex_module = FakeModule()
+        hex_module.meta_bytes_encoding = "hex"
+        [formatted] = zksync_transaction_munger(hex_module, tx)
+        self.assertEqual(["0x0102ff"], zksync_get_request_formatters(zks_estimate_fee_rpc)([formatted])[0]
+                         ["eip712Meta"]["factoryDeps"])
+        [unchanged] = zksync_transaction_munger(FakeModule(), tx)
+        self.assertEqual([[1, 2, 255]], zksync_get_request_formatters(zks_estimate_fee_rpc)([unchanged])[0]
+                         ["eip712Meta"]["factoryDeps"])
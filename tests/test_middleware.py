@@ -0,0 +1,55 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from web3.types import RPCEndpoint
+
+from zksync2_async.module.middleware import zksync_construct_async_middleware
+
+
+class FakeProvider:
+    def __init__(self):
+        self.requests = []
+
+    async def make_request(self, method, params):
+        self.requests.append((method, params))
+        await asyncio.sleep(0.01)
+        return {"jsonrpc": "2.0", "id": len(self.requests), "result": method}
+
+
+class TestCoalescingMiddleware(IsolatedAsyncioTestCase):
+
+    async def _middleware(self, provider, **kwargs):
+        construct = await zksync_construct_async_middleware(provider, **kwargs)
+        return await construct(None, None)
+
+    async def test_identical_reads_merged(self):
+        provider = FakeProvider()
+        middleware = await self._middleware(provider, coalesce=True)
+        responses = await asyncio.gather(*[middleware(RPCEndpoint("eth_chainId"), []) for _ in range(200)])
+        self.assertEqual(1, len(provider.requests))
+        self.assertTrue(all(r["result"] == "eth_chainId" for r in responses))
+
+    async def test_different_params_not_merged(self):
+        provider = FakeProvider()
+        middleware = await self._middleware(provider, coalesce=True)
+        await asyncio.gather(middleware(RPCEndpoint("eth_getBalance"), ["0x01", "latest"]),
+                             middleware(RPCEndpoint("eth_getBalance"), ["0x02", "latest"]))
+        self.assertEqual(2, len(provider.requests))
+
+    async def test_sends_not_merged(self):
+        provider = FakeProvider()
+        middleware = await self._middleware(provider, coalesce=True)
+        await asyncio.gather(*[middleware(RPCEndpoint("eth_sendRawTransaction"), ["0x00"]) for _ in range(3)])
+        self.assertEqual(3, len(provider.requests))
+
+    async def test_disabled_by_default(self):
+        provider = FakeProvider()
+        middleware = await self._middleware(provider)
+        await asyncio.gather(*[middleware(RPCEndpoint("eth_chainId"), []) for _ in range(3)])
+        self.assertEqual(3, len(provider.requests))
+
+    async def test_send_in_allow_list_rejected(self):
+        with self.assertRaises(ValueError):
+            await zksync_construct_async_middleware(FakeProvider(),
+                                                    coalesce=True,
+                                                    coalesced_methods=["eth_chainId", "eth_sendRawTransaction"])
@@ -0,0 +1,110 @@
+from unittest import IsolatedAsyncioTestCase
+
+from eth_utils import function_abi_to_4byte_selector
+from web3 import AsyncWeb3
+
+from zksync2_async.manage_contracts.compiled_encoder import CompiledFunction
+from zksync2_async.manage_contracts.erc20_contract import AsyncERC20Contract
+from zksync2_async.manage_contracts.multicall import AsyncMulticall, MULTICALL3_ADDRESS, call_of
+from zksync2_async.utils.abi import contract_abi, ERC20_ABI, MULTICALL3_ABI
+
+TOKEN_A = AsyncWeb3.to_checksum_address("0x" + "aa" * 20)
+TOKEN_B = AsyncWeb3.to_checksum_address("0x" + "bb" * 20)
+BROKEN_TOKEN = AsyncWeb3.to_checksum_address("0x" + "cc" * 20)
+ALICE = AsyncWeb3.to_checksum_address("0x" + "01" * 20)
+BOB = AsyncWeb3.to_checksum_address("0x" + "02" * 20)
+
+
+class FakeChain:
+    """
+    eth_call of ERC20 tokens with balance = token byte * 1000 + account byte
+    and of Multicall3 aggregate3 over them.
+    """
+
+    def __init__(self):
+        self.codec = AsyncWeb3().codec
+        self.w3 = object()
+        self.calls = []
+        self.balance_of = contract_abi(ERC20_ABI).selector("balanceOf")
+        self.allowance = contract_abi(ERC20_ABI).selector("allowance")
+        self.aggregate3 = function_abi_to_4byte_selector(contract_abi(MULTICALL3_ABI).functions["aggregate3"][0])
+
+    def _token_call(self, to: str, data: bytes) -> bytes:
+        if to.lower() == BROKEN_TOKEN.lower():
+            raise ValueError("execution reverted")
+        token_byte = int(to[2:4], 16)
+        if data[:4] == self.balance_of:
+            (account,) = self.codec.decode(["address"], data[4:])
+            return self.codec.encode(["uint256"], [token_byte * 1000 + int(account[2:4], 16)])
+        if data[:4] == self.allowance:
+            owner, spender = self.codec.decode(["address", "address"], data[4:])
+            return self.codec.encode(["uint256"], [int(owner[2:4], 16) * 10 + int(spender[2:4], 16)])
+        raise ValueError("unknown selector")
+
+    async def call(self, tx, block_identifier="latest"):
+        self.calls.append(tx)
+        data = bytes.fromhex(tx["data"][2:])
+        if tx["to"] != MULTICALL3_ADDRESS:
+            return self._token_call(tx["to"], data)
+        if data[:4] != self.aggregate3:
+            raise ValueError("not aggregate3")
+        (calls,) = self.codec.decode(["(address,bool,bytes)[]"], data[4:])
+        results = []
+        for target, allow_failure, call_data in calls:
+            try:
+                results.append((True, self._token_call(target, call_data)))
+            except ValueError:
+                if not allow_failure:
+                    raise
+                results.append((False, b''))
+        return self.codec.encode(["(bool,bytes)[]"], [results])
+
+
+class TestMulticall(IsolatedAsyncioTestCase):
+
+    async def test_balances_through_multicall(self):
+        chain = FakeChain()
+        balances = await AsyncERC20Contract.balances_of_many(chain, [TOKEN_A, TOKEN_B], [ALICE, BOB],
+                                                             multicall_address=MULTICALL3_ADDRESS)
+        self.assertEqual(1, len(chain.calls))
+        self.assertEqual(0xaa * 1000 + 1, balances[(TOKEN_A, ALICE)])
+        self.assertEqual(0xbb * 1000 + 2, balances[(TOKEN_B, BOB)])
+        self.assertEqual(4, len(balances))
+
+    async def test_balances_of_generators(self):
+        chain = FakeChain()
+        balances = await AsyncERC20Contract.balances_of_many(chain,
+                                                             (token for token in [TOKEN_A, TOKEN_B]),
+                                                             (account for account in [ALICE, BOB]),
+                                                             multicall_address=MULTICALL3_ADDRESS)
+        self.assertEqual(4, len(balances))
+        self.assertEqual(0xbb * 1000 + 2, balances[(TOKEN_B, BOB)])
+
+    async def test_balances_without_multicall(self):
+        chain = FakeChain()
+        balances = await AsyncERC20Contract.balances_of_many(chain, [TOKEN_A, TOKEN_B], [ALICE])
+        self.assertEqual(2, len(chain.calls))
+        self.assertEqual({(TOKEN_A, ALICE): 0xaa * 1000 + 1, (TOKEN_B, ALICE): 0xbb * 1000 + 1}, balances)
+
+    async def test_failed_call_gives_none(self):
+        for address in (MULTICALL3_ADDRESS, None):
+            chain = FakeChain()
+            balances = await AsyncERC20Contract.balances_of_many(chain, [TOKEN_A, BROKEN_TOKEN], [ALICE],
+                                                                 multicall_address=address)
+            self.assertIsNone(balances[(BROKEN_TOKEN, ALICE)])
+            self.assertEqual(0xaa * 1000 + 1, balances[(TOKEN_A, ALICE)])
+
+    async def test_allowances(self):
+        chain = FakeChain()
+        allowances = await AsyncERC20Contract.allowances_of_many(chain, [(TOKEN_A, ALICE, BOB)],
+                                                                 multicall_address=MULTICALL3_ADDRESS)
+        self.assertEqual({(TOKEN_A, ALICE, BOB): 12}, allowances)
+
+    async def test_chunks(self):
+        chain = FakeChain()
+        multicall = AsyncMulticall(chain, MULTICALL3_ADDRESS, max_calls=3)
+        balance_of = CompiledFunction(contract_abi(ERC20_ABI).functions["balanceOf"][0])
+        calls = [call_of(chain.codec, TOKEN_A, balance_of, (ALICE,)) for _ in range(7)]
+        self.assertEqual([0xaa * 1000 + 1] * 7, await multicall.aggregate(calls))
+        self.assertEqual(3, len(chain.calls))
+        self.assertEqual([], await multicall.aggregate([]))
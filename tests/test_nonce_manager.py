@@ -0,0 +1,127 @@
+import asyncio
+import gc
+import weakref
+from unittest import IsolatedAsyncioTestCase
+
+from eth_typing import HexStr
+
+from zksync2_async.transaction.nonce_manager import AsyncNonceManager, nonce_manager, is_nonce_error
+
+
+class FakeEth:
+    def __init__(self, nonce: int):
+        self.nonce = nonce
+        self.calls = 0
+
+    async def get_transaction_count(self, address, block_identifier=None):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.nonce
+
+
+class TestNonceManager(IsolatedAsyncioTestCase):
+    ADDRESS = HexStr("0x1234512345123451234512345123451234512345")
+
+    async def test_concurrent_allocation_queries_node_once(self):
+        eth = FakeEth(7)
+        manager = AsyncNonceManager(eth, self.ADDRESS)
+        nonces = await asyncio.gather(*[manager.next_nonce() for _ in range(100)])
+        self.assertEqual(list(range(7, 107)), sorted(nonces))
+        self.assertEqual(1, eth.calls)
+
+    async def test_resync_on_nonce_error(self):
+        eth = FakeEth(3)
+        manager = AsyncNonceManager(eth, self.ADDRESS)
+        self.assertEqual(3, await manager.next_nonce())
+        eth.nonce = 10
+        with self.assertRaises(ValueError):
+            async with manager.reserve():
+                raise ValueError("nonce too low. allowed nonce range: 10 - 20, actual: 4")
+        self.assertEqual(10, await manager.next_nonce())
+
+    async def test_release_unused_nonce(self):
+        eth = FakeEth(0)
+        manager = AsyncNonceManager(eth, self.ADDRESS)
+        with self.assertRaises(RuntimeError):
+            async with manager.reserve():
+                raise RuntimeError("estimate failed")
+        self.assertEqual(0, await manager.next_nonce())
+        self.assertEqual(1, eth.calls)
+
+    async def test_release_out_of_order_reuses_gap(self):
+        eth = FakeEth(0)
+        manager = AsyncNonceManager(eth, self.ADDRESS)
+        first_reserved = asyncio.Event()
+        second_sent = asyncio.Event()
+
+        async def failing():
+            async with manager.reserve() as nonce:
+                first_reserved.set()
+                await second_sent.wait()
+                raise RuntimeError(f"sign of {nonce} failed")
+
+        async def sending():
+            await first_reserved.wait()
+            async with manager.reserve() as nonce:
+                second_sent.set()
+                return nonce
+
+        results = await asyncio.gather(failing(), sending(), return_exceptions=True)
+        self.assertIsInstance(results[0], RuntimeError)
+        self.assertEqual(1, results[1])
+        # INFO: node still reports 0, nonce 1 is in flight and must not be handed out again
+        self.assertEqual(0, await manager.peek())
+        self.assertEqual([0, 2], [await manager.next_nonce(), await manager.next_nonce()])
+        self.assertEqual(1, eth.calls)
+
+    async def test_release_compacts_counter(self):
+        manager = AsyncNonceManager(FakeEth(0), self.ADDRESS)
+        nonces = [await manager.next_nonce() for _ in range(3)]
+        await manager.release(nonces[1])
+        await manager.release(nonces[2])
+        self.assertEqual(1, await manager.next_nonce())
+        self.assertEqual(2, await manager.next_nonce())
+
+    async def test_resync_keeps_reserved(self):
+        eth = FakeEth(0)
+        manager = AsyncNonceManager(eth, self.ADDRESS)
+        reserved = asyncio.Event()
+        done = asyncio.Event()
+
+        async def holding():
+            async with manager.reserve() as nonce:
+                reserved.set()
+                await done.wait()
+                return nonce
+
+        holder = asyncio.ensure_future(holding())
+        await reserved.wait()
+        with self.assertRaises(ValueError):
+            async with manager.reserve():
+                raise ValueError("nonce too high")
+        # INFO: node still reports 0, the reserved nonce 0 is not handed out again
+        self.assertEqual(1, await manager.next_nonce())
+        done.set()
+        self.assertEqual(0, await holder)
+
+        eth.nonce = 2
+        with self.assertRaises(ValueError):
+            async with manager.reserve():
+                raise ValueError("nonce too low")
+        self.assertEqual(2, await manager.next_nonce())
+
+    async def test_shared_manager_per_account(self):
+        eth = FakeEth(0)
+        self.assertIs(nonce_manager(eth, self.ADDRESS), nonce_manager(eth, HexStr(self.ADDRESS.upper())))
+
+    async def test_shared_manager_freed_with_module(self):
+        eth = FakeEth(0)
+        nonce_manager(eth, self.ADDRESS)
+        module = weakref.ref(eth)
+        del eth
+        gc.collect()
+        self.assertIsNone(module())
+
+    def test_is_nonce_error(self):
+        self.assertTrue(is_nonce_error(ValueError({"message": "nonce too high"})))
+        self.assertFalse(is_nonce_error(ValueError("execution reverted")))
@@ -0,0 +1,70 @@
+import asyncio
+import random
+from itertools import islice
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from web3.exceptions import TimeExhausted
+
+from zksync2_async.module.polling import FixedPolling, ExponentialBackoffPolling, BlockTimePolling, \
+    as_polling_policy
+from zksync2_async.module.zksync_module import AsyncZkSyncModule
+
+
+class PollingTests(TestCase):
+
+    def test_fixed_polling(self):
+        policy = FixedPolling(0.5)
+        self.assertEqual([0.5, 0.5, 0.5], list(islice(policy.delays(), 3)))
+
+    def test_exponential_backoff_capped(self):
+        policy = ExponentialBackoffPolling(initial=0.1, factor=2.0, max_delay=0.5, jitter=0)
+        self.assertEqual([0.1, 0.2, 0.4, 0.5, 0.5], list(islice(policy.delays(), 5)))
+
+    def test_exponential_backoff_jitter_bounds(self):
+        policy = ExponentialBackoffPolling(initial=1.0, factor=1.0, max_delay=1.0, jitter=0.2,
+                                           rng=random.Random(7))
+        for delay in islice(policy.delays(), 100):
+            self.assertTrue(0.8 <= delay <= 1.2)
+
+    def test_block_time_polling(self):
+        policy = BlockTimePolling(block_time=1.0, initial=0.2, jitter=0)
+        self.assertEqual([0.2, 0.4, 0.8, 1.0, 1.0], list(islice(policy.delays(), 5)))
+
+    def test_as_polling_policy(self):
+        policy = BlockTimePolling()
+        self.assertIs(policy, as_polling_policy(policy))
+        self.assertIsInstance(as_polling_policy(0.1), FixedPolling)
+
+    def test_wait_for_receipt_metrics(self):
+        receipts = [None, None, {"blockHash": b'\x01'}]
+
+        async def get_transaction_receipt(_):
+            return receipts.pop(0)
+
+        module = MagicMock()
+        module.receipt_watcher = None
+        module.get_transaction_receipt = get_transaction_receipt
+        policy = FixedPolling(0)
+
+        receipt = asyncio.run(AsyncZkSyncModule.wait_for_transaction_receipt(module, b'\x02', poll_latency=policy))
+        self.assertEqual({"blockHash": b'\x01'}, receipt)
+        self.assertEqual(3, policy.metrics.polls)
+        self.assertEqual(1, policy.metrics.resolved)
+        self.assertEqual(3.0, policy.metrics.polls_per_resolved)
+
+    def test_wait_for_receipt_timeout_metrics(self):
+        async def get_transaction_receipt(_):
+            return None
+
+        module = MagicMock()
+        module.receipt_watcher = None
+        module.get_transaction_receipt = get_transaction_receipt
+        policy = FixedPolling(0.01)
+
+        with self.assertRaises(TimeExhausted):
+            asyncio.run(AsyncZkSyncModule.wait_for_transaction_receipt(module, b'\x02',
+                                                                       timeout=0.05,
+                                                                       poll_latency=policy))
+        self.assertEqual(1, policy.metrics.timeouts)
+        self.assertGreater(policy.metrics.polls, 0)
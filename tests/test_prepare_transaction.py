@@ -0,0 +1,88 @@
+import json
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from zksync2_async.core.request_types import EIP712Meta
+from zksync2_async.module.module_builder import AsyncZkSyncBuilder
+from zksync2_async.module.zksync_provider import AsyncZkSyncProvider
+from zksync2_async.transaction.transaction_builders import TxFunctionCall
+
+SENDER = "0x" + "11" * 20
+RECEIVER = "0x" + "22" * 20
+
+
+class FakeNode:
+    def __init__(self, fail_estimate: bool = False):
+        self.posts = []
+        self.fail_estimate = fail_estimate
+
+    async def post(self, data):
+        request = json.loads(data)
+        self.posts.append(request)
+        if isinstance(request, list):
+            return json.dumps([self._answer(r) for r in request]).encode()
+        return json.dumps(self._answer(request)).encode()
+
+    def _answer(self, r: dict) -> dict:
+        if r["method"] == "zks_estimateFee":
+            if self.fail_estimate:
+                return {"jsonrpc": "2.0", "id": r["id"], "error": {"code": 3, "message": "execution reverted"}}
+            return {"jsonrpc": "2.0", "id": r["id"], "result": {
+                "gas_limit": "0x1000",
+                "max_fee_per_gas": "0x10",
+                "max_priority_fee_per_gas": "0x1",
+                "gas_per_pubdata_limit": "0xc350"}}
+        results = {"eth_chainId": "0x118", "eth_getTransactionCount": "0x7"}
+        return {"jsonrpc": "2.0", "id": r["id"], "result": results[r["method"]]}
+
+
+class TestPrepareTransaction(IsolatedAsyncioTestCase):
+
+    async def build(self, node: FakeNode):
+        self.patcher = patch.object(AsyncZkSyncProvider, "_post", node.post)
+        self.patcher.start()
+        self.addCleanup(self.patcher.stop)
+        return await AsyncZkSyncBuilder.build(AsyncZkSyncProvider("http://127.0.0.1:3050"))
+
+    async def test_one_batch(self):
+        node = FakeNode()
+        web3 = await self.build(node)
+        tx = TxFunctionCall(chain_id=None, nonce=None, from_=SENDER, to=RECEIVER, value=5).tx
+        tx_712 = await web3.zksync.prepare_transaction(tx)
+
+        self.assertEqual(1, len(node.posts))
+        self.assertEqual(["eth_chainId", "eth_getTransactionCount", "zks_estimateFee"],
+                         sorted(r["method"] for r in node.posts[0]))
+        self.assertEqual(280, tx_712.chain_id)
+        self.assertEqual(7, tx_712.nonce)
+        self.assertEqual(0x1000, tx_712.gas_limit)
+        self.assertEqual(0x10, tx_712.maxFeePerGas)
+        self.assertEqual(1, tx_712.maxPriorityFeePerGas)
+        self.assertEqual(5, tx_712.value)
+
+        tx = TxFunctionCall(chain_id=None, nonce=3, from_=SENDER, to=RECEIVER).tx
+        tx_712 = await web3.zksync.prepare_transaction(tx)
+        self.assertEqual(3, tx_712.nonce)
+        self.assertEqual(["zks_estimateFee"], [node.posts[-1]["method"]])
+
+    async def test_failed_estimate_releases_nonce(self):
+        node = FakeNode(fail_estimate=True)
+        web3 = await self.build(node)
+        tx = TxFunctionCall(chain_id=280, nonce=None, from_=SENDER, to=RECEIVER).tx
+        with self.assertRaises(Exception):
+            await web3.zksync.prepare_transaction(tx)
+        self.assertEqual(7, await web3.zksync.nonce_manager(SENDER).peek())
+
+    async def test_meta_bytes_encoding_of_module(self):
+        node = FakeNode()
+        web3 = await self.build(node)
+        tx = TxFunctionCall(chain_id=280, nonce=0, from_=SENDER, to=RECEIVER).tx
+        tx["eip712Meta"] = EIP712Meta(factory_deps=[b'\x01\x02'])
+        await web3.zksync.zks_estimate_fee(tx)
+        self.assertEqual([[1, 2]], node.posts[-1]["params"][0]["eip712Meta"]["factoryDeps"])
+
+        web3.zksync.meta_bytes_encoding = "hex"
+        await web3.zksync.zks_estimate_fee(tx)
+        self.assertEqual(["0x0102"], node.posts[-1]["params"][0]["eip712Meta"]["factoryDeps"])
+        with self.assertRaises(ValueError):
+            web3.zksync.meta_bytes_encoding = "base64"
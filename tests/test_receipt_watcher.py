@@ -0,0 +1,106 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from hexbytes import HexBytes
+from web3.exceptions import TransactionNotFound, TimeExhausted
+
+from zksync2_async.module.receipt_watcher import AsyncReceiptWatcher, websocket_block_source
+
+
+class FakeWeb3:
+    zksync_provider = None
+
+
+class FakeEth:
+    def __init__(self):
+        self.w3 = FakeWeb3()
+        self.block = 0
+        self.mined = dict()
+        self.receipt_calls = 0
+        self.block_calls = 0
+
+    @property
+    async def block_number(self):
+        self.block_calls += 1
+        return self.block
+
+    async def get_transaction_receipt(self, tx_hash):
+        self.receipt_calls += 1
+        if tx_hash not in self.mined:
+            raise TransactionNotFound(f"{tx_hash} not found")
+        return {"blockHash": HexBytes(b"\1" * 32), "blockNumber": self.mined[tx_hash]}
+
+    def mine(self, tx_hashes):
+        self.block += 1
+        for tx_hash in tx_hashes:
+            self.mined[tx_hash] = self.block
+
+
+class FakeWsEth:
+    def __init__(self, ws):
+        self.ws = ws
+
+    async def subscribe(self, kind):
+        self.ws.subscriptions += 1
+        self.ws.active.add(hex(self.ws.subscriptions))
+        return hex(self.ws.subscriptions)
+
+    async def unsubscribe(self, subscription_id):
+        self.ws.active.discard(subscription_id)
+        return True
+
+
+class FakeWs:
+    def __init__(self):
+        self.subscriptions = 0
+        self.active = set()
+        self.eth = FakeWsEth(self)
+        self.ws = self
+
+    async def process_subscriptions(self):
+        subscription_id = hex(self.subscriptions)
+        yield {"subscription": "0xother", "result": {"number": "0x64"}}
+        yield {"subscription": subscription_id, "result": {"number": hex(self.subscriptions)}}
+        raise ConnectionError("socket closed")
+
+
+class TestReceiptWatcher(IsolatedAsyncioTestCase):
+
+    async def test_websocket_source_unsubscribes(self):
+        ws = FakeWs()
+        source = websocket_block_source(ws)
+        for attempt in range(1, 3):
+            blocks = []
+            with self.assertRaises(ConnectionError):
+                async for block_number in source():
+                    blocks.append(block_number)
+            self.assertEqual([attempt], blocks)
+            self.assertEqual(set(), ws.active)
+
+        blocks = source()
+        self.assertEqual(3, await blocks.__anext__())
+        self.assertEqual({"0x3"}, ws.active)
+        await blocks.aclose()
+        self.assertEqual(set(), ws.active)
+
+    async def test_resolves_all_waiters(self):
+        eth = FakeEth()
+        watcher = AsyncReceiptWatcher(eth, poll_latency=0.01)
+        tx_hashes = [HexBytes(i.to_bytes(32, "big")) for i in range(50)]
+        waiters = asyncio.gather(*[watcher.wait_for(h, timeout=5) for h in tx_hashes])
+        await asyncio.sleep(0.05)
+        eth.mine(tx_hashes)
+        receipts = await waiters
+        self.assertEqual([1] * 50, [r["blockNumber"] for r in receipts])
+        self.assertEqual(0, watcher.tracked)
+        # INFO: receipt requests scale with checks, not with poll_latency per hash
+        self.assertLess(eth.receipt_calls, 50 * 4)
+        await watcher.stop()
+
+    async def test_timeout(self):
+        eth = FakeEth()
+        watcher = AsyncReceiptWatcher(eth, poll_latency=0.01)
+        with self.assertRaises(TimeExhausted):
+            await watcher.wait_for(HexBytes(b"\2" * 32), timeout=0.05)
+        self.assertEqual(0, watcher.tracked)
+        await watcher.stop()
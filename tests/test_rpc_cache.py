@@ -0,0 +1,147 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from web3.types import RPCEndpoint
+
+from zksync2_async.module.module_builder import AsyncZkSyncBuilder
+from zksync2_async.module.rpc_cache import RPCResultCache, SingleFlight
+from zksync2_async.module.zksync_provider import AsyncZkSyncProvider
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRPCResultCache(IsolatedAsyncioTestCase):
+
+    async def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = RPCResultCache(clock=clock)
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            return len(calls)
+
+        self.assertEqual(1, await cache.get_or_fetch(("m",), 5, fetch))
+        self.assertEqual(1, await cache.get_or_fetch(("m",), 5, fetch))
+        clock.now = 6
+        self.assertEqual(2, await cache.get_or_fetch(("m",), 5, fetch))
+        self.assertEqual(1, cache.stats.hits)
+        self.assertEqual(2, cache.stats.misses)
+
+    async def test_lru_limit(self):
+        cache = RPCResultCache(max_size=2)
+        cache.put(("a",), 1, None)
+        cache.put(("b",), 2, None)
+        cache.get(("a",))
+        cache.put(("c",), 3, None)
+        self.assertEqual((True, 1), cache.get(("a",)))
+        self.assertEqual((False, None), cache.get(("b",)))
+        self.assertEqual(1, cache.stats.evictions)
+
+    async def test_single_flight(self):
+        cache = RPCResultCache()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*[cache.get_or_fetch(("m",), None, fetch) for _ in range(5)])
+        self.assertEqual(["value"] * 5, results)
+        self.assertEqual(1, len(calls))
+        self.assertEqual(4, cache.stats.shared)
+
+    async def test_cancelled_leader_keeps_shared_fetch(self):
+        flight = SingleFlight()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "value"
+
+        leader = asyncio.ensure_future(asyncio.wait_for(flight.run("k", fetch), timeout=0.01))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.run("k", fetch))
+        with self.assertRaises(asyncio.TimeoutError):
+            await leader
+        self.assertEqual("value", await follower)
+        # INFO: the fetch of the timed out caller is restarted once for the follower
+        self.assertEqual(2, len(calls))
+        self.assertEqual(0, len(flight))
+
+    async def test_fetch_cancelled_without_callers(self):
+        flight = SingleFlight()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def fetch():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        caller = asyncio.ensure_future(flight.run("k", fetch))
+        await started.wait()
+        caller.cancel()
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        await asyncio.sleep(0)
+        self.assertEqual(0, len(flight))
+
+    async def test_failure_not_cached(self):
+        cache = RPCResultCache()
+
+        async def fail():
+            raise ValueError("node error")
+
+        async def fetch():
+            return "value"
+
+        with self.assertRaises(ValueError):
+            await cache.get_or_fetch(("m",), None, fail)
+        self.assertEqual("value", await cache.get_or_fetch(("m",), None, fetch))
+
+    async def test_invalidate_method(self):
+        cache = RPCResultCache()
+        cache.put(("a", "()"), 1, None)
+        cache.put(("b", "()"), 2, None)
+        cache.invalidate("a")
+        self.assertEqual((False, None), cache.get(("a", "()")))
+        self.assertEqual((True, 2), cache.get(("b", "()")))
+
+
+class TestCachedMethods(IsolatedAsyncioTestCase):
+
+    async def test_module_methods_cached(self):
+        requests = []
+
+        async def make_request(provider, method: RPCEndpoint, params):
+            requests.append(method)
+            results = {"eth_chainId": "0x118", "eth_gasPrice": "0x64", "zks_L1ChainId": "0x5"}
+            return {"jsonrpc": "2.0", "id": 1, "result": results[method]}
+
+        with patch.object(AsyncZkSyncProvider, "make_request", make_request):
+            web3 = await AsyncZkSyncBuilder.build(AsyncZkSyncProvider("http://127.0.0.1:3050"))
+            for _ in range(3):
+                self.assertEqual(280, await web3.zksync.chain_id)
+                self.assertEqual(100, await web3.zksync.gas_price)
+                await web3.zksync.zks_l1_chain_id()
+            self.assertEqual(["eth_chainId", "eth_gasPrice", "zks_L1ChainId"], requests)
+
+            web3.zksync.rpc_cache.invalidate("eth_gasPrice")
+            await web3.zksync.gas_price
+            self.assertEqual("eth_gasPrice", requests[-1])
+
+            web3.zksync.rpc_cache = None
+            await web3.zksync.chain_id
+            self.assertEqual("eth_chainId", requests[-1])
@@ -0,0 +1,56 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from eth_account import Account
+from eth_typing import HexStr
+from eth_utils.crypto import keccak_256
+
+from zksync2_async.core.request_types import EIP712Meta
+from zksync2_async.signer.eth_signer import PrivateKeyEthSigner
+from zksync2_async.signer.signing_service import AsyncSigningService
+from zksync2_async.transaction.transaction712 import Transaction712
+
+
+class TestSigningService(IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.account = Account.from_key(keccak_256("cow".encode('utf-8')))
+        self.signer = PrivateKeyEthSigner(self.account, 280)
+        self.txs = [Transaction712(chain_id=280,
+                                   nonce=nonce,
+                                   gas_limit=54321,
+                                   to=HexStr("0xCcCCccccCCCCcCCCCCCcCcCccCcCCCcCcccccccC"),
+                                   value=0,
+                                   data=HexStr("0x"),
+                                   maxPriorityFeePerGas=0,
+                                   maxFeePerGas=250000000,
+                                   from_=self.account.address,
+                                   meta=EIP712Meta()) for nonce in range(5)]
+
+    async def test_sign_matches_inline(self):
+        expected = [tx.encode(self.signer.sign_typed_data(tx.to_eip712_struct())) for tx in self.txs]
+        async with AsyncSigningService(self.signer, max_workers=2, max_pending=2) as service:
+            encoded = await service.sign_many(self.txs)
+            self.assertEqual(0, service.pending)
+            self.assertEqual(len(self.txs), service.signed_count)
+        self.assertEqual(expected, encoded)
+        self.assertIsNone(service._executor)
+
+    async def test_close_does_not_block_loop(self):
+        service = AsyncSigningService(self.signer, max_workers=1)
+        signing = asyncio.ensure_future(service.sign_many(self.txs))
+        while service.pending < len(self.txs):
+            await asyncio.sleep(0)
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker = asyncio.ensure_future(tick())
+        await service.aclose()
+        ticker.cancel()
+        self.assertEqual(len(self.txs), len(await signing))
+        self.assertGreater(ticks, 1)
@@ -0,0 +1,173 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from eth_account import Account
+from eth_utils import keccak
+from eth_utils.crypto import keccak_256
+from hexbytes import HexBytes
+from web3.exceptions import TimeExhausted
+
+from zksync2_async.core.request_types import EIP712Meta
+from zksync2_async.signer.eth_signer import PrivateKeyEthSigner
+from zksync2_async.signer.signing_service import AsyncSigningService
+from zksync2_async.transaction.submission_engine import AsyncSubmissionEngine, DroppedTransaction
+from zksync2_async.transaction.transaction712 import Transaction712
+from zksync2_async.transaction.transaction_builders import TxFunctionCall
+
+RECEIVER = "0x" + "22" * 20
+
+
+class FakeZkSync:
+    def __init__(self):
+        self.sent = []
+        self.receipts = dict()
+        self.send_errors = []
+        self.tracked = []
+        self.watcher_started = False
+        self.send_delay = 0.0
+        self.sending = 0
+        self.max_sending = 0
+
+    def start_receipt_watcher(self):
+        self.watcher_started = True
+
+    async def get_transaction_count(self, address, block_identifier):
+        return 5
+
+    async def prepare_transaction(self, tx, nonce=None):
+        return Transaction712(chain_id=280, nonce=nonce, gas_limit=1000, to=tx["to"], value=tx["value"],
+                              data=tx["data"], maxPriorityFeePerGas=0, maxFeePerGas=100,
+                              from_=tx["from"], meta=EIP712Meta())
+
+    async def send_raw_transaction(self, raw):
+        if len(self.send_errors) > 0:
+            raise self.send_errors.pop(0)
+        tx_hash = HexBytes(keccak(raw))
+        self.sent.append(tx_hash)
+        if tx_hash not in self.receipts:
+            self.receipts[tx_hash] = asyncio.get_running_loop().create_future()
+        if self.send_delay > 0:
+            self.sending += 1
+            self.max_sending = max(self.max_sending, self.sending)
+            try:
+                await asyncio.sleep(self.send_delay)
+            finally:
+                self.sending -= 1
+        return tx_hash
+
+    def track_estimate(self, tx_hash, tx):
+        self.tracked.append(tx_hash)
+
+    def mine(self, tx_hash, status: int = 1, **fields):
+        self.receipts[tx_hash].set_result(dict({"transactionHash": tx_hash, "status": status}, **fields))
+
+    async def wait_for_transaction_receipt(self, tx_hash, timeout=120):
+        try:
+            return await asyncio.wait_for(asyncio.shield(self.receipts[tx_hash]), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise TimeExhausted(tx_hash)
+
+
+class TestSubmissionEngine(IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.account = Account.from_key(keccak_256("cow".encode('utf-8')))
+        self.signing_service = AsyncSigningService(PrivateKeyEthSigner(self.account, 280), max_workers=2)
+        self.zksync = FakeZkSync()
+
+    def tearDown(self) -> None:
+        self.signing_service.close()
+
+    def transfer(self, value: int = 1) -> TxFunctionCall:
+        return TxFunctionCall(chain_id=280, nonce=None, from_=self.account.address, to=RECEIVER, value=value)
+
+    async def test_in_flight_window(self):
+        async with AsyncSubmissionEngine(self.zksync, self.signing_service, max_in_flight=2) as engine:
+            first = await engine.submit(self.transfer())
+            second = await engine.submit(self.transfer())
+            third = asyncio.ensure_future(engine.submit(self.transfer()))
+            await asyncio.sleep(0.05)
+            self.assertFalse(third.done())
+            self.assertEqual(2, engine.pending)
+
+            self.zksync.mine(first.tx_hash)
+            third = await asyncio.wait_for(third, timeout=1)
+            self.assertEqual([5, 6, 7], [first.nonce, second.nonce, third.nonce])
+            self.assertEqual(first.tx_hash, (await first.wait())["transactionHash"])
+
+            self.zksync.mine(second.tx_hash)
+            self.zksync.mine(third.tx_hash, status=0)
+            await engine.drain()
+            self.assertTrue(self.zksync.watcher_started)
+            self.assertEqual(3, engine.metrics.sent)
+            self.assertEqual(2, engine.metrics.confirmed)
+            self.assertEqual(1, engine.metrics.reverted)
+            self.assertEqual(0, engine.pending)
+            self.assertEqual(self.zksync.sent, self.zksync.tracked)
+
+    async def test_sends_overlap_in_nonce_order(self):
+        self.zksync.send_delay = 0.05
+        async with AsyncSubmissionEngine(self.zksync, self.signing_service, max_in_flight=8) as engine:
+            submissions = await asyncio.gather(*[engine.submit(self.transfer()) for _ in range(4)])
+            self.assertEqual(4, self.zksync.max_sending)
+            by_nonce = sorted(submissions, key=lambda s: s.nonce)
+            self.assertEqual([5, 6, 7, 8], [s.nonce for s in by_nonce])
+            self.assertEqual([s.tx_hash for s in by_nonce], self.zksync.sent)
+
+    async def test_resubmit_on_nonce_error(self):
+        self.zksync.send_errors.append(ValueError("nonce too low"))
+        async with AsyncSubmissionEngine(self.zksync, self.signing_service) as engine:
+            submission = await engine.submit(self.transfer())
+            self.assertEqual(5, submission.nonce)
+            self.assertEqual(1, engine.metrics.resubmitted)
+
+    async def test_send_failure(self):
+        self.zksync.send_errors.append(ValueError("insufficient funds"))
+        async with AsyncSubmissionEngine(self.zksync, self.signing_service, max_in_flight=1) as engine:
+            with self.assertRaises(ValueError):
+                await engine.submit(self.transfer())
+            self.assertEqual(1, engine.metrics.failed)
+            submission = await asyncio.wait_for(engine.submit(self.transfer()), timeout=1)
+            self.assertEqual(5, submission.nonce)
+
+    async def test_replacement(self):
+        async with AsyncSubmissionEngine(self.zksync, self.signing_service,
+                                         replace_after=0.05, max_replacements=1) as engine:
+            submission = await engine.submit(self.transfer())
+            await asyncio.sleep(0.1)
+            self.assertEqual(2, len(submission.tx_hashes))
+            self.assertEqual(112, submission.tx712.maxFeePerGas)
+            self.zksync.mine(submission.tx_hashes[1])
+            receipt = await asyncio.wait_for(submission.wait(), timeout=1)
+            self.assertEqual(submission.tx_hashes[1], receipt["transactionHash"])
+            self.assertEqual(1, engine.metrics.replaced)
+
+    async def test_dropped_transaction_resent(self):
+        async with AsyncSubmissionEngine(self.zksync, self.signing_service, receipt_timeout=0.05) as engine:
+            submission = await engine.submit(self.transfer())
+            await asyncio.sleep(0.08)
+            self.assertEqual(2, len(self.zksync.sent))
+            self.assertEqual([submission.tx_hash], submission.tx_hashes)
+            self.zksync.mine(submission.tx_hash)
+            await asyncio.wait_for(submission.wait(), timeout=1)
+            self.assertEqual(1, engine.metrics.resubmitted)
+
+    async def test_dropped_transaction_fails_queued(self):
+        async with AsyncSubmissionEngine(self.zksync, self.signing_service,
+                                         receipt_timeout=0.05, max_resubmits=0) as engine:
+            first = await engine.submit(self.transfer())
+            second = await engine.submit(self.transfer())
+            self.assertEqual([5, 6], [first.nonce, second.nonce])
+            for submission in (first, second):
+                with self.assertRaises(DroppedTransaction):
+                    await asyncio.wait_for(submission.wait(), timeout=1)
+            await engine.drain()
+            self.assertEqual(0, engine.pending)
+            self.assertEqual(2, engine.metrics.failed)
+            self.assertEqual(5, (await engine.submit(self.transfer())).nonce)
+
+    async def test_wrong_sender(self):
+        engine = AsyncSubmissionEngine(self.zksync, self.signing_service)
+        tx = TxFunctionCall(chain_id=280, nonce=None, from_=RECEIVER, to=RECEIVER)
+        with self.assertRaises(ValueError):
+            await engine.submit(tx)
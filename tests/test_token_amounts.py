@@ -0,0 +1,57 @@
+import random
+from decimal import Decimal
+from unittest import TestCase, skipUnless
+
+from zksync2_async.core.types import Token
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestTokenAmounts(TestCase):
+
+    def setUp(self) -> None:
+        self.eth = Token.create_eth()
+        self.usdc = Token("0x" + "11" * 20, "0x" + "22" * 20, "USDC", 6)
+
+    def test_format_many_matches_format_token(self):
+        rng = random.Random(7)
+        amounts = [0, 10 ** 18, 15 * 10 ** 17, 123456789 * 10 ** 12] + \
+                  [rng.randrange(10 ** 12, 10 ** 24) for _ in range(200)]
+        formatted = self.eth.format_many(amounts)
+        for amount, text in zip(amounts, formatted):
+            self.assertEqual(Decimal(self.eth.format_token(amount)), Decimal(text))
+        self.assertEqual(["0", "1", "1.5", "123.456789"], formatted[:4])
+
+    def test_format_many_exact(self):
+        self.assertEqual(["0.000000000000000001", "-2.5"], self.eth.format_many([1, -25 * 10 ** 17]))
+        big = 10 ** 40 + 1
+        self.assertEqual(["10000000000000000000000.000000000000000001"], self.eth.format_many([big]))
+
+    def test_parse_many(self):
+        self.assertEqual([1_500_000, 2_000_000, 1, 0, -1_250_000],
+                         self.usdc.parse_many(["1.5", "2", "0.0000019", Decimal("0"), "-1.25"]))
+        self.assertEqual([3 * 10 ** 18, 10 ** 18 // 2], self.eth.parse_many([3, Decimal("0.5")]))
+        self.assertEqual([self.usdc.to_int(Decimal("12.345678"))], self.usdc.parse_many(["12.345678"]))
+
+    def test_parse_many_exponent(self):
+        values = ["1e-5", "2.5E3", "-1.234567e2", "1e-7"]
+        self.assertEqual([self.usdc.to_int(Decimal(value)) for value in values], self.usdc.parse_many(values))
+
+    def test_round_trip(self):
+        rng = random.Random(11)
+        amounts = [rng.randrange(0, 10 ** 30) for _ in range(100)]
+        self.assertEqual(amounts, self.eth.parse_many(self.eth.format_many(amounts)))
+        wholes, fractions = self.usdc.scale_many(amounts)
+        self.assertEqual(amounts[0] // 10 ** 6, wholes[0])
+        self.assertEqual(amounts, self.usdc.unscale_many(wholes, fractions))
+
+    @skipUnless(numpy is not None, "numpy is not installed")
+    def test_numpy_arrays(self):
+        amounts = numpy.array([10 ** 18, 25 * 10 ** 17, 7], dtype=numpy.uint64)
+        wholes, fractions = self.eth.scale_many(amounts)
+        self.assertEqual([1, 2, 0], list(wholes))
+        self.assertEqual(["1", "2.5", "0.000000000000000007"], self.eth.format_many(amounts))
+        self.assertEqual([int(a) for a in amounts], list(self.eth.unscale_many(wholes, fractions)))
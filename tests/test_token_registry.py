@@ -0,0 +1,77 @@
+import os
+import tempfile
+from unittest import IsolatedAsyncioTestCase
+
+from zksync2_async.core.types import Token
+from zksync2_async.module.token_registry import AsyncTokenRegistry
+
+
+def make_token(i: int) -> Token:
+    return Token(l1_address="0x" + f"{i:040x}",
+                 l2_address="0x" + f"{i + 0x10000:040x}",
+                 symbol=f"T{i}",
+                 decimals=18)
+
+
+class FakeZkSync:
+    def __init__(self, count: int):
+        self.tokens = [make_token(i) for i in range(count)]
+        self.requests = []
+
+    async def zks_get_confirmed_tokens(self, offset, limit):
+        self.requests.append(offset)
+        return self.tokens[offset:offset + limit]
+
+
+class TestTokenRegistry(IsolatedAsyncioTestCase):
+
+    async def test_paging_and_indexes(self):
+        zksync = FakeZkSync(25)
+        registry = AsyncTokenRegistry(zksync, page_size=10, concurrency=2)
+        self.assertEqual(25, await registry.refresh())
+        self.assertEqual([0, 10, 20, 30], zksync.requests)
+
+        token = make_token(7)
+        self.assertEqual(token, registry.by_l1_address(token.l1_address.upper().replace("0X", "0x")))
+        self.assertEqual(token, registry.by_l2_address(token.l2_address))
+        self.assertEqual(token, registry.by_symbol("T7"))
+        self.assertEqual(token.l2_address, registry.l2_address(token.l1_address))
+        self.assertIsNone(registry.by_symbol("T99"))
+
+    async def test_incremental_refresh(self):
+        zksync = FakeZkSync(5)
+        registry = AsyncTokenRegistry(zksync, page_size=10, concurrency=1)
+        await registry.refresh()
+        self.assertEqual(0, await registry.refresh())
+        zksync.tokens.append(make_token(5))
+        zksync.requests.clear()
+        self.assertEqual(1, await registry.refresh())
+        self.assertEqual([5], zksync.requests)
+        self.assertEqual(6, len(registry))
+
+    async def test_duplicates_keep_cursor(self):
+        zksync = FakeZkSync(5)
+        zksync.tokens.insert(2, make_token(1))
+        registry = AsyncTokenRegistry(zksync, page_size=3, concurrency=1)
+        self.assertEqual(5, await registry.refresh())
+        self.assertEqual([0, 3, 6], zksync.requests)
+
+        zksync.tokens.extend([make_token(5), make_token(6)])
+        zksync.requests.clear()
+        self.assertEqual(2, await registry.refresh())
+        self.assertEqual([6], zksync.requests)
+        self.assertEqual(7, len(registry))
+
+    async def test_snapshot(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tokens.json")
+            zksync = FakeZkSync(12)
+            await AsyncTokenRegistry(zksync, page_size=10, snapshot_path=path).load()
+            self.assertTrue(os.path.exists(path))
+
+            zksync.tokens.append(make_token(12))
+            zksync.requests.clear()
+            registry = await AsyncTokenRegistry(zksync, page_size=10, concurrency=1, snapshot_path=path).load()
+            self.assertEqual([12], zksync.requests)
+            self.assertEqual(13, len(registry))
+            self.assertEqual(make_token(3), registry.by_symbol("T3"))
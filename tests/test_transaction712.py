@@ -9,9 +9,9 @@ from web3 import Web3, EthereumTesterProvider
 from web3.types import Nonce
 from tests.contracts.utils import contract_path
 from zksync2_async.manage_contracts.contract_encoder_base import ContractEncoder
-from zksync2_async.synchronous.module import EIP712Meta
-from zksync2_async.transaction import TxCreateContract
-from zksync2_async.transaction import Transaction712
+from zksync2_async.core.request_types import EIP712Meta
+from zksync2_async.transaction.transaction_builders import TxCreateContract
+from zksync2_async.transaction.transaction712 import Transaction712, TRANSACTION_TYPE
 
 PRIVATE_KEY2 = bytes.fromhex("fd1f96220fa3a40c46d65f81d61dd90af600746fd47e5c82673da937a48b38ef")
 
@@ -78,3 +78,11 @@ class TestTransaction712(TestCase):
         msg = keccak(result_bytes)
         result = "0x" + msg.hex()
         self.assertEqual(self.EXPECTED_ENCODED_BYTES, result)
+
+    def test_transaction_type(self):
+        self.assertEqual(self.TRANSACTION_SIGNATURE, TRANSACTION_TYPE)
+
+    def test_struct_hash(self):
+        result = "0x" + self.tx712.struct_hash().hex()
+        self.assertEqual(self.EXPECTED_ENCODED_VALUE, result)
+        self.assertEqual(self.tx712.to_eip712_struct().hash_struct(), self.tx712.struct_hash())
@@ -0,0 +1,94 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from aiohttp import ClientConnectionError
+from web3.types import RPCEndpoint
+
+from zksync2_async.module.zksync_multi_provider import AsyncZkSyncMultiProvider
+
+
+class FakeEndpoint:
+    def __init__(self, name: str, delay: float = 0.0, fail: bool = False, block: int = 100):
+        self.name = name
+        self.block = block
+        self.delay = delay
+        self.fail = fail
+        self.calls = []
+
+    async def make_request(self, method, params):
+        self.calls.append(method)
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ClientConnectionError(f"{self.name} is down")
+        if method == "eth_blockNumber":
+            return {"jsonrpc": "2.0", "id": 1, "result": hex(self.block)}
+        return {"jsonrpc": "2.0", "id": 1, "result": self.name}
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        return not self.fail
+
+
+class TestZkSyncMultiProvider(IsolatedAsyncioTestCase):
+
+    async def test_latency_routing(self):
+        slow = FakeEndpoint("slow", delay=0.02)
+        fast = FakeEndpoint("fast")
+        provider = AsyncZkSyncMultiProvider([slow, fast])
+        await provider.check_health()
+        for _ in range(3):
+            response = await provider.make_request(RPCEndpoint("eth_gasPrice"), [])
+            self.assertEqual("fast", response["result"])
+        self.assertEqual(1, len(slow.calls))
+
+    async def test_failover_and_circuit_breaker(self):
+        down = FakeEndpoint("down", fail=True)
+        up = FakeEndpoint("up", delay=0.001)
+        provider = AsyncZkSyncMultiProvider([down, up], failure_threshold=2, cooldown=60)
+        for _ in range(4):
+            response = await provider.make_request(RPCEndpoint("eth_gasPrice"), [])
+            self.assertEqual("up", response["result"])
+        # INFO: circuit opened after two failures, down endpoint is not tried anymore
+        self.assertEqual(2, len(down.calls))
+        self.assertEqual("down", provider.ranked()[-1].provider.name)
+
+    async def test_all_endpoints_fail(self):
+        provider = AsyncZkSyncMultiProvider([FakeEndpoint("a", fail=True), FakeEndpoint("b", fail=True)])
+        with self.assertRaises(ClientConnectionError):
+            await provider.make_request(RPCEndpoint("eth_gasPrice"), [])
+
+    async def test_hedged_read(self):
+        stuck = FakeEndpoint("stuck", delay=1)
+        backup = FakeEndpoint("backup", delay=0.001)
+        provider = AsyncZkSyncMultiProvider([stuck, backup], hedge_delay=0.01)
+        response = await asyncio.wait_for(
+            provider.make_request(RPCEndpoint("eth_getTransactionReceipt"), ["0x01"]), timeout=0.5)
+        self.assertEqual("backup", response["result"])
+        self.assertEqual(1, len(stuck.calls))
+
+    async def test_not_hedged_write_waits(self):
+        stuck = FakeEndpoint("stuck", delay=0.05)
+        backup = FakeEndpoint("backup")
+        provider = AsyncZkSyncMultiProvider([stuck, backup], hedge_delay=0.01)
+        response = await provider.make_request(RPCEndpoint("eth_estimateGas"), [])
+        self.assertEqual("stuck", response["result"])
+        self.assertEqual(0, len(backup.calls))
+
+    async def test_sticky_send(self):
+        first = FakeEndpoint("first", delay=0.01)
+        second = FakeEndpoint("second")
+        provider = AsyncZkSyncMultiProvider([first, second])
+        await provider.make_request(RPCEndpoint("eth_sendRawTransaction"), ["0x00"])
+        # INFO: the second endpoint gets faster, sends still go to the first one
+        await provider.check_health()
+        for _ in range(3):
+            response = await provider.make_request(RPCEndpoint("eth_sendRawTransaction"), ["0x00"])
+            self.assertEqual("first", response["result"])
+
+    async def test_lagging_endpoint(self):
+        behind = FakeEndpoint("behind", block=1)
+        ahead = FakeEndpoint("ahead", delay=0.001, block=100)
+        provider = AsyncZkSyncMultiProvider([behind, ahead], max_block_lag=5)
+        await provider.check_health()
+        self.assertTrue(provider.endpoints[0].lagging)
+        self.assertEqual(1, provider.endpoints[0].block_number)
+        self.assertIs(ahead, provider.ranked()[0].provider)
@@ -0,0 +1,117 @@
+import asyncio
+import json
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import patch
+
+from web3.types import RPCEndpoint
+
+from zksync2_async.module.module_builder import AsyncZkSyncBuilder
+from zksync2_async.module.zksync_provider import AsyncZkSyncProvider
+
+
+class FakeNode:
+    def __init__(self):
+        self.posts = []
+
+    async def post(self, data):
+        request = json.loads(data)
+        self.posts.append(request)
+        if isinstance(request, list):
+            # INFO: nodes may answer batch items in any order
+            return json.dumps([self._answer(r) for r in reversed(request)]).encode()
+        return json.dumps(self._answer(request)).encode()
+
+    @staticmethod
+    def _answer(r: dict) -> dict:
+        return {"jsonrpc": "2.0", "id": r["id"], "result": r["method"]}
+
+
+class TestZkSyncProviderBatch(IsolatedAsyncioTestCase):
+
+    def setUp(self) -> None:
+        self.node = FakeNode()
+        self.patcher = patch.object(AsyncZkSyncProvider, "_post", self.node.post)
+        self.patcher.start()
+
+    def tearDown(self) -> None:
+        self.patcher.stop()
+
+    async def test_explicit_batch_single_post(self):
+        provider = AsyncZkSyncProvider("http://127.0.0.1:3050")
+        methods = [RPCEndpoint("eth_chainId"), RPCEndpoint("eth_gasPrice"), RPCEndpoint("zks_L1ChainId")]
+        async with provider.batch():
+            tasks = [asyncio.ensure_future(provider.make_request(m, [])) for m in methods]
+        responses = await asyncio.gather(*tasks)
+        self.assertEqual(1, len(self.node.posts))
+        self.assertEqual(3, len(self.node.posts[0]))
+        self.assertEqual(methods, [r["result"] for r in responses])
+
+    async def test_window_coalescing(self):
+        provider = AsyncZkSyncProvider("http://127.0.0.1:3050", batch_window=0.01)
+        methods = [RPCEndpoint(f"eth_method{i}") for i in range(5)]
+        responses = await asyncio.gather(*[provider.make_request(m, []) for m in methods])
+        self.assertEqual(1, len(self.node.posts))
+        self.assertEqual(methods, [r["result"] for r in responses])
+
+    async def test_window_max_batch_size(self):
+        provider = AsyncZkSyncProvider("http://127.0.0.1:3050", batch_window=10, max_batch_size=2)
+        methods = [RPCEndpoint(f"eth_method{i}") for i in range(4)]
+        responses = await asyncio.wait_for(
+            asyncio.gather(*[provider.make_request(m, []) for m in methods]), timeout=1)
+        self.assertEqual(2, len(self.node.posts))
+        self.assertEqual(methods, [r["result"] for r in responses])
+
+
+class TestZkSyncProviderSession(IsolatedAsyncioTestCase):
+
+    async def test_session_pool_config(self):
+        provider = AsyncZkSyncProvider("http://127.0.0.1:3050", pool_size=8, limit_per_host=4, request_timeout=30)
+        session = await provider.session()
+        self.assertIs(session, await provider.session())
+        self.assertEqual(8, session.connector.limit)
+        self.assertEqual(4, session.connector.limit_per_host)
+        self.assertEqual(30, session.timeout.total)
+        self.assertEqual("gzip, deflate", provider.get_request_headers()["Accept-Encoding"])
+        await provider.disconnect()
+        self.assertTrue(session.closed)
+        self.assertIsNot(session, await provider.session())
+        await provider.disconnect()
+
+    async def test_external_session_not_closed(self):
+        provider = AsyncZkSyncProvider("http://127.0.0.1:3050")
+        session = provider._create_session()
+        await provider.cache_async_session(session)
+        self.assertIs(session, await provider.session())
+        await provider.disconnect()
+        self.assertFalse(session.closed)
+        await session.close()
+
+    async def test_builder_context_closes_session(self):
+        provider = AsyncZkSyncProvider("http://127.0.0.1:3050")
+        async with AsyncZkSyncBuilder.build(provider) as web3:
+            self.assertIs(provider, web3.zksync_provider)
+            session = await provider.session()
+        self.assertTrue(session.closed)
+
+    async def test_builder_awaitable(self):
+        provider = AsyncZkSyncProvider("http://127.0.0.1:3050")
+        web3 = await AsyncZkSyncBuilder.build(provider)
+        self.assertIs(provider, web3.zksync_provider)
+
+
+class TestZkSyncProviderLoops(TestCase):
+
+    def test_new_session_per_loop(self):
+        provider = AsyncZkSyncProvider("http://127.0.0.1:3050")
+
+        async def session():
+            return await provider.session()
+
+        async def next_loop(previous):
+            current = await provider.session()
+            await previous.close()
+            await provider.disconnect()
+            return current
+
+        first = asyncio.run(session())
+        self.assertIsNot(first, asyncio.run(next_loop(first)))
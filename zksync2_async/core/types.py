@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from decimal import Decimal
 from eth_typing import HexStr, Hash32
-from typing import Union, NewType, Dict, List, Any
+from typing import Union, NewType, Dict, List, Any, Iterable, Tuple
 from hexbytes import HexBytes
 from enum import Enum
 
@@ -47,6 +47,89 @@ class Token:
             amount = Decimal(amount)
         return int(amount * (Decimal(10) ** self.decimals))
 
+    def _scalable(self, amounts):
+        # INFO: NumPy arrays are recognized by dtype, fixed width integer arrays
+        #       can't hold the scale of 18 decimals tokens multiplied back, use Python ints
+        if hasattr(amounts, "dtype"):
+            if amounts.dtype.kind in "iu":
+                return amounts.astype(object)
+            return amounts
+        return list(amounts)
+
+    def scale_many(self, amounts) -> Tuple[Any, Any]:
+        """
+        Splits raw integer amounts into (whole units, fractional units) with integer division,
+        NumPy arrays give object arrays, other iterables give lists.
+        """
+        amounts = self._scalable(amounts)
+        scale = 10 ** self.decimals
+        if hasattr(amounts, "dtype"):
+            return divmod(amounts, scale)
+        wholes = []
+        fractions = []
+        for amount in amounts:
+            whole, fraction = divmod(amount, scale)
+            wholes.append(whole)
+            fractions.append(fraction)
+        return wholes, fractions
+
+    def unscale_many(self, wholes, fractions) -> Any:
+        """
+        Inverse of scale_many.
+        """
+        scale = 10 ** self.decimals
+        if hasattr(wholes, "dtype"):
+            return self._scalable(wholes) * scale + self._scalable(fractions)
+        return [whole * scale + fraction for whole, fraction in zip(wholes, fractions)]
+
+    def format_many(self, amounts) -> List[str]:
+        """
+        Fixed point strings of raw integer amounts, exact for any amount,
+        same digits as format_token without exponent notation.
+        """
+        decimals = self.decimals
+        result = []
+        append = result.append
+        for amount in amounts:
+            # INFO: digits of the integer are split by position, no division at all
+            text = str(int(amount))
+            sign = ""
+            if text[0] == "-":
+                sign, text = "-", text[1:]
+            if decimals == 0:
+                append(sign + text)
+            elif len(text) > decimals:
+                fraction = text[-decimals:].rstrip("0")
+                append(sign + text[:-decimals] + "." + fraction if fraction else sign + text[:-decimals])
+            else:
+                fraction = text.rstrip("0")
+                append(sign + "0." + "0" * (decimals - len(text)) + fraction if fraction else "0")
+        return result
+
+    def parse_many(self, values: Iterable[Union[str, Decimal, int]]) -> List[int]:
+        """
+        Raw integer amounts of decimal strings, Decimals or ints, digits beyond
+        token decimals are truncated like to_int does, exponent strings go through Decimal.
+        """
+        decimals = self.decimals
+        scale = 10 ** decimals
+        result = []
+        append = result.append
+        for value in values:
+            if not isinstance(value, str):
+                if isinstance(value, int):
+                    append(value * scale)
+                    continue
+                value = format(value, "f")
+            elif "e" in value or "E" in value:
+                value = format(Decimal(value), "f")
+            whole, _, fraction = value.partition(".")
+            if whole[:1] == "-":
+                append(-(int(whole[1:] or "0") * scale + int(fraction[:decimals].ljust(decimals, "0") or "0")))
+            else:
+                append(int(whole or "0") * scale + int(fraction[:decimals].ljust(decimals, "0") or "0"))
+        return result
+
     @classmethod
     def create_eth(cls) -> 'Token':
         return Token(ADDRESS_DEFAULT, L2_ETH_TOKEN_ADDRESS, "ETH", 18)
@@ -0,0 +1,182 @@
+import re
+from functools import lru_cache
+from typing import Any, Callable, List, Optional, Tuple
+
+from eth_abi.codec import ABICodec
+from eth_abi.grammar import ABIType, TupleType, parse
+from eth_utils import function_abi_to_4byte_selector, is_checksum_address
+from web3._utils.abi import get_abi_input_types
+
+_UINT = re.compile(r"^uint(\d*)$")
+_INT = re.compile(r"^int(\d*)$")
+_FIXED_BYTES = re.compile(r"^bytes(\d+)$")
+
+
+class NotEncodable(ValueError):
+    pass
+
+
+@lru_cache(maxsize=4096)
+def _checksum_address_bytes(address: str) -> Optional[bytes]:
+    # INFO: web3 accepts checksum addresses only, the keccak of checksum check is cached
+    #       because hot paths encode a few addresses again and again
+    if not is_checksum_address(address):
+        return None
+    return bytes.fromhex(address[2:])
+
+
+def _pad_right(data: bytes) -> bytes:
+    remainder = len(data) % 32
+    if remainder == 0:
+        return data
+    return data + b'\0' * (32 - remainder)
+
+
+def _address_encoder(validate: bool) -> Callable[[Any], bytes]:
+    def _encode(value) -> bytes:
+        if isinstance(value, str):
+            if validate:
+                raw = _checksum_address_bytes(value)
+                if raw is None:
+                    raise NotEncodable(value)
+            else:
+                raw = bytes.fromhex(value[2:])
+        elif isinstance(value, (bytes, bytearray)) and len(value) == 20:
+            raw = bytes(value)
+        else:
+            raise NotEncodable(value)
+        return b'\0' * 12 + raw
+
+    return _encode
+
+
+def _int_encoder(bits: int, signed: bool, validate: bool) -> Callable[[Any], bytes]:
+    if signed:
+        lower, upper = -2 ** (bits - 1), 2 ** (bits - 1) - 1
+    else:
+        lower, upper = 0, 2 ** bits - 1
+
+    def _encode(value) -> bytes:
+        if validate and (not isinstance(value, int) or isinstance(value, bool) or not lower <= value <= upper):
+            raise NotEncodable(value)
+        return value.to_bytes(32, 'big', signed=signed)
+
+    return _encode
+
+
+def _bool_encoder(validate: bool) -> Callable[[Any], bytes]:
+    def _encode(value) -> bytes:
+        if validate and not isinstance(value, bool):
+            raise NotEncodable(value)
+        return b'\0' * 31 + (b'\1' if value else b'\0')
+
+    return _encode
+
+
+def _fixed_bytes_encoder(size: int, validate: bool) -> Callable[[Any], bytes]:
+    def _encode(value) -> bytes:
+        # INFO: web3 accepts bytesN values of exactly N bytes only
+        if validate and (not isinstance(value, (bytes, bytearray)) or len(value) != size):
+            raise NotEncodable(value)
+        return bytes(value).ljust(32, b'\0')
+
+    return _encode
+
+
+def _dynamic_bytes_encoder(validate: bool) -> Callable[[Any], bytes]:
+    def _encode(value) -> bytes:
+        if validate and not isinstance(value, (bytes, bytearray)):
+            raise NotEncodable(value)
+        return len(value).to_bytes(32, 'big') + _pad_right(bytes(value))
+
+    return _encode
+
+
+def _string_encoder(validate: bool) -> Callable[[Any], bytes]:
+    bytes_encoder = _dynamic_bytes_encoder(False)
+
+    def _encode(value) -> bytes:
+        if validate and not isinstance(value, str):
+            raise NotEncodable(value)
+        return bytes_encoder(value.encode("utf-8"))
+
+    return _encode
+
+
+def compile_type(abi_type: str, validate: bool) -> Optional[Tuple[bool, Callable[[Any], bytes]]]:
+    """
+    Returns (is dynamic, encoder) for elementary ABI types, None for arrays and tuples.
+    """
+    if abi_type == "address":
+        return False, _address_encoder(validate)
+    if abi_type == "bool":
+        return False, _bool_encoder(validate)
+    if abi_type == "bytes":
+        return True, _dynamic_bytes_encoder(validate)
+    if abi_type == "string":
+        return True, _string_encoder(validate)
+    match = _UINT.match(abi_type)
+    if match is not None:
+        return False, _int_encoder(int(match.group(1) or 256), False, validate)
+    match = _INT.match(abi_type)
+    if match is not None:
+        return False, _int_encoder(int(match.group(1) or 256), True, validate)
+    match = _FIXED_BYTES.match(abi_type)
+    if match is not None:
+        return False, _fixed_bytes_encoder(int(match.group(1)), validate)
+    return None
+
+
+def _has_unchecked_address(abi_type: ABIType, value) -> bool:
+    # INFO: the codec accepts any hex address, web3 raises InvalidAddress for non-checksum ones
+    if abi_type.is_array:
+        return any(_has_unchecked_address(abi_type.item_type, item) for item in value)
+    if isinstance(abi_type, TupleType):
+        return any(_has_unchecked_address(t, item) for t, item in zip(abi_type.components, value))
+    return abi_type.base == "address" and isinstance(value, str) and _checksum_address_bytes(value) is None
+
+
+class CompiledFunction:
+    """
+    Calldata encoder of one contract function: the selector and the argument encoders
+    are resolved once. Functions with arrays or tuples encode their arguments with the codec,
+    with validate their addresses must be checksummed like web3 requires.
+    """
+
+    def __init__(self, fn_abi: dict, validate: bool = True):
+        self.fn_abi = fn_abi
+        self.validate = validate
+        self.selector: bytes = function_abi_to_4byte_selector(fn_abi)
+        self.types: List[str] = get_abi_input_types(fn_abi)
+        compiled = [compile_type(t, validate) for t in self.types]
+        self.encoders: Optional[List[Tuple[bool, Callable[[Any], bytes]]]] = \
+            None if any(c is None for c in compiled) else compiled
+        self._address_types: List[Optional[ABIType]] = \
+            [parse(t) if self.encoders is None and "address" in t else None for t in self.types]
+
+    def encode(self, codec: ABICodec, args: tuple) -> bytes:
+        """
+        Raises NotEncodable when validate is set and an argument doesn't match its type.
+        """
+        if len(args) != len(self.types):
+            raise NotEncodable(args)
+        if self.encoders is None:
+            if self.validate:
+                if not all(codec.is_encodable(t, a) for t, a in zip(self.types, args)):
+                    raise NotEncodable(args)
+                if any(t is not None and _has_unchecked_address(t, a) for t, a in zip(self._address_types, args)):
+                    raise NotEncodable(args)
+            return self.selector + codec.encode(self.types, args)
+
+        head = [self.selector]
+        tail = []
+        offset = 32 * len(args)
+        for (dynamic, encoder), arg in zip(self.encoders, args):
+            if dynamic:
+                encoded = encoder(arg)
+                head.append(offset.to_bytes(32, 'big'))
+                tail.append(encoded)
+                offset += len(encoded)
+            else:
+                head.append(encoder(arg))
+        return b''.join(head + tail)
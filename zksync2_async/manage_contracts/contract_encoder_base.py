@@ -1,12 +1,21 @@
 import json
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Type, Dict, Tuple
+from weakref import WeakKeyDictionary
+
 from eth_typing import HexStr
 from eth_utils import remove_0x_prefix
 from web3._utils.abi import get_constructor_abi, merge_args_and_kwargs
 from web3._utils.contracts import encode_abi
+from web3.contract import AsyncContract
 
 from zksync2_async.module.zksync_web3 import AsyncZkSyncWeb3
+from zksync2_async.manage_contracts.compiled_encoder import CompiledFunction, NotEncodable
+
+
+# INFO: keyed by contract class, encoders of one bundled ABI share the compiled functions
+_compiled_functions: "WeakKeyDictionary[type, Dict[Tuple[str, bool], Optional[CompiledFunction]]]" = \
+    WeakKeyDictionary()
 
 
 class BaseContractEncoder:
@@ -17,16 +26,54 @@ class BaseContractEncoder:
             data = json.load(json_f)
             return cls(web3, abi=data["abi"])
 
-    def __init__(self, web3: AsyncZkSyncWeb3, abi, bytecode: Optional[bytes] = None):
+    def __init__(self,
+                 web3: AsyncZkSyncWeb3,
+                 abi,
+                 bytecode: Optional[bytes] = None,
+                 contract: Optional[Type[AsyncContract]] = None,
+                 compiled: bool = True,
+                 validate: bool = True):
         self.web3 = web3
         self.abi = abi
-        if bytecode is None:
+        self.compiled = compiled
+        self.validate = validate
+        if contract is not None:
+            # INFO: shared contract class of a bundled ABI, see utils.abi.contract_factory
+            self.instance_contract = contract
+        elif bytecode is None:
             self.instance_contract = self.web3.eth.contract(abi=self.abi)
         else:
             self.instance_contract = self.web3.eth.contract(abi=self.abi, bytecode=bytecode)
 
+    def _compiled_function(self, fn_name: str) -> Optional[CompiledFunction]:
+        functions = _compiled_functions.get(self.instance_contract)
+        if functions is None:
+            functions = dict()
+            _compiled_functions[self.instance_contract] = functions
+        key = (fn_name, self.validate)
+        if key not in functions:
+            candidates = [entry for entry in self.instance_contract.abi
+                          if entry.get("type") == "function" and entry.get("name") == fn_name]
+            # INFO: overloaded functions are resolved by arguments in web3, not compiled
+            functions[key] = CompiledFunction(candidates[0], self.validate) if len(candidates) == 1 else None
+        return functions[key]
+
+    def encode_method_bytes(self, fn_name, args: tuple) -> bytes:
+        """
+        Returns selector and encoded arguments. Compiled functions skip the web3 function
+        lookup and argument normalization, arguments web3 would normalize (dicts for tuples,
+        hex strings for bytes) are passed to web3 encodeABI when validate is set.
+        """
+        fn = self._compiled_function(fn_name) if self.compiled else None
+        if fn is not None:
+            try:
+                return fn.encode(self.web3.codec, args)
+            except NotEncodable:
+                pass
+        return bytes.fromhex(remove_0x_prefix(self.instance_contract.encodeABI(fn_name, args)))
+
     def encode_method(self, fn_name, args: tuple) -> HexStr:
-        return self.instance_contract.encodeABI(fn_name, args)
+        return HexStr("0x" + self.encode_method_bytes(fn_name, args).hex())
 
     @property
     def contract(self):
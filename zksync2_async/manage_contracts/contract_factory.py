@@ -6,12 +6,13 @@ from eth_account.signers.base import BaseAccount
 from eth_utils import remove_0x_prefix
 from web3.contract import AsyncContract
 
-from zksync2_async.core.types import EthBlockParams
 from zksync2_async.module.zksync_web3 import AsyncZkSyncWeb3
 from zksync2_async.transaction.transaction_builders import TxCreateContract, TxCreate2Contract
 from zksync2_async.manage_contracts.precompute_contract_deployer import AsyncPrecomputeContractDeployer
 from zksync2_async.manage_contracts.contract_encoder_base import ContractEncoder
 from zksync2_async.signer.eth_signer import EthSignerBase
+from zksync2_async.module.polling import PollingPolicy, FixedPolling
+from zksync2_async.transaction.nonce_manager import nonce_manager, AsyncNonceManager
 
 
 class DeploymentType(Enum):
@@ -27,7 +28,8 @@ class AsyncLegacyContractFactory:
                   compiled_contract: Path,
                   account: BaseAccount,
                   signer: EthSignerBase,
-                  deployment_type: DeploymentType = DeploymentType.CREATE):
+                  deployment_type: DeploymentType = DeploymentType.CREATE,
+                  polling: Optional[PollingPolicy] = None):
         with compiled_contract.open(mode='r') as json_f:
             data = json.load(json_f)
             bytecode = bytes.fromhex(remove_0x_prefix(data["bytecode"]))
@@ -36,7 +38,8 @@ class AsyncLegacyContractFactory:
                        bytecode=bytecode,
                        account=account,
                        signer=signer,
-                       deployment_type=deployment_type)
+                       deployment_type=deployment_type,
+                       polling=polling)
 
     def __init__(self,
                  zksync: AsyncZkSyncWeb3,
@@ -44,19 +47,26 @@ class AsyncLegacyContractFactory:
                  bytecode,
                  account: BaseAccount,
                  signer: EthSignerBase,
-                 deployment_type: DeploymentType = DeploymentType.CREATE):
+                 deployment_type: DeploymentType = DeploymentType.CREATE,
+                 polling: Optional[PollingPolicy] = None):
         self.web3 = zksync
         self.abi = abi
         self.byte_code = bytecode
         self.account = account
         self.type = deployment_type
         self.signer = signer
+        if polling is None:
+            polling = FixedPolling(0.5)
+        self.polling = polling
+
+    @property
+    def nonces(self) -> AsyncNonceManager:
+        return nonce_manager(self.web3.zksync, self.account.address)
 
     async def _deploy_create(self,
                        salt: bytes = None,
                        args: Optional[Any] = None,
                        deps: List[bytes] = None) -> AsyncContract:
-        nonce = await self.web3.zksync.get_transaction_count(self.account.address, EthBlockParams.PENDING.value)
         call_data = None
         if args is not None:
             encoder = ContractEncoder(self.web3, abi=self.abi, bytecode=self.byte_code)
@@ -66,24 +76,24 @@ class AsyncLegacyContractFactory:
         if deps is not None:
             factory_deps = deps
 
-        create_contract = TxCreateContract(web3=self.web3,
-                                           chain_id=await self.web3.zksync.chain_id,
-                                           nonce=nonce,
-                                           from_=self.account.address,
-                                           gas_limit=0,
-                                           gas_price=await self.web3.zksync.gas_price,
-                                           bytecode=self.byte_code,
-                                           call_data=call_data,
-                                           deps=factory_deps,
-                                           salt=salt)
-
-        estimate_gas = await self.web3.zksync.eth_estimate_gas(create_contract.tx)
-
-        tx_712 = create_contract.tx712(estimate_gas)
-        singed_message = self.signer.sign_typed_data(tx_712.to_eip712_struct())
-        msg = tx_712.encode(singed_message)
-        tx_hash = await self.web3.zksync.send_raw_transaction(msg)
-        tx_receipt = await self.web3.zksync.wait_for_transaction_receipt(tx_hash, timeout=240, poll_latency=0.5)
+        async with self.nonces.reserve() as nonce:
+            # INFO: chain id and fees are filled by prepare_transaction in one round trip
+            create_contract = TxCreateContract(web3=self.web3,
+                                               chain_id=None,
+                                               nonce=nonce,
+                                               from_=self.account.address,
+                                               gas_limit=0,
+                                               gas_price=0,
+                                               bytecode=self.byte_code,
+                                               call_data=call_data,
+                                               deps=factory_deps,
+                                               salt=salt)
+            tx_712 = await self.web3.zksync.prepare_transaction(create_contract.tx)
+            singed_message = self.signer.sign_transaction712(tx_712)
+            msg = tx_712.encode(singed_message)
+            tx_hash = await self.web3.zksync.send_raw_transaction(msg)
+            self.web3.zksync.track_estimate(tx_hash, create_contract.tx)
+        tx_receipt = await self.web3.zksync.wait_for_transaction_receipt(tx_hash, timeout=240, poll_latency=self.polling)
         if factory_deps is not None:
             contract_deployer = AsyncPrecomputeContractDeployer(self.web3)
             contract_address = contract_deployer.extract_contract_address(tx_receipt)
@@ -97,8 +107,6 @@ class AsyncLegacyContractFactory:
                         args: Optional[Any] = None,
                         deps: List[bytes] = None) -> AsyncContract:
 
-        nonce = await self.web3.zksync.get_transaction_count(self.account.address, EthBlockParams.PENDING.value)
-        gas_price = await self.web3.zksync.gas_price
         call_data = None
         if args is not None:
             encoder = ContractEncoder(self.web3, abi=self.abi, bytecode=self.byte_code)
@@ -108,22 +116,23 @@ class AsyncLegacyContractFactory:
         if deps is not None:
             factory_deps = deps
 
-        create2_contract = TxCreate2Contract(web3=self.web3,
-                                             chain_id=await self.web3.zksync.chain_id,
-                                             nonce=nonce,
-                                             from_=self.account.address,
-                                             gas_limit=0,
-                                             gas_price=gas_price,
-                                             bytecode=self.byte_code,
-                                             call_data=call_data,
-                                             deps=factory_deps,
-                                             salt=salt)
-        estimate_gas = await self.web3.zksync.eth_estimate_gas(create2_contract.tx)
-        tx_712 = create2_contract.tx712(estimate_gas)
-        singed_message = self.signer.sign_typed_data(tx_712.to_eip712_struct())
-        msg = tx_712.encode(singed_message)
-        tx_hash = await self.web3.zksync.send_raw_transaction(msg)
-        tx_receipt = await self.web3.zksync.wait_for_transaction_receipt(tx_hash, timeout=240, poll_latency=0.5)
+        async with self.nonces.reserve() as nonce:
+            create2_contract = TxCreate2Contract(web3=self.web3,
+                                                 chain_id=None,
+                                                 nonce=nonce,
+                                                 from_=self.account.address,
+                                                 gas_limit=0,
+                                                 gas_price=0,
+                                                 bytecode=self.byte_code,
+                                                 call_data=call_data,
+                                                 deps=factory_deps,
+                                                 salt=salt)
+            tx_712 = await self.web3.zksync.prepare_transaction(create2_contract.tx)
+            singed_message = self.signer.sign_transaction712(tx_712)
+            msg = tx_712.encode(singed_message)
+            tx_hash = await self.web3.zksync.send_raw_transaction(msg)
+            self.web3.zksync.track_estimate(tx_hash, create2_contract.tx)
+        tx_receipt = await self.web3.zksync.wait_for_transaction_receipt(tx_hash, timeout=240, poll_latency=self.polling)
 
         if factory_deps is not None:
             contract_deployer = AsyncPrecomputeContractDeployer(self.web3)
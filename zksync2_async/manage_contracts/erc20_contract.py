@@ -1,14 +1,21 @@
-from typing import Optional
+from typing import Dict, Iterable, Optional, Tuple
 from eth_typing import HexStr
 from web3 import AsyncWeb3
 from web3.contract import AsyncContract
 from eth_account.signers.base import BaseAccount
 from web3.eth import AsyncEth
-from web3.types import TxReceipt
+from web3.types import BlockIdentifier, TxReceipt
 
 from zksync2_async.module.zksync_web3 import AsyncZkSyncWeb3
-from zksync2_async.utils.abi import erc_20_abi_default
+from zksync2_async.module.fee_oracle import suggested_gas_price
+from zksync2_async.transaction.nonce_manager import nonce_manager, AsyncNonceManager
+from zksync2_async.utils.abi import erc_20_abi_default, contract_factory, contract_abi, ERC20_ABI
+from zksync2_async.manage_contracts.compiled_encoder import CompiledFunction
 from zksync2_async.manage_contracts.contract_encoder_base import BaseContractEncoder
+from zksync2_async.manage_contracts.multicall import AsyncMulticall, call_of
+
+_BALANCE_OF = CompiledFunction(contract_abi(ERC20_ABI).functions["balanceOf"][0], validate=False)
+_ALLOWANCE = CompiledFunction(contract_abi(ERC20_ABI).functions["allowance"][0], validate=False)
 
 
 class AsyncERC20Contract:
@@ -21,29 +28,33 @@ class AsyncERC20Contract:
         check_sum_address = AsyncWeb3.to_checksum_address(contract_address)
         self.contract_address = check_sum_address
         self.module = web3
-        self.contract: AsyncContract = self.module.contract(self.contract_address, abi=erc_20_abi_default())
+        self.contract: AsyncContract = contract_factory(self.module, ERC20_ABI)(address=self.contract_address)
         self.account = account
 
+    @property
+    def nonces(self) -> AsyncNonceManager:
+        return nonce_manager(self.module, self.account.address)
+
     async def _nonce(self) -> int:
-        return await self.module.get_transaction_count(self.account.address)
+        return await self.nonces.peek()
 
     async def approve(self,
                       zksync_address: HexStr,
                       amount,
                       gas_limit: int) -> TxReceipt:
-        nonce = await self._nonce()
-        gas_price = await self.module.gas_price
-        tx = self.contract.functions.approve(zksync_address,
-                                             amount).build_transaction(
-            {
-                "chainId": self.module.chain_id,
-                "from": self.account.address,
-                "gasPrice": gas_price,
-                "gas": gas_limit,
-                "nonce": nonce
-            })
-        signed_tx = self.account.sign_transaction(tx)
-        tx_hash = await self.module.send_raw_transaction(signed_tx.rawTransaction)
+        gas_price = await suggested_gas_price(self.module)
+        async with self.nonces.reserve() as nonce:
+            tx = await self.contract.functions.approve(zksync_address,
+                                                       amount).build_transaction(
+                {
+                    "chainId": await self.module.chain_id,
+                    "from": self.account.address,
+                    "gasPrice": gas_price,
+                    "gas": gas_limit,
+                    "nonce": nonce
+                })
+            signed_tx = self.account.sign_transaction(tx)
+            tx_hash = await self.module.send_raw_transaction(signed_tx.rawTransaction)
         tx_receipt = await self.module.wait_for_transaction_receipt(tx_hash)
         return tx_receipt
 
@@ -68,10 +79,46 @@ class AsyncERC20Contract:
                 "from": self.account.address
             })
 
+    @staticmethod
+    async def balances_of_many(module: AsyncEth,
+                               tokens: Iterable[HexStr],
+                               accounts: Iterable[HexStr],
+                               multicall_address: Optional[HexStr] = None,
+                               block_identifier: BlockIdentifier = "latest") -> Dict[Tuple[HexStr, HexStr], Optional[int]]:
+        """
+        Reads balanceOf of every account for every token with AsyncMulticall,
+        the balance is None when the call of the token failed.
+        """
+        tokens = list(tokens)
+        accounts = list(accounts)
+        pairs = [(token, account) for token in tokens for account in accounts]
+        calls = [call_of(module.codec, token, _BALANCE_OF, (AsyncWeb3.to_checksum_address(account),))
+                 for token, account in pairs]
+        balances = await AsyncMulticall(module, multicall_address).aggregate(calls, block_identifier)
+        return dict(zip(pairs, balances))
+
+    @staticmethod
+    async def allowances_of_many(module: AsyncEth,
+                                 allowances: Iterable[Tuple[HexStr, HexStr, HexStr]],
+                                 multicall_address: Optional[HexStr] = None,
+                                 block_identifier: BlockIdentifier = "latest") \
+            -> Dict[Tuple[HexStr, HexStr, HexStr], Optional[int]]:
+        """
+        Reads allowance for every (token, owner, spender) with AsyncMulticall.
+        """
+        allowances = list(allowances)
+        calls = [call_of(module.codec, token, _ALLOWANCE,
+                         (AsyncWeb3.to_checksum_address(owner), AsyncWeb3.to_checksum_address(spender)))
+                 for token, owner, spender in allowances]
+        values = await AsyncMulticall(module, multicall_address).aggregate(calls, block_identifier)
+        return dict(zip(allowances, values))
+
 
 class ERC20Encoder(BaseContractEncoder):
 
     def __init__(self, web3: AsyncZkSyncWeb3, abi: Optional[dict] = None):
+        contract = None
         if abi is None:
             abi = erc_20_abi_default()
-        super(ERC20Encoder, self).__init__(web3, abi)
+            contract = contract_factory(web3.eth, ERC20_ABI)
+        super(ERC20Encoder, self).__init__(web3, abi, contract=contract)
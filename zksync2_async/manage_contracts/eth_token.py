@@ -5,8 +5,9 @@ from web3.contract import AsyncContract
 from web3.eth import AsyncEth
 from web3.module import Module
 
-from zksync2_async.utils.abi import eth_token_abi_default
-from zksync2_async.core.types import EthBlockParams
+from zksync2_async.utils.abi import contract_factory, ETH_TOKEN_ABI
+from zksync2_async.module.fee_oracle import suggested_gas_price
+from zksync2_async.transaction.nonce_manager import nonce_manager, AsyncNonceManager
 
 
 class AsyncEthToken:
@@ -20,22 +21,33 @@ class AsyncEthToken:
         check_sum_address = AsyncWeb3.to_checksum_address(contract_address)
         self.contract_address = check_sum_address
         self.module = web3
-        self.contract: AsyncContract = self.module.contract(self.contract_address, abi=eth_token_abi_default())
+        self.contract: AsyncContract = contract_factory(self.module, ETH_TOKEN_ABI)(address=self.contract_address)
         self.account = account
 
+    @property
+    def nonces(self) -> AsyncNonceManager:
+        return nonce_manager(self.module, self.account.address)
+
     async def _nonce(self) -> int:
-        return await self.module.get_transaction_count(self.account.address, EthBlockParams.LATEST.value)
+        return await self.nonces.peek()
 
     async def withdraw_tx(self,
                           to: HexStr,
                           amount: int,
                           gas: int,
-                          gas_price: int = None):
+                          gas_price: int = None,
+                          nonce: int = None):
+        """
+        Builds the withdraw transaction, without nonce the next one is allocated from
+        nonces, release it with nonces.release() if the transaction is not sent.
+        """
         if gas_price is None:
-            gas_price = await self.module.gas_price
+            gas_price = await suggested_gas_price(self.module)
+        if nonce is None:
+            nonce = await self.nonces.next_nonce()
 
         return self.contract.functions.withdraw(to).build_transaction({
-            "nonce": await self._nonce(),
+            "nonce": nonce,
             "chainId": await self.module.chain_id,
             "gas": gas,
             "gasPrice": gas_price,
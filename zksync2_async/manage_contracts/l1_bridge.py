@@ -5,8 +5,9 @@ from typing import List, Optional
 from web3.types import TxReceipt
 
 from zksync2_async.module.zksync_web3 import AsyncZkSyncWeb3
-from zksync2_async.utils.abi import l1_bridge_abi_default
+from zksync2_async.utils.abi import l1_bridge_abi_default, contract_factory, L1_BRIDGE_ABI
 from zksync2_async.manage_contracts.contract_encoder_base import BaseContractEncoder
+from zksync2_async.transaction.nonce_manager import nonce_manager, AsyncNonceManager
 
 
 class AsyncL1Bridge:
@@ -22,11 +23,16 @@ class AsyncL1Bridge:
         self.account = eth_account
         # self.gas_provider = gas_provider
         if abi is None:
-            abi = l1_bridge_abi_default()
-        self.contract: AsyncContract = self.web3.eth.contract(self.addr, abi=abi)
+            self.contract: AsyncContract = contract_factory(self.web3.eth, L1_BRIDGE_ABI)(address=self.addr)
+        else:
+            self.contract: AsyncContract = self.web3.eth.contract(self.addr, abi=abi)
+
+    @property
+    def nonces(self) -> AsyncNonceManager:
+        return nonce_manager(self.web3.eth, self.account.address)
 
     async def _get_nonce(self):
-        return await self.web3.eth.get_transaction_count(self.account.address)
+        return await self.nonces.peek()
 
     async def claim_failed_deposit(self,
                                    deposit_sender: HexStr,
@@ -37,9 +43,9 @@ class AsyncL1Bridge:
                                    l2_tx_number_in_block: int,
                                    merkle_proof: List[bytes]):
         params = {
-            "chainId": self.web3.eth.chain_id,
+            "chainId": await self.web3.eth.chain_id,
             "from": self.account.address,
-            "nonce": self._get_nonce()
+            "nonce": await self.nonces.peek()
         }
         await self.contract.functions.claimFailedDeposit(deposit_sender,
                                                          l1_token,
@@ -55,22 +61,23 @@ class AsyncL1Bridge:
                       amount: int,
                       l2_tx_gas_limit: int,
                       l2_tx_gas_per_pubdata_byte: int) -> TxReceipt:
-        tx = self.contract.functions.deposit(l2_receiver,
-                                             l1_token,
-                                             amount,
-                                             l2_tx_gas_limit,
-                                             l2_tx_gas_per_pubdata_byte
-                                             ).build_transaction(
-            {
-                "chainId": self.web3.eth.chain_id,
-                "from": self.account.address,
-                "nonce": self._get_nonce(),
-                # "gas": self.gas_provider.gas_limit(),
-                # "gasPrice": self.gas_provider.gas_price(),
-                "value": amount
-            })
-        signed_tx = self.account.sign_transaction(tx)
-        txn_hash = await self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        async with self.nonces.reserve() as nonce:
+            tx = await self.contract.functions.deposit(l2_receiver,
+                                                       l1_token,
+                                                       amount,
+                                                       l2_tx_gas_limit,
+                                                       l2_tx_gas_per_pubdata_byte
+                                                       ).build_transaction(
+                {
+                    "chainId": await self.web3.eth.chain_id,
+                    "from": self.account.address,
+                    "nonce": nonce,
+                    # "gas": self.gas_provider.gas_limit(),
+                    # "gasPrice": self.gas_provider.gas_price(),
+                    "value": amount
+                })
+            signed_tx = self.account.sign_transaction(tx)
+            txn_hash = await self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
         txn_receipt = await self.web3.eth.wait_for_transaction_receipt(txn_hash)
         return txn_receipt
 
@@ -79,19 +86,20 @@ class AsyncL1Bridge:
                                   l2_msg_index: int,
                                   msg: bytes,
                                   merkle_proof: List[bytes]) -> TxReceipt:
-        tx = self.contract.functions.finalizeWithdrawal(l2_block_number,
-                                                        l2_msg_index,
-                                                        msg,
-                                                        merkle_proof).build_transaction(
-            {
-                "chainId": self.web3.eth.chain_id,
-                "from": self.account.address,
-                "nonce": self._get_nonce(),
-                # "gas": self.gas_provider.gas_limit(),
-                # "gasPrice": self.gas_provider.gas_price()
-            })
-        signed_tx = self.account.sign_transaction(tx)
-        txn_hash = await self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        async with self.nonces.reserve() as nonce:
+            tx = await self.contract.functions.finalizeWithdrawal(l2_block_number,
+                                                                  l2_msg_index,
+                                                                  msg,
+                                                                  merkle_proof).build_transaction(
+                {
+                    "chainId": await self.web3.eth.chain_id,
+                    "from": self.account.address,
+                    "nonce": nonce,
+                    # "gas": self.gas_provider.gas_limit(),
+                    # "gasPrice": self.gas_provider.gas_price()
+                })
+            signed_tx = self.account.sign_transaction(tx)
+            txn_hash = await self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
         txn_receipt = await self.web3.eth.wait_for_transaction_receipt(txn_hash)
         return txn_receipt
 
@@ -109,6 +117,8 @@ class AsyncL1Bridge:
 class L1BridgeEncoder(BaseContractEncoder):
 
     def __init__(self, web3: AsyncZkSyncWeb3, abi: Optional[dict] = None):
+        contract = None
         if abi is None:
             abi = l1_bridge_abi_default()
-        super(L1BridgeEncoder, self).__init__(web3, abi)
+            contract = contract_factory(web3.eth, L1_BRIDGE_ABI)
+        super(L1BridgeEncoder, self).__init__(web3, abi, contract=contract)
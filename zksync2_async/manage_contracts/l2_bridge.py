@@ -1,10 +1,18 @@
+from typing import Dict, Iterable, Optional
+
 from eth_account.signers.base import BaseAccount
 from web3.contract import AsyncContract
 from eth_typing import HexStr
 from web3.types import TxReceipt, TxParams
 
 from zksync2_async.module.zksync_web3 import AsyncZkSyncWeb3
-from zksync2_async.utils.abi import l2_bridge_abi_default
+from zksync2_async.module.fee_oracle import suggested_gas_price
+from zksync2_async.utils.abi import contract_factory, contract_abi, L2_BRIDGE_ABI
+from zksync2_async.manage_contracts.compiled_encoder import CompiledFunction
+from zksync2_async.manage_contracts.multicall import AsyncMulticall, call_of
+from zksync2_async.transaction.nonce_manager import nonce_manager, AsyncNonceManager
+
+_L2_TOKEN_ADDRESS = CompiledFunction(contract_abi(L2_BRIDGE_ABI).functions["l2TokenAddress"][0], validate=False)
 
 
 class AsyncL2Bridge:
@@ -18,11 +26,17 @@ class AsyncL2Bridge:
         self.addr = check_sum_address
         self.zksync_account = zksync_account
         if abi is None:
-            abi = l2_bridge_abi_default()
-        self.contract: AsyncContract = self.web3.eth.contract(self.addr, abi=abi)
+            self.contract: AsyncContract = contract_factory(self.web3.eth, L2_BRIDGE_ABI)(address=self.addr)
+        else:
+            self.contract: AsyncContract = self.web3.eth.contract(self.addr, abi=abi)
+        self._l1_bridge: Optional[HexStr] = None
+
+    @property
+    def nonces(self) -> AsyncNonceManager:
+        return nonce_manager(self.web3.zksync, self.zksync_account.address)
 
     async def _get_nonce(self):
-        return await self.web3.zksync.get_transaction_count(self.zksync_account.address)
+        return await self.nonces.peek()
 
     async def finalize_deposit(self,
                          l1_sender: HexStr,
@@ -30,22 +44,26 @@ class AsyncL2Bridge:
                          l1_token: HexStr,
                          amount: int,
                          data: bytes) -> TxReceipt:
-        tx = self.contract.functions.finalizeDeposit(l1_sender,
-                                                     l2_receiver,
-                                                     l1_token,
-                                                     amount,
-                                                     data).build_transaction(
-            {
-                "from": self.zksync_account.address,
-                "nonce": self._get_nonce(),
-            })
-        signed_tx = self.zksync_account.sign_transaction(tx)
-        txn_hash = await self.web3.zksync.send_raw_transaction(signed_tx.rawTransaction)
+        async with self.nonces.reserve() as nonce:
+            tx = await self.contract.functions.finalizeDeposit(l1_sender,
+                                                               l2_receiver,
+                                                               l1_token,
+                                                               amount,
+                                                               data).build_transaction(
+                {
+                    "from": self.zksync_account.address,
+                    "nonce": nonce,
+                })
+            signed_tx = self.zksync_account.sign_transaction(tx)
+            txn_hash = await self.web3.zksync.send_raw_transaction(signed_tx.rawTransaction)
         txn_receipt = await self.web3.zksync.wait_for_transaction_receipt(txn_hash)
         return txn_receipt
 
     async def l1_bridge(self) -> HexStr:
-        return await self.contract.functions.l1Bridge().call()
+        # INFO: the counterpart bridge address never changes
+        if self._l1_bridge is None:
+            self._l1_bridge = await self.contract.functions.l1Bridge().call()
+        return self._l1_bridge
 
     async def l1_token_address(self, l2_token: HexStr):
         return await self.contract.functions.l1TokenAddress(l2_token).call()
@@ -53,14 +71,34 @@ class AsyncL2Bridge:
     async def l2_token_address(self, l1_token: HexStr):
         return await self.contract.functions.l2TokenAddress(l1_token).call()
 
+    async def l2_token_addresses(self,
+                                 l1_tokens: Iterable[HexStr],
+                                 multicall_address: Optional[HexStr] = None) -> Dict[HexStr, Optional[HexStr]]:
+        """
+        Resolves l2TokenAddress of many L1 tokens with AsyncMulticall.
+        """
+        l1_tokens = list(l1_tokens)
+        codec = self.web3.codec
+        calls = [call_of(codec, self.addr, _L2_TOKEN_ADDRESS, (AsyncZkSyncWeb3.to_checksum_address(token),))
+                 for token in l1_tokens]
+        addresses = await AsyncMulticall(self.web3.zksync, multicall_address).aggregate(calls)
+        return dict(zip(l1_tokens, addresses))
+
     async def withdraw_tx(self,
                     l1_receiver: HexStr,
                     l2_token: HexStr,
                     amount: int,
                     gas: int,
-                    gas_price: int = None) -> TxParams:
+                    gas_price: int = None,
+                    nonce: int = None) -> TxParams:
+        """
+        Builds the withdraw transaction, without nonce the next one is allocated from
+        nonces, release it with nonces.release() if the transaction is not sent.
+        """
         if gas_price is None:
-            gas_price = await self.web3.zksync.gas_price
+            gas_price = await suggested_gas_price(self.web3.zksync)
+        if nonce is None:
+            nonce = await self.nonces.next_nonce()
 
         tx = self.contract.functions.withdraw(l1_receiver,
                                               l2_token,
@@ -68,7 +106,7 @@ class AsyncL2Bridge:
             {
                 "chain_id": await self.web3.zksync.chain_id,
                 "from": self.zksync_account.address,
-                "nonce": await self._get_nonce(),
+                "nonce": nonce,
                 "gas": gas,
                 "gas_price": gas_price
             })
@@ -0,0 +1,112 @@
+import asyncio
+from typing import Any, List, NamedTuple, Optional, Sequence
+
+from eth_abi.codec import ABICodec
+from eth_typing import HexStr
+from web3 import AsyncWeb3
+from web3._utils.abi import map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.eth import AsyncEth
+from web3.types import BlockIdentifier
+
+from zksync2_async.manage_contracts.compiled_encoder import CompiledFunction
+from zksync2_async.utils.abi import contract_abi, MULTICALL3_ABI
+
+# INFO: Multicall3 deployment address shared by most EVM networks,
+#       zkSync derives CREATE2 addresses differently, pass its deployment explicitly
+MULTICALL3_ADDRESS = HexStr("0xcA11bde05977b3631167028862bE2a173976CA11")
+
+
+class MulticallCall(NamedTuple):
+    target: HexStr
+    call_data: bytes
+    output_types: List[str]
+    allow_failure: bool = True
+
+
+def call_of(codec: ABICodec,
+            target: HexStr,
+            fn: CompiledFunction,
+            args: tuple,
+            allow_failure: bool = True) -> MulticallCall:
+    """
+    Call of a compiled view function, its outputs are decoded by the function ABI.
+    """
+    output_types = [o["type"] for o in fn.fn_abi.get("outputs", [])]
+    return MulticallCall(AsyncWeb3.to_checksum_address(target),
+                         fn.encode(codec, args),
+                         output_types,
+                         allow_failure)
+
+
+class AsyncMulticall:
+    """
+    Runs many view calls as one eth_call of Multicall3 aggregate3 (max_calls per request),
+    without multicall_address the calls are sent as one JSON-RPC batch when the provider
+    supports it. Results are decoded in call order, failed calls give None when
+    allow_failure is set.
+    """
+
+    def __init__(self,
+                 module: AsyncEth,
+                 multicall_address: Optional[HexStr] = None,
+                 max_calls: int = 500):
+        self.module = module
+        self.multicall_address = None if multicall_address is None \
+            else AsyncWeb3.to_checksum_address(multicall_address)
+        self.max_calls = max_calls
+        self._aggregate3 = CompiledFunction(contract_abi(MULTICALL3_ABI).functions["aggregate3"][0])
+
+    def _decode(self, call: MulticallCall, return_data: bytes) -> Any:
+        values = self.module.codec.decode(call.output_types, return_data)
+        # INFO: same normalization as contract calls, addresses come back checksummed
+        values = map_abi_data(BASE_RETURN_NORMALIZERS, call.output_types, values)
+        if len(values) == 1:
+            return values[0]
+        return values
+
+    async def _aggregate(self, calls: Sequence[MulticallCall], block_identifier: BlockIdentifier) -> List[Any]:
+        call_data = self._aggregate3.encode(self.module.codec,
+                                            ([(c.target, c.allow_failure, c.call_data) for c in calls],))
+        raw = await self.module.call({"to": self.multicall_address, "data": HexStr("0x" + call_data.hex())},
+                                     block_identifier)
+        (results,) = self.module.codec.decode(["(bool,bytes)[]"], raw)
+        decoded = []
+        for call, (success, return_data) in zip(calls, results):
+            if not success or len(return_data) == 0:
+                decoded.append(None)
+            else:
+                decoded.append(self._decode(call, return_data))
+        return decoded
+
+    async def _call(self, call: MulticallCall, block_identifier: BlockIdentifier) -> Any:
+        try:
+            raw = await self.module.call({"to": call.target, "data": HexStr("0x" + call.call_data.hex())},
+                                         block_identifier)
+        except Exception:
+            if call.allow_failure:
+                return None
+            raise
+        if len(raw) == 0:
+            return None
+        return self._decode(call, raw)
+
+    async def _batch(self, calls: Sequence[MulticallCall], block_identifier: BlockIdentifier) -> List[Any]:
+        provider = getattr(self.module.w3, "zksync_provider", None)
+        if provider is not None and hasattr(provider, "batch"):
+            async with provider.batch():
+                tasks = [asyncio.ensure_future(self._call(c, block_identifier)) for c in calls]
+        else:
+            tasks = [self._call(c, block_identifier) for c in calls]
+        return list(await asyncio.gather(*tasks))
+
+    async def aggregate(self,
+                        calls: Sequence[MulticallCall],
+                        block_identifier: BlockIdentifier = "latest") -> List[Any]:
+        if len(calls) == 0:
+            return []
+        if self.multicall_address is None:
+            return await self._batch(calls, block_identifier)
+        chunks = [calls[i:i + self.max_calls] for i in range(0, len(calls), self.max_calls)]
+        results = await asyncio.gather(*[self._aggregate(chunk, block_identifier) for chunk in chunks])
+        return [r for chunk in results for r in chunk]
@@ -3,7 +3,7 @@ from eth_typing import HexStr
 from web3.types import Nonce
 
 from zksync2_async.module.zksync_web3 import AsyncZkSyncWeb3
-from zksync2_async.utils.abi import nonce_holder_abi_default
+from zksync2_async.utils.abi import contract_factory, NONCE_HOLDER_ABI
 from zksync2_async.utils.deploy_addresses import ZkSyncAddresses
 
 
@@ -14,8 +14,8 @@ class AsyncNonceHolder:
                  account: BaseAccount):
         self.web3 = web3
         self.account = account
-        self.contract = self.web3.zksync.contract(address=ZkSyncAddresses.NONCE_HOLDER_ADDRESS.value,
-                                                  abi=nonce_holder_abi_default())
+        self.contract = contract_factory(self.web3.zksync, NONCE_HOLDER_ABI)(
+            address=ZkSyncAddresses.NONCE_HOLDER_ADDRESS.value)
 
     async def get_account_nonce(self) -> Nonce:
         return await self.contract.functions.getAccountNonce().call(
@@ -4,7 +4,7 @@ from web3.types import Nonce, TxReceipt
 from eth_utils.crypto import keccak
 
 from zksync2_async.module.zksync_web3 import AsyncZkSyncWeb3
-from zksync2_async.utils.abi import contract_deployer_abi_default
+from zksync2_async.utils.abi import contract_deployer_abi_default, contract_factory, CONTRACT_DEPLOYER_ABI
 from zksync2_async.core.utils import pad_front_bytes, to_bytes, int_to_bytes, hash_byte_code
 from zksync2_async.manage_contracts.contract_encoder_base import BaseContractEncoder
 
@@ -21,9 +21,11 @@ class AsyncPrecomputeContractDeployer:
 
     def __init__(self, web3: AsyncZkSyncWeb3, abi: Optional[dict] = None):
         self.web3 = web3
+        contract = None
         if abi is None:
             abi = contract_deployer_abi_default()
-        self.contract_encoder = BaseContractEncoder(self.web3, abi)
+            contract = contract_factory(self.web3.eth, CONTRACT_DEPLOYER_ABI)
+        self.contract_encoder = BaseContractEncoder(self.web3, abi, contract=contract)
 
     def encode_create2(self, bytecode: bytes,
                        call_data: Optional[bytes] = None,
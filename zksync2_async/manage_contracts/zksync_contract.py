@@ -7,7 +7,8 @@ from eth_typing import HexStr
 from eth_utils import remove_0x_prefix
 from eth_account.signers.base import BaseAccount
 
-from zksync2_async.utils.abi import zksync_abi_default
+from zksync2_async.utils.abi import contract_factory, ZKSYNC_ABI
+from zksync2_async.transaction.nonce_manager import nonce_manager, AsyncNonceManager
 from zksync2_async.utils.models import StoredBlockInfo, CommitBlockInfo, \
     DiamondCutData, Facet, VerifierParams
 
@@ -24,7 +25,7 @@ class AsyncZkSyncContract:
         check_sum_address = AsyncWeb3.to_checksum_address(zksync_main_contract)
         self.contract_address = check_sum_address
         self.web3 = eth
-        self.contract = self.web3.eth.contract(self.contract_address, abi=zksync_abi_default())
+        self.contract = contract_factory(self.web3.eth, ZKSYNC_ABI)(address=self.contract_address)
         self.account = account
         self._chain_id = None
 
@@ -38,8 +39,12 @@ class AsyncZkSyncContract:
     def address(self):
         return self.contract_address
 
+    @property
+    def nonces(self) -> AsyncNonceManager:
+        return nonce_manager(self.web3.eth, self.account.address)
+
     async def _nonce(self):
-        return await self.web3.eth.get_transaction_count(self.account.address)
+        return await self.nonces.peek()
 
     def _method_(self, method_name: str) -> AsyncContractFunction:
         return getattr(self.contract.functions, method_name)
@@ -119,18 +124,19 @@ class AsyncZkSyncContract:
                                       message: bytes,
                                       merkle_proof: List[bytes]
                                       ):
-        tx = await self._method_("finalizeEthWithdrawal")(l2_block_number,
-                                                          l2_message_index,
-                                                          l2_tx_number_in_block,
-                                                          message,
-                                                          merkle_proof).build_transaction(
-            {
-                "chainId": await self.chain_id,
-                "from": self.account.address,
-                'nonce': await self._nonce(),
-            })
-        signed = self.account.sign_transaction(tx)
-        tx_hash = await self.web3.eth.send_raw_transaction(signed.rawTransaction)
+        async with self.nonces.reserve() as nonce:
+            tx = await self._method_("finalizeEthWithdrawal")(l2_block_number,
+                                                              l2_message_index,
+                                                              l2_tx_number_in_block,
+                                                              message,
+                                                              merkle_proof).build_transaction(
+                {
+                    "chainId": await self.chain_id,
+                    "from": self.account.address,
+                    'nonce': nonce,
+                })
+            signed = self.account.sign_transaction(tx)
+            tx_hash = await self.web3.eth.send_raw_transaction(signed.rawTransaction)
         return await self.web3.eth.wait_for_transaction_receipt(tx_hash)
 
     async def freeze_diamond(self):
@@ -343,23 +349,23 @@ class AsyncZkSyncContract:
                                      gas_price: int,
                                      gas_limit: int,
                                      l1_value: int) -> TxReceipt:
-        nonce = await self._nonce()
-        tx = await self._method_("requestL2Transaction")(contract_l2,
-                                                         l2_value,
-                                                         call_data,
-                                                         l2_gas_limit,
-                                                         l2_gas_per_pubdata_byte_limit,
-                                                         factory_deps,
-                                                         refund_recipient).build_transaction(
-            {
-                "nonce": nonce,
-                'from': self.account.address,
-                "gasPrice": gas_price,
-                "gas": gas_limit,
-                "value": l1_value
-            })
-        signed_tx = self.account.sign_transaction(tx)
-        tx_hash = await self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        async with self.nonces.reserve() as nonce:
+            tx = await self._method_("requestL2Transaction")(contract_l2,
+                                                             l2_value,
+                                                             call_data,
+                                                             l2_gas_limit,
+                                                             l2_gas_per_pubdata_byte_limit,
+                                                             factory_deps,
+                                                             refund_recipient).build_transaction(
+                {
+                    "nonce": nonce,
+                    'from': self.account.address,
+                    "gasPrice": gas_price,
+                    "gas": gas_limit,
+                    "value": l1_value
+                })
+            signed_tx = self.account.sign_transaction(tx)
+            tx_hash = await self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
         tx_receipt = await self.web3.eth.wait_for_transaction_receipt(tx_hash)
         return tx_receipt
 
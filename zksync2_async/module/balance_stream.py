@@ -0,0 +1,104 @@
+import asyncio
+import json
+import sys
+from collections import deque
+from typing import AsyncIterable, AsyncIterator, Deque, Iterable, List, NamedTuple, Union
+
+from eth_typing import HexStr
+from web3.eth import AsyncEth
+
+from zksync2_async.utils.rpc_endpoints import zks_get_all_account_balances_rpc
+
+
+class BalanceRecord(NamedTuple):
+    address: HexStr
+    token: HexStr
+    amount: int
+
+
+async def _chunks(addresses: Union[AsyncIterable[HexStr], Iterable[HexStr]],
+                  size: int) -> AsyncIterator[List[HexStr]]:
+    chunk = []
+    if hasattr(addresses, "__aiter__"):
+        async for address in addresses:
+            chunk.append(address)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+    else:
+        for address in addresses:
+            chunk.append(address)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+    if len(chunk) > 0:
+        yield chunk
+
+
+async def _fetch_chunk(module: AsyncEth, addresses: List[HexStr]) -> List[BalanceRecord]:
+    # INFO: raw responses, balances are parsed straight into records
+    #       without the per-response dict of to_zks_account_balances
+    manager = module.w3.manager
+    provider = getattr(module.w3, "zksync_provider", None)
+    if provider is not None and hasattr(provider, "batch"):
+        async with provider.batch():
+            tasks = [asyncio.ensure_future(manager.coro_request(zks_get_all_account_balances_rpc, [a]))
+                     for a in addresses]
+    else:
+        tasks = [manager.coro_request(zks_get_all_account_balances_rpc, [a]) for a in addresses]
+    responses = await asyncio.gather(*tasks)
+    records = []
+    for address, balances in zip(addresses, responses):
+        for token, amount in balances.items():
+            records.append(BalanceRecord(address, sys.intern(token), int(amount, 16)))
+    return records
+
+
+async def stream_account_balances(module: AsyncEth,
+                                  addresses: Union[AsyncIterable[HexStr], Iterable[HexStr]],
+                                  batch_size: int = 50,
+                                  concurrency: int = 4) -> AsyncIterator[BalanceRecord]:
+    """
+    Yields (address, token, amount) of all account balances of the addresses.
+
+    Addresses are read lazily, batch_size of them are requested as one JSON-RPC batch
+    and at most concurrency batches are in flight, so memory doesn't grow with the
+    number of addresses. Records come in the order of addresses.
+    """
+    pending: Deque[asyncio.Future] = deque()
+    try:
+        async for chunk in _chunks(addresses, batch_size):
+            pending.append(asyncio.ensure_future(_fetch_chunk(module, chunk)))
+            if len(pending) >= concurrency:
+                for record in await pending.popleft():
+                    yield record
+        while len(pending) > 0:
+            for record in await pending.popleft():
+                yield record
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def write_balance_columns(records: AsyncIterable[BalanceRecord],
+                                path: str,
+                                chunk_size: int = 10000) -> int:
+    """
+    Writes records as JSON lines of column chunks {"address": [...], "token": [...], "amount": [...]},
+    amounts are decimal strings. Returns the number of written records.
+    """
+    written = 0
+    columns = {"address": [], "token": [], "amount": []}
+    with open(path, "w") as output:
+        async for address, token, amount in records:
+            columns["address"].append(address)
+            columns["token"].append(token)
+            columns["amount"].append(str(amount))
+            if len(columns["address"]) == chunk_size:
+                output.write(json.dumps(columns) + "\n")
+                written += chunk_size
+                columns = {"address": [], "token": [], "amount": []}
+        if len(columns["address"]) > 0:
+            output.write(json.dumps(columns) + "\n")
+            written += len(columns["address"])
+    return written
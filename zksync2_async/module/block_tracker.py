@@ -0,0 +1,125 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from typing import Optional, List, Tuple
+
+from web3._utils.rpc_abi import RPC
+from web3.eth import AsyncEth
+from web3.types import BlockNumber
+
+from zksync2_async.core.types import ZkBlockParams
+
+
+class AsyncBlockTracker:
+    """
+    Keeps the latest committed and finalized L2 block numbers in memory.
+
+    One background task refreshes both numbers every refresh_interval seconds, all
+    waiters consult the in-memory values, so any number of concurrent
+    until_finalized() calls costs two RPC calls per refresh.
+    """
+    logger = logging.getLogger("BlockTracker")
+    # INFO: heaps are compacted when more waiters than this (and than live ones) were cancelled
+    COMPACT_THRESHOLD = 64
+
+    def __init__(self, module: AsyncEth, refresh_interval: float = 1.0):
+        self.module = module
+        self.refresh_interval = refresh_interval
+        self.committed_block: Optional[BlockNumber] = None
+        self.finalized_block: Optional[BlockNumber] = None
+        self._finalized_waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._committed_waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._cancelled = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for _, _, future in self._finalized_waiters + self._committed_waiters:
+            if not future.done():
+                future.cancel()
+        self._finalized_waiters.clear()
+        self._committed_waiters.clear()
+        self._cancelled = 0
+
+    async def _block_number(self, block: ZkBlockParams) -> BlockNumber:
+        # INFO: web3 block identifier validation does not know zkSync "committed" tag,
+        #       the raw response is also cheaper than a formatted block
+        response = await self.module.w3.manager.coro_request(RPC.eth_getBlockByNumber, [block.value, False])
+        number = response["number"]
+        if isinstance(number, str):
+            number = int(number, 16)
+        return BlockNumber(number)
+
+    async def refresh(self):
+        self.committed_block, self.finalized_block = await asyncio.gather(
+            self._block_number(ZkBlockParams.COMMITTED),
+            self._block_number(ZkBlockParams.FINALIZED))
+        self._resolve(self._committed_waiters, self.committed_block)
+        self._resolve(self._finalized_waiters, self.finalized_block)
+
+    async def _run(self):
+        while True:
+            try:
+                await self.refresh()
+            except Exception as err:
+                self.logger.warning(f"Failed to refresh block numbers: {err}")
+            await asyncio.sleep(self.refresh_interval)
+
+    @staticmethod
+    def _resolve(waiters: List[Tuple[int, int, asyncio.Future]], latest: BlockNumber):
+        while len(waiters) > 0 and waiters[0][0] <= latest:
+            _, _, future = heapq.heappop(waiters)
+            if not future.done():
+                future.set_result(latest)
+
+    async def _until(self,
+                     waiters: List[Tuple[int, int, asyncio.Future]],
+                     latest: Optional[BlockNumber],
+                     block_number: int,
+                     timeout: Optional[float]) -> BlockNumber:
+        if latest is not None and latest >= block_number:
+            return latest
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(waiters, (block_number, next(self._sequence), future))
+        self.start()
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            if not future.done():
+                future.cancel()
+            if future.cancelled():
+                self._waiter_cancelled()
+
+    def _waiter_cancelled(self):
+        """
+        Cancelled waiters stay in the heaps until their block, drops them once they pile up.
+        """
+        self._cancelled += 1
+        waiting = len(self._finalized_waiters) + len(self._committed_waiters)
+        if self._cancelled <= max(self.COMPACT_THRESHOLD, waiting // 2):
+            return
+        for waiters in (self._finalized_waiters, self._committed_waiters):
+            waiters[:] = [waiter for waiter in waiters if not waiter[2].done()]
+            heapq.heapify(waiters)
+        self._cancelled = 0
+
+    async def until_finalized(self, block_number: int, timeout: Optional[float] = None) -> BlockNumber:
+        """
+        Returns the finalized block number once it's >= block_number.
+        """
+        return await self._until(self._finalized_waiters, self.finalized_block, block_number, timeout)
+
+    async def until_committed(self, block_number: int, timeout: Optional[float] = None) -> BlockNumber:
+        return await self._until(self._committed_waiters, self.committed_block, block_number, timeout)
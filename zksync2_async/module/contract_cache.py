@@ -0,0 +1,49 @@
+from collections import OrderedDict
+from typing import Callable, Hashable, TypeVar
+from weakref import WeakValueDictionary
+
+T = TypeVar("T")
+
+
+class ContractWrapperCache:
+    """
+    Shares contract wrapper instances (AsyncERC20Contract, bridges, ...) by key,
+    usually (wrapper class, contract address, account address).
+
+    The last max_size used wrappers are kept alive, evicted ones are still returned
+    while something else references them.
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._recent: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._alive: "WeakValueDictionary[Hashable, object]" = WeakValueDictionary()
+
+    def __len__(self):
+        return len(self._alive)
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], T]) -> T:
+        wrapper = self._recent.get(key)
+        if wrapper is None:
+            wrapper = self._alive.get(key)
+        if wrapper is None:
+            self.misses += 1
+            wrapper = factory()
+            self._alive[key] = wrapper
+        else:
+            self.hits += 1
+        self._recent[key] = wrapper
+        self._recent.move_to_end(key)
+        while len(self._recent) > self.max_size:
+            self._recent.popitem(last=False)
+        return wrapper
+
+    def clear(self):
+        self._recent.clear()
+        self._alive.clear()
+
+
+def wrapper_key(wrapper_class: type, address: str, account_address: str) -> tuple:
+    return wrapper_class, address.lower(), account_address.lower()
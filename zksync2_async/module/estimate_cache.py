@@ -0,0 +1,149 @@
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, List, Optional, Tuple, Union
+
+from eth_utils import keccak, remove_0x_prefix
+from hexbytes import HexBytes
+from web3.types import TxReceipt
+
+from zksync2_async.core.types import Fee
+from zksync2_async.module.rpc_cache import RPCResultCache, CacheStats
+from zksync2_async.utils.rpc_endpoints import eth_estimate_gas_rpc, zks_estimate_fee_rpc
+
+ESTIMATE_METHODS = (eth_estimate_gas_rpc, zks_estimate_fee_rpc)
+
+
+def _data_bytes(data: Union[bytes, str, None]) -> bytes:
+    if data is None:
+        return b''
+    if isinstance(data, str):
+        return bytes.fromhex(remove_0x_prefix(data))
+    return bytes(data)
+
+
+def estimate_key(tx: dict) -> tuple:
+    """
+    Shape of a transaction: (to, selector, calldata length class, paymaster, factory deps hashes).
+    Transactions of one shape are expected to use about the same gas.
+    """
+    data = _data_bytes(tx.get("data"))
+    to = tx.get("to")
+    paymaster = None
+    deps_hashes = ()
+    meta = tx.get("eip712Meta")
+    if meta is not None:
+        if meta.paymaster_params is not None and meta.paymaster_params.paymaster is not None:
+            paymaster = meta.paymaster_params.paymaster.lower()
+        if meta.factory_deps is not None:
+            deps_hashes = tuple(keccak(dep) for dep in meta.factory_deps)
+    # INFO: calldata length class is the power of two bucket, dynamic arguments of similar size share it
+    return (None if to is None else to.lower(),
+            data[:4],
+            len(data).bit_length(),
+            paymaster,
+            deps_hashes)
+
+
+class GasEstimateCache:
+    """
+    Opt-in cache of eth_estimateGas/zks_estimateFee results keyed by estimate_key.
+
+    Results are kept for ttl seconds and returned with the gas limit increased by margin
+    (0.2 - 20%), because calls of the same shape may use a bit more gas than the estimated one.
+    Only gas limits of zks_estimateFee are cached, fee prices of a cached shape are taken
+    fresh from the prices callable of estimate().
+    A transaction registered with track() whose receipt is reverted (out of gas included)
+    drops the estimate of its shape.
+    """
+
+    def __init__(self,
+                 margin: float = 0.2,
+                 ttl: Optional[float] = 60.0,
+                 max_size: int = 1024,
+                 max_tracked: int = 4096,
+                 clock: Callable[[], float] = time.monotonic):
+        self.margin = margin
+        self.ttl = ttl
+        self.max_tracked = max_tracked
+        self.invalidations = 0
+        self._cache = RPCResultCache(max_size=max_size, clock=clock)
+        self._tracked: "OrderedDict[bytes, tuple]" = OrderedDict()
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
+
+    def __len__(self):
+        return len(self._cache)
+
+    @staticmethod
+    def _limits(value: Any) -> Any:
+        if isinstance(value, Fee):
+            return Fee(gas_limit=value.gas_limit, gas_per_pubdata_limit=value.gas_per_pubdata_limit)
+        return value
+
+    def _with_margin(self, value: Any, prices: Tuple[int, int] = (0, 0)) -> Any:
+        if isinstance(value, Fee):
+            return Fee(gas_limit=int(value.gas_limit * (1 + self.margin)),
+                       max_fee_per_gas=prices[0],
+                       max_priority_fee_per_gas=prices[1],
+                       gas_per_pubdata_limit=value.gas_per_pubdata_limit)
+        return int(value * (1 + self.margin))
+
+    async def estimate(self,
+                       method: str,
+                       tx: dict,
+                       fetch: Callable[[], Awaitable[Any]],
+                       prices: Optional[Callable[[], Awaitable[Tuple[int, int]]]] = None) -> Any:
+        """
+        Returns the cached estimate of the transaction shape, or fetches and caches it.
+
+        Fee estimates served from the cache get max fee and max priority fee per gas from prices,
+        without it Fee estimates are always fetched.
+        """
+        if method == zks_estimate_fee_rpc and prices is None:
+            return await fetch()
+        fetched: List[Any] = []
+
+        async def _fetch():
+            value = await fetch()
+            fetched.append(value)
+            return self._limits(value)
+
+        value = await self._cache.get_or_fetch((method,) + estimate_key(tx), self.ttl, _fetch)
+        if not isinstance(value, Fee):
+            return self._with_margin(value)
+        if len(fetched) > 0:
+            return self._with_margin(value, (fetched[0].max_fee_per_gas, fetched[0].max_priority_fee_per_gas))
+        return self._with_margin(value, await prices())
+
+    def track(self, tx_hash: Union[HexBytes, bytes, str], tx: dict):
+        """
+        Remembers the shape of a sent transaction, see observe().
+        """
+        self._tracked[HexBytes(tx_hash)] = estimate_key(tx)
+        while len(self._tracked) > self.max_tracked:
+            self._tracked.popitem(last=False)
+
+    def observe(self, receipt: TxReceipt):
+        """
+        Invalidates the estimates of a tracked transaction shape when its receipt reverted.
+        """
+        shape = self._tracked.pop(HexBytes(receipt["transactionHash"]), None)
+        if shape is None or receipt.get("status", 1) != 0:
+            return
+        self._invalidate_shape(shape)
+
+    def _invalidate_shape(self, shape: tuple):
+        for method in ESTIMATE_METHODS:
+            if self._cache.discard((method,) + shape):
+                self.invalidations += 1
+
+    def invalidate(self, tx: Optional[dict] = None):
+        """
+        Drops the estimates of the transaction shape, or all of them.
+        """
+        if tx is None:
+            self._cache.invalidate()
+        else:
+            self._invalidate_shape(estimate_key(tx))
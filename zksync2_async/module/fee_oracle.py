@@ -0,0 +1,265 @@
+import asyncio
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple, Union
+
+from web3._utils.rpc_abi import RPC
+from web3.eth import AsyncEth
+
+from zksync2_async.core.request_types import Transaction
+from zksync2_async.module.rpc_cache import SingleFlight
+
+
+class FeeStrategy(ABC):
+
+    @abstractmethod
+    def select(self, samples: Sequence[int]) -> int:
+        """
+        Returns the suggestion of ascending sorted, non empty samples.
+        """
+        raise NotImplementedError
+
+
+class PercentileStrategy(FeeStrategy):
+    """
+    Nearest-rank percentile of the window, multiplied by multiplier.
+    """
+
+    def __init__(self, percentile: float, multiplier: float = 1.0):
+        if not 0 <= percentile <= 100:
+            raise ValueError(f"Percentile must be in [0, 100], got {percentile}")
+        self.percentile = percentile
+        self.multiplier = multiplier
+
+    def select(self, samples: Sequence[int]) -> int:
+        rank = max(math.ceil(self.percentile / 100 * len(samples)), 1)
+        return int(samples[rank - 1] * self.multiplier)
+
+
+FEE_STRATEGIES: Dict[str, FeeStrategy] = {
+    "fast": PercentileStrategy(90),
+    "normal": PercentileStrategy(50),
+    "cheap": PercentileStrategy(10),
+}
+
+
+class _Window:
+
+    def __init__(self, size: int):
+        self.samples: Deque[Tuple[float, int]] = deque(maxlen=size)
+        self._sorted: Optional[List[int]] = None
+
+    def __len__(self):
+        return len(self.samples)
+
+    def add(self, at: float, value: int):
+        self.samples.append((at, value))
+        self._sorted = None
+
+    def prune(self, oldest: float):
+        while len(self.samples) > 0 and self.samples[0][0] < oldest:
+            self.samples.popleft()
+            self._sorted = None
+
+    def latest(self) -> int:
+        return self.samples[-1][1]
+
+    def sorted(self) -> List[int]:
+        if self._sorted is None:
+            self._sorted = sorted(value for _, value in self.samples)
+        return self._sorted
+
+
+class AsyncFeeOracle:
+    """
+    Samples L2 gas price, L1 gas price (with l1_module) and zks_estimateFee max fee per gas
+    (with estimate_tx) every sample_interval seconds into rolling windows of window samples.
+
+    Suggestions are served from the windows by strategy ("fast", "normal", "cheap" or any
+    FeeStrategy). Samples older than max_sample_age seconds are dropped, a suggestion of an
+    empty window waits for a new sample (one for all concurrent callers).
+    """
+    logger = logging.getLogger("FeeOracle")
+
+    def __init__(self,
+                 module: AsyncEth,
+                 l1_module: Optional[AsyncEth] = None,
+                 sample_interval: float = 5.0,
+                 window: int = 60,
+                 strategy: Union[str, FeeStrategy, None] = "normal",
+                 estimate_tx: Optional[Transaction] = None,
+                 max_sample_age: Optional[float] = 60.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.module = module
+        self.l1_module = l1_module
+        self.sample_interval = sample_interval
+        self.window = window
+        self.strategy: FeeStrategy = FEE_STRATEGIES["normal"]
+        self.strategy = self._strategy(strategy)
+        self.estimate_tx = estimate_tx
+        self.max_sample_age = max_sample_age
+        self.clock = clock
+        self.l2_gas_prices = _Window(window)
+        self.l1_gas_prices = _Window(window)
+        self.max_fees_per_gas = _Window(window)
+        self._single_flight = SingleFlight()
+        self._task: Optional[asyncio.Task] = None
+
+    def configured_as(self,
+                      l1_module: Optional[AsyncEth],
+                      sample_interval: float,
+                      window: int,
+                      strategy: Union[str, FeeStrategy, None],
+                      estimate_tx: Optional[Transaction]) -> bool:
+        return (self.l1_module is l1_module
+                and self.sample_interval == sample_interval
+                and self.window == window
+                and self.strategy is self._strategy(strategy)
+                and self.estimate_tx == estimate_tx)
+
+    def _strategy(self, strategy: Union[str, FeeStrategy, None]) -> FeeStrategy:
+        if strategy is None:
+            return self.strategy
+        if isinstance(strategy, FeeStrategy):
+            return strategy
+        if strategy not in FEE_STRATEGIES:
+            raise ValueError(f"Unknown fee strategy {strategy}, use one of {sorted(FEE_STRATEGIES)}")
+        return FEE_STRATEGIES[strategy]
+
+    @staticmethod
+    async def _gas_price(module: AsyncEth) -> int:
+        # INFO: raw request, the gas_price property of zkSync module is served from rpc_cache
+        price = await module.w3.manager.coro_request(RPC.eth_gasPrice, [])
+        if isinstance(price, str):
+            price = int(price, 16)
+        return price
+
+    async def _max_fee_per_gas(self) -> int:
+        # INFO: bypasses estimate cache of the module, the oracle needs fresh fees
+        return (await self.module._zks_estimate_fee(self.estimate_tx)).max_fee_per_gas
+
+    async def sample(self):
+        """
+        Samples all sources at once, a failing source is logged and doesn't stop the others.
+        """
+        sources = [("L2 gas price", self.l2_gas_prices, self._gas_price(self.module))]
+        if self.l1_module is not None:
+            sources.append(("L1 gas price", self.l1_gas_prices, self._gas_price(self.l1_module)))
+        if self.estimate_tx is not None:
+            sources.append(("max fee per gas", self.max_fees_per_gas, self._max_fee_per_gas()))
+        results = await asyncio.gather(*[source for _, _, source in sources], return_exceptions=True)
+        now = self.clock()
+        for (name, window, _), result in zip(sources, results):
+            if isinstance(result, BaseException):
+                self.logger.warning(f"Failed to sample {name}: {result}")
+            else:
+                window.add(now, result)
+
+    async def _suggest(self,
+                       window: _Window,
+                       strategy: Union[str, FeeStrategy, None],
+                       at_least_latest: bool) -> int:
+        if self.max_sample_age is not None:
+            window.prune(self.clock() - self.max_sample_age)
+        if len(window) == 0:
+            await self._single_flight.run("sample", self.sample)
+            if len(window) == 0:
+                raise RuntimeError("Fee oracle has no recent samples")
+        price = self._strategy(strategy).select(window.sorted())
+        if at_least_latest:
+            price = max(price, window.latest())
+        return price
+
+    async def gas_price(self,
+                        strategy: Union[str, FeeStrategy, None] = None,
+                        at_least_latest: bool = False) -> int:
+        """
+        With at_least_latest the suggestion is not lower than the latest sample (price to send with).
+        """
+        return await self._suggest(self.l2_gas_prices, strategy, at_least_latest)
+
+    async def l1_gas_price(self,
+                           strategy: Union[str, FeeStrategy, None] = None,
+                           at_least_latest: bool = False) -> int:
+        if self.l1_module is None:
+            raise RuntimeError("Fee oracle samples L1 gas price only with l1_module")
+        return await self._suggest(self.l1_gas_prices, strategy, at_least_latest)
+
+    async def max_fee_per_gas(self,
+                              strategy: Union[str, FeeStrategy, None] = None,
+                              at_least_latest: bool = False) -> int:
+        if self.estimate_tx is None:
+            raise RuntimeError("Fee oracle samples zks_estimateFee only with estimate_tx")
+        return await self._suggest(self.max_fees_per_gas, strategy, at_least_latest)
+
+    def attach(self):
+        """
+        Makes suggested_gas_price of module and l1_module use the oracle.
+        """
+        # INFO: kept on the modules, the oracle references them and a global map keyed by them would never free them
+        self.module._attached_fee_oracle = (self, False)
+        if self.l1_module is not None:
+            self.l1_module._attached_fee_oracle = (self, True)
+
+    def detach(self):
+        for module in (self.module, self.l1_module):
+            if module is not None and getattr(module, "_attached_fee_oracle", (None,))[0] is self:
+                module._attached_fee_oracle = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self):
+        while True:
+            try:
+                await self.sample()
+            except Exception as err:
+                self.logger.warning(f"Failed to sample fees: {err}")
+            await asyncio.sleep(self.sample_interval)
+
+
+def _attached_oracle(module: AsyncEth) -> Optional[Tuple[AsyncFeeOracle, bool]]:
+    return getattr(module, "_attached_fee_oracle", None)
+
+
+def fee_oracle(module: AsyncEth) -> Optional[AsyncFeeOracle]:
+    attached = _attached_oracle(module)
+    return None if attached is None else attached[0]
+
+
+async def suggested_gas_price(module: AsyncEth,
+                              strategy: Union[str, FeeStrategy, None] = None,
+                              at_least_latest: bool = True) -> int:
+    """
+    Gas price to send with: the suggestion of the fee oracle attached to module (as L2 or L1 module),
+    or the gas price of the node. By default it's not lower than the latest sample, a price under
+    the current one may not be accepted until fees drop, pass at_least_latest=False to wait for that.
+    """
+    attached = _attached_oracle(module)
+    if attached is None:
+        return await module.gas_price
+    oracle, is_l1 = attached
+    try:
+        if is_l1:
+            return await oracle.l1_gas_price(strategy, at_least_latest)
+        return await oracle.gas_price(strategy, at_least_latest)
+    except Exception as err:
+        oracle.logger.warning(f"Fee oracle failed, using gas price of the node: {err}")
+        return await module.gas_price
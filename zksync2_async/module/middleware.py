@@ -1,17 +1,63 @@
-from typing import Callable
+from typing import Callable, Union, Iterable
 
 from web3 import AsyncWeb3
 from web3.middleware import AsyncMiddleware
+from web3.providers import AsyncBaseProvider
 from web3.types import RPCEndpoint, RPCResponse, AsyncMiddlewareCoroutine, Middleware
 from typing import Any
 
+from zksync2_async.module.rpc_cache import SingleFlight
 from zksync2_async.module.zksync_provider import AsyncZkSyncProvider
 
+COALESCED_METHODS = frozenset([
+    "eth_chainId",
+    "eth_gasPrice",
+    "eth_blockNumber",
+    "eth_getBalance",
+    "eth_getCode",
+    "eth_getTransactionCount",
+    "eth_getTransactionReceipt",
+    "eth_getTransactionByHash",
+    "eth_getBlockByNumber",
+    "eth_getBlockByHash",
+    "eth_call",
+    "zks_getMainContract",
+    "zks_L1ChainId",
+    "zks_getBridgeContracts",
+    "zks_getTestnetPaymaster",
+    "zks_getConfirmedTokens",
+    "zks_getTokenPrice",
+    "zks_getAllAccountBalances",
+    "zks_getL2ToL1LogProof",
+    "zks_getL2ToL1MsgProof",
+])
+
+SEND_METHODS = frozenset([
+    "eth_sendRawTransaction",
+    "eth_sendTransaction",
+    "zks_setContractDebugInfo",
+])
+
+
+async def zksync_construct_async_middleware(zksync_provider: Union[AsyncZkSyncProvider, AsyncBaseProvider],
+                                            coalesce: bool = False,
+                                            coalesced_methods: Iterable[str] = COALESCED_METHODS) -> AsyncMiddleware:
+    """
+    With coalesce identical concurrent requests of coalesced_methods (same method and params)
+    are sent once, every caller gets the response of that single request.
+    """
+    coalesced_methods = frozenset(coalesced_methods)
+    merged_sends = coalesced_methods & SEND_METHODS
+    if len(merged_sends) > 0:
+        raise ValueError(f"Send methods can't be coalesced: {sorted(merged_sends)}")
+    single_flight = SingleFlight()
 
-async def zksync_construct_async_middleware(zksync_provider: AsyncZkSyncProvider) -> AsyncMiddleware:
     async def _zksync_async_middleware(make_request: Callable[[RPCEndpoint, Any], Any],
                                       w3: AsyncWeb3) -> AsyncMiddlewareCoroutine:
         async def middleware(method: RPCEndpoint, params: Any) -> RPCResponse:
+            if coalesce and method in coalesced_methods:
+                return await single_flight.run((method, repr(params)),
+                                               lambda: zksync_provider.make_request(method, params))
             return await zksync_provider.make_request(method, params)
 
         return middleware
@@ -21,4 +67,4 @@ async def zksync_construct_async_middleware(zksync_provider: AsyncZkSyncProvider
 
 async def zksync_async_middleware(make_request: Callable[[RPCEndpoint, Any], Any], async_w3: "AsyncZkSyncProvider") -> Middleware:
     middleware = await zksync_construct_async_middleware(async_w3)
-    return await middleware(make_request, async_w3)
\ No newline at end of file
+    return await middleware(make_request, async_w3)
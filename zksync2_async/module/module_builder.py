@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Optional, Generator, Any, Union
 
 from web3 import AsyncHTTPProvider
 from web3.providers import AsyncBaseProvider
@@ -6,16 +6,61 @@ from web3.providers import AsyncBaseProvider
 from zksync2_async.module.zksync_web3 import AsyncZkSyncWeb3
 from zksync2_async.module.zksync_module import AsyncZkSyncModule
 from zksync2_async.module.zksync_provider import AsyncZkSyncProvider
+from zksync2_async.module.zksync_multi_provider import AsyncZkSyncMultiProvider
 from zksync2_async.module.middleware import zksync_construct_async_middleware
 
 
-class AsyncZkSyncBuilder:
-    @classmethod
-    async def build(cls, zksync_provider: AsyncZkSyncProvider, web3_provider: Optional[AsyncBaseProvider] = None) -> AsyncZkSyncWeb3:
+class AsyncZkSyncConnection:
+    """
+    Result of AsyncZkSyncBuilder.build, can be awaited for the AsyncZkSyncWeb3 instance
+    or used as ``async with`` block which closes the provider sessions on exit.
+    """
+
+    def __init__(self,
+                 zksync_provider: Union[AsyncZkSyncProvider, AsyncZkSyncMultiProvider],
+                 web3_provider: Optional[AsyncBaseProvider],
+                 coalesce_requests: bool = False):
+        self.zksync_provider = zksync_provider
+        self.web3_provider = web3_provider
+        self.coalesce_requests = coalesce_requests
+        self.web3: Optional[AsyncZkSyncWeb3] = None
+
+    async def _build(self) -> AsyncZkSyncWeb3:
+        web3_provider = self.web3_provider
         if not web3_provider:
             web3_provider = AsyncHTTPProvider()
         web3_module = AsyncZkSyncWeb3(web3_provider)
-        zksync_middleware = await zksync_construct_async_middleware(zksync_provider)
+        web3_module.zksync_provider = self.zksync_provider
+        zksync_middleware = await zksync_construct_async_middleware(self.zksync_provider,
+                                                                    coalesce=self.coalesce_requests)
         web3_module.middleware_onion.add(zksync_middleware)
         web3_module.attach_modules({"zksync": (AsyncZkSyncModule,)})
+        self.web3 = web3_module
         return web3_module
+
+    def __await__(self) -> Generator[Any, None, AsyncZkSyncWeb3]:
+        return self._build().__await__()
+
+    async def __aenter__(self) -> AsyncZkSyncWeb3:
+        return await self._build()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def close(self):
+        if self.web3 is not None:
+            await self.web3.zksync.stop_receipt_watcher()
+            await self.web3.zksync.stop_block_tracker()
+            await self.web3.zksync.stop_token_registry()
+            await self.web3.zksync.stop_fee_oracle()
+        if hasattr(self.zksync_provider, "disconnect"):
+            await self.zksync_provider.disconnect()
+
+
+class AsyncZkSyncBuilder:
+    @classmethod
+    def build(cls,
+              zksync_provider: Union[AsyncZkSyncProvider, AsyncZkSyncMultiProvider],
+              web3_provider: Optional[AsyncBaseProvider] = None,
+              coalesce_requests: bool = False) -> AsyncZkSyncConnection:
+        return AsyncZkSyncConnection(zksync_provider, web3_provider, coalesce_requests)
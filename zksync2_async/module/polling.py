@@ -0,0 +1,108 @@
+import random
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterator, Union, Optional
+
+
+@dataclass
+class PollingMetrics:
+    polls: int = 0
+    resolved: int = 0
+    timeouts: int = 0
+
+    def record(self, polls: int, resolved: bool):
+        self.polls += polls
+        if resolved:
+            self.resolved += 1
+        else:
+            self.timeouts += 1
+
+    @property
+    def polls_per_resolved(self) -> float:
+        if self.resolved == 0:
+            return 0.0
+        return self.polls / self.resolved
+
+
+class PollingPolicy(ABC):
+    """
+    Produces the delays between polls of one waiting loop and collects poll metrics,
+    one instance can be shared by many loops.
+    """
+
+    def __init__(self):
+        self.metrics = PollingMetrics()
+
+    @abstractmethod
+    def delays(self) -> Iterator[float]:
+        raise NotImplementedError
+
+
+class FixedPolling(PollingPolicy):
+
+    def __init__(self, latency: float):
+        super(FixedPolling, self).__init__()
+        self.latency = latency
+
+    def delays(self) -> Iterator[float]:
+        while True:
+            yield self.latency
+
+
+class ExponentialBackoffPolling(PollingPolicy):
+    """
+    Delays grow from initial by factor up to max_delay,
+    each one is randomized by +-jitter share of it.
+    """
+
+    def __init__(self,
+                 initial: float = 0.1,
+                 factor: float = 2.0,
+                 max_delay: float = 5.0,
+                 jitter: float = 0.1,
+                 rng: Optional[random.Random] = None):
+        super(ExponentialBackoffPolling, self).__init__()
+        self.initial = initial
+        self.factor = factor
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.rng = rng if rng is not None else random.Random()
+
+    def _jittered(self, delay: float) -> float:
+        if self.jitter == 0:
+            return delay
+        return max(0.0, delay * (1 + self.rng.uniform(-self.jitter, self.jitter)))
+
+    def delays(self) -> Iterator[float]:
+        delay = self.initial
+        while True:
+            yield self._jittered(delay)
+            delay = min(delay * self.factor, self.max_delay)
+
+
+class BlockTimePolling(ExponentialBackoffPolling):
+    """
+    Polls quickly right after a send, then backs off to the block time, so a waiting loop
+    polls about once per block. Delays never exceed max_delay.
+    """
+
+    def __init__(self,
+                 block_time: float = 1.0,
+                 initial: float = 0.2,
+                 max_delay: Optional[float] = None,
+                 jitter: float = 0.1,
+                 rng: Optional[random.Random] = None):
+        if max_delay is None:
+            max_delay = block_time
+        super(BlockTimePolling, self).__init__(initial=min(initial, block_time),
+                                               factor=2.0,
+                                               max_delay=min(block_time, max_delay),
+                                               jitter=jitter,
+                                               rng=rng)
+        self.block_time = block_time
+
+
+def as_polling_policy(poll_latency: Union[float, PollingPolicy]) -> PollingPolicy:
+    if isinstance(poll_latency, PollingPolicy):
+        return poll_latency
+    return FixedPolling(poll_latency)
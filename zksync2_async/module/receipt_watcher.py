@@ -0,0 +1,183 @@
+import asyncio
+import logging
+from contextlib import aclosing
+from typing import Dict, Optional, Callable, AsyncIterator, List
+
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+from web3.eth import AsyncEth
+from web3.exceptions import TimeExhausted
+from web3.types import _Hash32, TxReceipt, BlockNumber
+
+BlockSource = Callable[[], AsyncIterator[BlockNumber]]
+
+
+def polling_block_source(module: AsyncEth, poll_latency: float = 0.5) -> BlockSource:
+    """
+    Yields every new head block number, found by polling eth_blockNumber.
+    """
+    async def _poll() -> AsyncIterator[BlockNumber]:
+        last_block = None
+        while True:
+            block_number = await module.block_number
+            if last_block is None or block_number > last_block:
+                last_block = block_number
+                yield block_number
+            await asyncio.sleep(poll_latency)
+
+    return _poll
+
+
+def websocket_block_source(ws_web3: AsyncWeb3) -> BlockSource:
+    """
+    Yields new head block numbers from an eth_subscribe("newHeads") subscription,
+    ws_web3 must be connected with a persistent websocket provider. The subscription
+    is removed when the iterator is closed.
+    """
+    async def _subscribe() -> AsyncIterator[BlockNumber]:
+        subscription_id = await ws_web3.eth.subscribe("newHeads")
+        try:
+            async for message in ws_web3.ws.process_subscriptions():
+                if message.get("subscription", subscription_id) != subscription_id:
+                    continue
+                number = message["result"]["number"]
+                if isinstance(number, str):
+                    number = int(number, 16)
+                yield BlockNumber(number)
+        finally:
+            try:
+                await ws_web3.eth.unsubscribe(subscription_id)
+            except Exception as err:
+                AsyncReceiptWatcher.logger.warning(f"Failed to unsubscribe {subscription_id}: {err}")
+
+    return _subscribe
+
+
+class AsyncReceiptWatcher:
+    """
+    Resolves receipts of many pending transactions with one block follower.
+
+    Waiters register a transaction hash and await a shared future. On every new block
+    the receipts of all tracked hashes are fetched at once (one JSON-RPC batch when the
+    zkSync provider supports it), so the RPC load depends on the block rate, not on the
+    number of waiting transactions.
+    """
+    logger = logging.getLogger("ReceiptWatcher")
+
+    def __init__(self,
+                 module: AsyncEth,
+                 block_source: Optional[BlockSource] = None,
+                 poll_latency: float = 0.5):
+        self.module = module
+        if block_source is None:
+            block_source = polling_block_source(module, poll_latency)
+        self.block_source = block_source
+        self.latest_block: Optional[BlockNumber] = None
+        self._futures: Dict[HexBytes, asyncio.Future] = dict()
+        self._waiters: Dict[HexBytes, int] = dict()
+        self._wake: Optional[asyncio.Event] = None
+        self._follower: Optional[asyncio.Task] = None
+        self._checker: Optional[asyncio.Task] = None
+
+    @property
+    def tracked(self) -> int:
+        return len(self._futures)
+
+    def _ensure_running(self):
+        if self._wake is None:
+            self._wake = asyncio.Event()
+        if self._follower is None or self._follower.done():
+            self._follower = asyncio.ensure_future(self._follow_blocks())
+        if self._checker is None or self._checker.done():
+            self._checker = asyncio.ensure_future(self._check_loop())
+
+    async def _follow_blocks(self):
+        while len(self._futures) > 0:
+            try:
+                # INFO: close the source on every exit, e.g. to drop its websocket subscription
+                async with aclosing(self.block_source()) as blocks:
+                    async for block_number in blocks:
+                        self.latest_block = block_number
+                        self._wake.set()
+                        if len(self._futures) == 0:
+                            break
+            except Exception as err:
+                self.logger.warning(f"Block source failed: {err}")
+                await asyncio.sleep(1)
+        self._follower = None
+
+    async def _check_loop(self):
+        while len(self._futures) > 0:
+            await self._wake.wait()
+            self._wake.clear()
+            try:
+                await self.check()
+            except Exception as err:
+                self.logger.warning(f"Failed to fetch receipts: {err}")
+        self._checker = None
+
+    async def _fetch_receipts(self, tx_hashes: List[HexBytes]) -> list:
+        provider = getattr(self.module.w3, "zksync_provider", None)
+        if provider is not None and hasattr(provider, "batch"):
+            async with provider.batch():
+                tasks = [asyncio.ensure_future(self.module.get_transaction_receipt(h)) for h in tx_hashes]
+        else:
+            tasks = [self.module.get_transaction_receipt(h) for h in tx_hashes]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def check(self):
+        """
+        Fetches receipts of all tracked transactions and resolves the mined ones.
+        """
+        tx_hashes = list(self._futures.keys())
+        if len(tx_hashes) == 0:
+            return
+        receipts = await self._fetch_receipts(tx_hashes)
+        for tx_hash, receipt in zip(tx_hashes, receipts):
+            if isinstance(receipt, Exception) or receipt is None or receipt["blockHash"] is None:
+                continue
+            future = self._futures.pop(tx_hash, None)
+            if future is not None and not future.done():
+                future.set_result(receipt)
+
+    async def wait_for(self, transaction_hash: _Hash32, timeout: float = 120) -> TxReceipt:
+        tx_hash = HexBytes(transaction_hash)
+        future = self._futures.get(tx_hash)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._futures[tx_hash] = future
+        self._waiters[tx_hash] = self._waiters.get(tx_hash, 0) + 1
+        self._ensure_running()
+        # INFO: check right away, the transaction may be already mined
+        self._wake.set()
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise TimeExhausted(
+                f"Transaction {tx_hash !r} is not in the chain "
+                f"after {timeout} seconds"
+            )
+        finally:
+            self._release(tx_hash)
+
+    def _release(self, tx_hash: HexBytes):
+        waiters = self._waiters.get(tx_hash, 1) - 1
+        if waiters > 0:
+            self._waiters[tx_hash] = waiters
+            return
+        self._waiters.pop(tx_hash, None)
+        future = self._futures.pop(tx_hash, None)
+        if future is not None and not future.done():
+            future.cancel()
+
+    async def stop(self):
+        for future in self._futures.values():
+            if not future.done():
+                future.cancel()
+        self._futures.clear()
+        self._waiters.clear()
+        for task in (self._follower, self._checker):
+            if task is not None and not task.done():
+                task.cancel()
+        self._follower = None
+        self._checker = None
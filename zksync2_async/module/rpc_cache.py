@@ -0,0 +1,221 @@
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Any, Callable, Awaitable, Dict, Hashable, Tuple
+
+from web3.method import Method
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    ttl - seconds a result stays valid, None means the value never changes (chain id,
+    main contract address) and is cached for the life of the module.
+    """
+    ttl: Optional[float] = None
+
+
+PERMANENT = CachePolicy()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    shared: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses + self.shared
+        if total == 0:
+            return 0.0
+        return (self.hits + self.shared) / total
+
+
+class _Flight:
+
+    def __init__(self):
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        # INFO: nobody may wait for the shared future, don't report its exception as unretrieved
+        self.future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self.followers = 0
+        self.task: Optional[asyncio.Task] = None
+
+
+class SingleFlight:
+    """
+    Runs one fetch per key at a time, concurrent callers of a key being fetched
+    await the same result (or exception).
+
+    The first caller fetches inline (so the request stays in the batch of the caller). When it is
+    cancelled while others wait, the fetch is restarted in a task for them instead of cancelling them.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, _Flight] = dict()
+        self.calls = 0
+        self.shared = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._in_flight
+
+    def __len__(self):
+        return len(self._in_flight)
+
+    def _settle(self, key: Hashable, flight: _Flight, task: asyncio.Task):
+        if self._in_flight.get(key) is flight:
+            del self._in_flight[key]
+        if flight.future.done():
+            return
+        if task.cancelled():
+            flight.future.cancel()
+        elif task.exception() is not None:
+            flight.future.set_exception(task.exception())
+        else:
+            flight.future.set_result(task.result())
+
+    async def _follow(self, flight: _Flight) -> Any:
+        self.shared += 1
+        flight.followers += 1
+        try:
+            return await asyncio.shield(flight.future)
+        finally:
+            flight.followers -= 1
+            if flight.followers == 0 and flight.task is not None and not flight.task.done():
+                flight.task.cancel()
+
+    async def run(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        flight = self._in_flight.get(key)
+        if flight is not None:
+            return await self._follow(flight)
+
+        self.calls += 1
+        flight = _Flight()
+        self._in_flight[key] = flight
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            if flight.followers > 0:
+                flight.task = asyncio.ensure_future(fetch())
+                flight.task.add_done_callback(lambda t: self._settle(key, flight, t))
+            else:
+                self._in_flight.pop(key, None)
+                flight.future.cancel()
+            raise
+        except Exception as err:
+            self._in_flight.pop(key, None)
+            flight.future.set_exception(err)
+            raise
+        self._in_flight.pop(key, None)
+        flight.future.set_result(value)
+        return value
+
+
+class RPCResultCache:
+    """
+    LRU cache of RPC results with per method TTL and single-flight loading:
+    concurrent misses of one key share a single in-flight request.
+
+    ttl_overrides maps an RPC method name to the TTL used instead of the one
+    declared on its CachedMethod.
+    """
+
+    def __init__(self,
+                 max_size: int = 1024,
+                 ttl_overrides: Optional[Dict[str, Optional[float]]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_size = max_size
+        self.ttl_overrides = dict(ttl_overrides or {})
+        self.clock = clock
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._single_flight = SingleFlight()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def ttl(self, method: str, policy: CachePolicy) -> Optional[float]:
+        return self.ttl_overrides.get(method, policy.ttl)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= self.clock():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float]):
+        expires_at = None if ttl is None else self.clock() + ttl
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def get_or_fetch(self,
+                           key: Hashable,
+                           ttl: Optional[float],
+                           fetch: Callable[[], Awaitable[Any]]) -> Any:
+        found, value = self.get(key)
+        if found:
+            self.stats.hits += 1
+            return value
+        if key in self._single_flight:
+            self.stats.shared += 1
+        else:
+            self.stats.misses += 1
+
+        async def _fetch_and_store():
+            result = await fetch()
+            self.put(key, result, ttl)
+            return result
+
+        return await self._single_flight.run(key, _fetch_and_store)
+
+    def discard(self, key: Hashable) -> bool:
+        """
+        Drops the result of one key, returns True if it was cached.
+        """
+        return self._entries.pop(key, None) is not None
+
+    def invalidate(self, method: Optional[str] = None):
+        """
+        Drops cached results of the RPC method, or all of them.
+        """
+        if method is None:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if k[0] == method]:
+            del self._entries[key]
+
+
+class CachedMethod(Method):
+    """
+    web3 Method whose results are kept in the rpc_cache of the module it's bound to,
+    modules without rpc_cache call the node every time.
+    """
+
+    def __init__(self, json_rpc_method: str, cache_policy: CachePolicy = PERMANENT, **kwargs):
+        super(CachedMethod, self).__init__(json_rpc_method, **kwargs)
+        self.cache_policy = cache_policy
+
+    def __get__(self, obj=None, obj_type=None):
+        caller = super(CachedMethod, self).__get__(obj, obj_type)
+        cache: Optional[RPCResultCache] = getattr(obj, "rpc_cache", None)
+        if cache is None:
+            return caller
+        method = self.json_rpc_method
+
+        async def cached_caller(*args, **kwargs):
+            key = (method, repr(args), repr(sorted(kwargs.items())))
+            return await cache.get_or_fetch(key,
+                                            cache.ttl(method, self.cache_policy),
+                                            lambda: caller(*args, **kwargs))
+
+        return cached_caller
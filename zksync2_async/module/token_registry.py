@@ -0,0 +1,164 @@
+import asyncio
+import json
+import logging
+import os
+from dataclasses import asdict
+from typing import Dict, List, Optional
+
+from eth_typing import HexStr
+
+from zksync2_async.core.types import Token
+from zksync2_async.utils.rpc_endpoints import zks_get_confirmed_tokens_rpc
+
+
+class AsyncTokenRegistry:
+    """
+    In-memory index of zks_getConfirmedTokens by l1 address, l2 address and symbol.
+
+    refresh() pages through the tokens not indexed yet, concurrency pages at once,
+    so a background refresh costs one round trip when nothing changed. With
+    snapshot_path the index is loaded from and saved to a JSON file, a new process
+    only fetches the tokens confirmed after the snapshot.
+    """
+    logger = logging.getLogger("TokenRegistry")
+
+    def __init__(self,
+                 module,
+                 page_size: int = 100,
+                 concurrency: int = 4,
+                 refresh_interval: float = 300.0,
+                 snapshot_path: Optional[str] = None):
+        self.module = module
+        self.page_size = page_size
+        self.concurrency = concurrency
+        self.refresh_interval = refresh_interval
+        self.snapshot_path = snapshot_path
+        self.tokens: List[Token] = []
+        self._by_l1: Dict[str, Token] = dict()
+        self._by_l2: Dict[str, Token] = dict()
+        self._by_symbol: Dict[str, Token] = dict()
+        # INFO: pagination cursor, tokens returned by the node including skipped duplicates
+        self._fetched = 0
+        self._refresh_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self):
+        return len(self.tokens)
+
+    def by_l1_address(self, l1_address: HexStr) -> Optional[Token]:
+        return self._by_l1.get(l1_address.lower())
+
+    def by_l2_address(self, l2_address: HexStr) -> Optional[Token]:
+        return self._by_l2.get(l2_address.lower())
+
+    def by_symbol(self, symbol: str) -> Optional[Token]:
+        """
+        Symbols are not unique, the first confirmed token with the symbol is returned.
+        """
+        return self._by_symbol.get(symbol)
+
+    def l2_address(self, l1_address: HexStr) -> Optional[HexStr]:
+        token = self.by_l1_address(l1_address)
+        return None if token is None else token.l2_address
+
+    def l1_address(self, l2_address: HexStr) -> Optional[HexStr]:
+        token = self.by_l2_address(l2_address)
+        return None if token is None else token.l1_address
+
+    def _add(self, token: Token) -> bool:
+        l2_key = token.l2_address.lower()
+        if l2_key in self._by_l2:
+            return False
+        self.tokens.append(token)
+        self._by_l2[l2_key] = token
+        self._by_l1.setdefault(token.l1_address.lower(), token)
+        self._by_symbol.setdefault(token.symbol, token)
+        return True
+
+    def clear(self):
+        self.tokens.clear()
+        self._by_l1.clear()
+        self._by_l2.clear()
+        self._by_symbol.clear()
+        self._fetched = 0
+
+    async def _fetch_page(self, offset: int) -> List[Token]:
+        return await self.module.zks_get_confirmed_tokens(offset, self.page_size)
+
+    async def refresh(self, full: bool = False) -> int:
+        """
+        Fetches the tokens confirmed since the last refresh, returns how many were added.
+        """
+        async with self._refresh_lock:
+            rpc_cache = getattr(self.module, "rpc_cache", None)
+            if rpc_cache is not None:
+                # INFO: the last page is cached for a while, the registry needs fresh pages
+                rpc_cache.invalidate(zks_get_confirmed_tokens_rpc)
+            if full:
+                self.clear()
+            added = 0
+            while True:
+                offsets = [self._fetched + i * self.page_size for i in range(self.concurrency)]
+                pages = await asyncio.gather(*[self._fetch_page(o) for o in offsets])
+                for offset, page in zip(offsets, pages):
+                    for token in page:
+                        added += self._add(token)
+                    self._fetched = offset + len(page)
+                    if len(page) < self.page_size:
+                        return added
+
+    def load_snapshot(self) -> int:
+        """
+        Indexes the tokens of snapshot_path, returns how many were added.
+        """
+        if self.snapshot_path is None or not os.path.exists(self.snapshot_path):
+            return 0
+        with open(self.snapshot_path, "r") as snapshot:
+            entries = json.load(snapshot)
+        fetched = None
+        if isinstance(entries, dict):
+            fetched, entries = entries["fetched"], entries["tokens"]
+        added = sum(self._add(Token(**entry)) for entry in entries)
+        # INFO: snapshots without a cursor hold no duplicates they could have skipped
+        self._fetched = max(self._fetched, len(entries) if fetched is None else fetched)
+        return added
+
+    def save_snapshot(self):
+        if self.snapshot_path is None:
+            return
+        tmp_path = self.snapshot_path + ".tmp"
+        with open(tmp_path, "w") as snapshot:
+            json.dump({"fetched": self._fetched, "tokens": [asdict(token) for token in self.tokens]}, snapshot)
+        os.replace(tmp_path, self.snapshot_path)
+
+    async def load(self) -> "AsyncTokenRegistry":
+        """
+        Loads the snapshot and fetches the tokens confirmed after it.
+        """
+        self.load_snapshot()
+        if await self.refresh() > 0:
+            self.save_snapshot()
+        return self
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self):
+        # INFO: start() follows load(), the first refresh waits for the interval
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                if await self.refresh() > 0:
+                    self.save_snapshot()
+            except Exception as err:
+                self.logger.warning(f"Failed to refresh tokens: {err}")
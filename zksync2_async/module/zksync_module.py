@@ -6,17 +6,29 @@ from web3 import AsyncWeb3
 from web3.exceptions import TransactionNotFound, TimeExhausted
 
 from web3.eth import AsyncEth
-from web3.types import _Hash32, TxReceipt
+from web3._utils.rpc_abi import RPC
+from web3.types import _Hash32, TxReceipt, Wei, Nonce
 from zksync2_async.core.response_types import ZksEstimateFee, ZksMainContract, ZksTokens, ZksTokenPrice, \
     ZksL1ChainId, ZksAccountBalances, ZksBridgeAddresses, ZksTransactionTrace, ZksSetContractDebugInfoResult
 from zksync2_async.core.types import Limit, From, ContractSourceDebugInfo, \
     BridgeAddresses, TokenAddress, ZksMessageProof, Fee, Token
 from zksync2_async.manage_contracts.zksync_contract import AsyncZkSyncContract
-from zksync2_async.utils.formatters import zksync_get_request_formatters, zksync_get_result_formatters
+from zksync2_async.transaction.nonce_manager import AsyncNonceManager, nonce_manager
+from zksync2_async.transaction.transaction712 import Transaction712
+from zksync2_async.module.receipt_watcher import AsyncReceiptWatcher, BlockSource
+from zksync2_async.module.block_tracker import AsyncBlockTracker
+from zksync2_async.module.token_registry import AsyncTokenRegistry
+from zksync2_async.module.balance_stream import BalanceRecord, stream_account_balances
+from zksync2_async.module.polling import PollingPolicy, as_polling_policy
+from zksync2_async.module.estimate_cache import GasEstimateCache
+from zksync2_async.module.fee_oracle import AsyncFeeOracle, FeeStrategy, suggested_gas_price
+from zksync2_async.module.rpc_cache import CachedMethod, CachePolicy, RPCResultCache, PERMANENT
+from zksync2_async.utils.formatters import zksync_get_request_formatters, zksync_get_result_formatters, \
+    zksync_transaction_munger, meta_bytes_formatter
 from zksync2_async.core.request_types import *
 from eth_typing import Address
 from web3.method import Method, default_root_munger
-from typing import Callable, List, Awaitable
+from typing import Callable, List, Awaitable, Union, AsyncIterable, AsyncIterator, Iterable, Tuple
 
 from zksync2_async.utils.rpc_endpoints import zks_estimate_fee_rpc, zks_main_contract_rpc, zks_get_confirmed_tokens_rpc, \
     zks_get_token_price_rpc, zks_l1_chain_id_rpc, zks_get_all_account_balances_rpc, zks_get_bridge_contracts_rpc, \
@@ -28,18 +40,20 @@ from zksync2_async.utils.rpc_endpoints import zks_estimate_fee_rpc, zks_main_con
 class AsyncZkSyncModule(AsyncEth, ABC):
     _zks_estimate_fee: Method[Callable[[Transaction], Awaitable[ZksEstimateFee]]] = Method(
         zks_estimate_fee_rpc,
-        mungers=[default_root_munger],
+        mungers=[zksync_transaction_munger],
         request_formatters=zksync_get_request_formatters,
         result_formatters=zksync_get_result_formatters
     )
 
-    _zks_main_contract: Method[Callable[[], Awaitable[ZksMainContract]]] = Method(
+    _zks_main_contract: Method[Callable[[], Awaitable[ZksMainContract]]] = CachedMethod(
         zks_main_contract_rpc,
+        cache_policy=PERMANENT,
         mungers=None
     )
 
-    _zks_get_confirmed_tokens: Method[Callable[[From, Limit], Awaitable[ZksTokens]]] = Method(
+    _zks_get_confirmed_tokens: Method[Callable[[From, Limit], Awaitable[ZksTokens]]] = CachedMethod(
         zks_get_confirmed_tokens_rpc,
+        cache_policy=CachePolicy(ttl=60),
         mungers=[default_root_munger],
         result_formatters=zksync_get_result_formatters
     )
@@ -49,8 +63,9 @@ class AsyncZkSyncModule(AsyncEth, ABC):
         mungers=[default_root_munger]
     )
 
-    _zks_l1_chain_id: Method[Callable[[], Awaitable[ZksL1ChainId]]] = Method(
+    _zks_l1_chain_id: Method[Callable[[], Awaitable[ZksL1ChainId]]] = CachedMethod(
         zks_l1_chain_id_rpc,
+        cache_policy=PERMANENT,
         mungers=None
     )
 
@@ -60,8 +75,9 @@ class AsyncZkSyncModule(AsyncEth, ABC):
         result_formatters=zksync_get_result_formatters
     )
 
-    _zks_get_bridge_contracts: Method[Callable[[], Awaitable[ZksBridgeAddresses]]] = Method(
+    _zks_get_bridge_contracts: Method[Callable[[], Awaitable[ZksBridgeAddresses]]] = CachedMethod(
         zks_get_bridge_contracts_rpc,
+        cache_policy=PERMANENT,
         mungers=[default_root_munger],
         result_formatters=zksync_get_result_formatters
     )
@@ -82,7 +98,7 @@ class AsyncZkSyncModule(AsyncEth, ABC):
 
     _eth_estimate_gas: Method[Callable[[Transaction], Awaitable[int]]] = Method(
         eth_estimate_gas_rpc,
-        mungers=[default_root_munger],
+        mungers=[zksync_transaction_munger],
         request_formatters=zksync_get_request_formatters
     )
 
@@ -103,23 +119,70 @@ class AsyncZkSyncModule(AsyncEth, ABC):
         mungers=[default_root_munger]
     )
 
-    _zks_get_testnet_paymaster_address: Method[Callable[[], Awaitable[HexStr]]] = Method(
+    _zks_get_testnet_paymaster_address: Method[Callable[[], Awaitable[HexStr]]] = CachedMethod(
         zks_get_testnet_paymaster_address,
+        cache_policy=PERMANENT,
         mungers=[default_root_munger]
     )
 
+    _chain_id: Method[Callable[[], Awaitable[int]]] = CachedMethod(
+        RPC.eth_chainId,
+        cache_policy=PERMANENT,
+        is_property=True
+    )
+
+    _gas_price: Method[Callable[[], Awaitable[Wei]]] = CachedMethod(
+        RPC.eth_gasPrice,
+        cache_policy=CachePolicy(ttl=5),
+        is_property=True
+    )
+
     def __init__(self, web3: "AsyncWeb3"):
         super(AsyncZkSyncModule, self).__init__(web3)
-        self.main_contract_address = None
-        self.bridge_addresses = None
+        self.rpc_cache: Optional[RPCResultCache] = RPCResultCache()
+        self.receipt_watcher: Optional[AsyncReceiptWatcher] = None
+        self.block_tracker: Optional[AsyncBlockTracker] = None
+        self.token_registry: Optional[AsyncTokenRegistry] = None
+        self.estimate_cache: Optional[GasEstimateCache] = None
+        self.fee_oracle: Optional[AsyncFeeOracle] = None
+        self._meta_bytes_encoding = "list"
+
+    @property
+    def meta_bytes_encoding(self) -> str:
+        """
+        Encoding of factory deps and paymaster input in eip712Meta of estimate requests, "list" or "hex".
+        """
+        return self._meta_bytes_encoding
+
+    @meta_bytes_encoding.setter
+    def meta_bytes_encoding(self, encoding: str):
+        meta_bytes_formatter(encoding)
+        self._meta_bytes_encoding = encoding
+
+    def nonce_manager(self, address: HexStr) -> AsyncNonceManager:
+        return nonce_manager(self, address)
 
     async def zks_estimate_fee(self, transaction: Transaction) -> Fee:
+        if self.estimate_cache is not None:
+            return await self.estimate_cache.estimate(zks_estimate_fee_rpc,
+                                                      transaction,
+                                                      lambda: self._zks_estimate_fee(transaction),
+                                                      self._fee_prices)
         return await self._zks_estimate_fee(transaction)
 
+    async def _fee_prices(self) -> Tuple[int, int]:
+        """
+        Current max fee and max priority fee per gas for fees of cached estimates.
+        """
+        if self.fee_oracle is not None and self.fee_oracle.estimate_tx is not None:
+            max_fee_per_gas = await self.fee_oracle.max_fee_per_gas(at_least_latest=True)
+        else:
+            max_fee_per_gas = await suggested_gas_price(self)
+        # INFO: zkSync operator doesn't take priority fees, zks_estimateFee returns 0 as well
+        return max_fee_per_gas, 0
+
     async def zks_main_contract(self) -> HexStr:
-        if self.main_contract_address is None:
-            self.main_contract_address = await self._zks_main_contract()
-        return self.main_contract_address
+        return await self._zks_main_contract()
 
     async def zks_get_confirmed_tokens(self, offset: From, limit: Limit) -> List[Token]:
         return await self._zks_get_confirmed_tokens(offset, limit)
@@ -133,10 +196,18 @@ class AsyncZkSyncModule(AsyncEth, ABC):
     async def zks_get_all_account_balances(self, addr: Address) -> ZksAccountBalances:
         return await self._zks_get_all_account_balances(addr)
 
+    def stream_account_balances(self,
+                                addresses: Union[AsyncIterable[HexStr], Iterable[HexStr]],
+                                batch_size: int = 50,
+                                concurrency: int = 4) -> AsyncIterator[BalanceRecord]:
+        """
+        zks_get_all_account_balances of many addresses as a stream of (address, token, amount),
+        see stream_account_balances.
+        """
+        return stream_account_balances(self, addresses, batch_size=batch_size, concurrency=concurrency)
+
     async def zks_get_bridge_contracts(self) -> BridgeAddresses:
-        if self.bridge_addresses is None:
-            self.bridge_addresses = await self._zks_get_bridge_contracts()
-        return self.bridge_addresses
+        return await self._zks_get_bridge_contracts()
 
     async def zks_get_l2_to_l1_msg_proof(self,
                                    block: int,
@@ -152,8 +223,82 @@ class AsyncZkSyncModule(AsyncEth, ABC):
         return AsyncWeb3.to_checksum_address(await self._zks_get_testnet_paymaster_address())
 
     async def eth_estimate_gas(self, tx: Transaction) -> int:
+        if self.estimate_cache is not None:
+            return await self.estimate_cache.estimate(eth_estimate_gas_rpc, tx, lambda: self._eth_estimate_gas(tx))
         return await self._eth_estimate_gas(tx)
 
+    def enable_estimate_cache(self,
+                              margin: float = 0.2,
+                              ttl: Optional[float] = 60.0,
+                              max_size: int = 1024) -> GasEstimateCache:
+        """
+        Makes eth_estimate_gas and zks_estimate_fee reuse estimates of transactions of the same shape,
+        see GasEstimateCache.
+        """
+        if self.estimate_cache is None:
+            self.estimate_cache = GasEstimateCache(margin=margin, ttl=ttl, max_size=max_size)
+        return self.estimate_cache
+
+    def track_estimate(self, transaction_hash: _Hash32, tx: Transaction):
+        """
+        Registers a sent transaction, its reverted receipt drops the cached estimate of its shape.
+        """
+        if self.estimate_cache is not None:
+            self.estimate_cache.track(transaction_hash, tx)
+
+    def _observe_receipt(self, receipt: TxReceipt):
+        if self.estimate_cache is not None:
+            self.estimate_cache.observe(receipt)
+
+    async def prepare_transaction(self, tx: Transaction, nonce: Optional[int] = None) -> Transaction712:
+        """
+        Fills chain id, nonce, gas limit and fees of a zkSync transaction (TxBase.tx) and returns
+        it as Transaction712 ready for signing.
+
+        Missing chain id and nonce are fetched together with zks_estimate_fee, in one JSON-RPC
+        batch when the provider supports it. Without nonce argument and transaction nonce the next
+        one of the account nonce manager is allocated, pass a reserved nonce to release it on failure.
+        """
+        if nonce is None:
+            nonce = tx.get("nonce")
+
+        async def _chain_id() -> int:
+            chain_id = tx.get("chain_id")
+            if chain_id is None:
+                chain_id = await self.chain_id
+            return chain_id
+
+        async def _nonce() -> int:
+            if nonce is not None:
+                return nonce
+            return await self.nonce_manager(tx["from"]).next_nonce()
+
+        provider = getattr(self.w3, "zksync_provider", None)
+        if provider is not None and hasattr(provider, "batch"):
+            async with provider.batch():
+                tasks = [asyncio.ensure_future(_chain_id()),
+                         asyncio.ensure_future(_nonce()),
+                         asyncio.ensure_future(self.zks_estimate_fee(tx))]
+        else:
+            tasks = [_chain_id(), _nonce(), self.zks_estimate_fee(tx)]
+        chain_id, tx_nonce, fee = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in (chain_id, tx_nonce, fee):
+            if isinstance(result, BaseException):
+                if nonce is None and not isinstance(tx_nonce, BaseException):
+                    await self.nonce_manager(tx["from"]).release(tx_nonce)
+                raise result
+
+        return Transaction712(chain_id=chain_id,
+                              nonce=Nonce(tx_nonce),
+                              gas_limit=fee.gas_limit,
+                              to=tx["to"],
+                              value=tx["value"],
+                              data=tx["data"],
+                              maxPriorityFeePerGas=fee.max_priority_fee_per_gas,
+                              maxFeePerGas=fee.max_fee_per_gas,
+                              from_=tx["from"],
+                              meta=tx["eip712Meta"])
+
     @staticmethod
     def get_l2_hash_from_priority_op(tx_receipt: TxReceipt, main_contract: AsyncZkSyncContract):
         # TODO: wrong tx hash log extraction, wait transaction on ZkSync side provides timeout error
@@ -166,23 +311,58 @@ class AsyncZkSyncModule(AsyncEth, ABC):
             raise RuntimeError("Failed to parse tx logs")
         return tx_hash
 
-    async def get_l2_transaction_from_priority_op(self, tx_receipt, main_contract: AsyncZkSyncContract):
+    async def get_l2_transaction_from_priority_op(self,
+                                                  tx_receipt,
+                                                  main_contract: AsyncZkSyncContract,
+                                                  timeout: float = 120,
+                                                  poll_latency: Union[float, PollingPolicy] = 0.1):
         l2_hash = self.get_l2_hash_from_priority_op(tx_receipt, main_contract)
         # INFO: loop to get the transaction in chain
-        await self.wait_for_transaction_receipt(l2_hash)
+        await self.wait_for_transaction_receipt(l2_hash, timeout=timeout, poll_latency=poll_latency)
         return await self.get_transaction(l2_hash)
 
-    async def get_priority_op_response(self, tx_receipt, main_contract: AsyncZkSyncContract):
-        tx = await self.get_l2_transaction_from_priority_op(tx_receipt, main_contract)
+    async def get_priority_op_response(self,
+                                       tx_receipt,
+                                       main_contract: AsyncZkSyncContract,
+                                       poll_latency: Union[float, PollingPolicy] = 0.1):
+        tx = await self.get_l2_transaction_from_priority_op(tx_receipt, main_contract, poll_latency=poll_latency)
         return tx
 
+    def start_receipt_watcher(self,
+                              block_source: Optional[BlockSource] = None,
+                              poll_latency: float = 0.5) -> AsyncReceiptWatcher:
+        """
+        Routes wait_for_transaction_receipt through one shared block follower,
+        see AsyncReceiptWatcher.
+        """
+        if self.receipt_watcher is None:
+            self.receipt_watcher = AsyncReceiptWatcher(self, block_source=block_source, poll_latency=poll_latency)
+        return self.receipt_watcher
+
+    async def stop_receipt_watcher(self):
+        if self.receipt_watcher is not None:
+            await self.receipt_watcher.stop()
+            self.receipt_watcher = None
+
     async def wait_for_transaction_receipt(
-            self, transaction_hash: _Hash32, timeout: float = 120, poll_latency: float = 0.1
+            self,
+            transaction_hash: _Hash32,
+            timeout: float = 120,
+            poll_latency: Union[float, PollingPolicy] = 0.1
     ) -> TxReceipt:
-        async def _wait_for_tx_receipt_with_timeout(
-                _tx_hash: _Hash32, _poll_latency: float
-        ) -> TxReceipt:
+        if self.receipt_watcher is not None:
+            receipt = await self.receipt_watcher.wait_for(transaction_hash, timeout=timeout)
+            self._observe_receipt(receipt)
+            return receipt
+
+        policy = as_polling_policy(poll_latency)
+        polls = 0
+
+        async def _wait_for_tx_receipt_with_timeout(_tx_hash: _Hash32) -> TxReceipt:
+            nonlocal polls
+            delays = policy.delays()
             while True:
+                polls += 1
                 try:
                     tx_receipt = await self.get_transaction_receipt(_tx_hash)
                 except TransactionNotFound:
@@ -190,47 +370,154 @@ class AsyncZkSyncModule(AsyncEth, ABC):
                 if tx_receipt is not None and \
                         tx_receipt["blockHash"] is not None:
                     break
-                await asyncio.sleep(_poll_latency)
+                await asyncio.sleep(next(delays))
             return tx_receipt
 
         try:
-            return await asyncio.wait_for(
-                _wait_for_tx_receipt_with_timeout(transaction_hash, poll_latency),
+            receipt = await asyncio.wait_for(
+                _wait_for_tx_receipt_with_timeout(transaction_hash),
                 timeout=timeout,
             )
+            policy.metrics.record(polls, resolved=True)
+            self._observe_receipt(receipt)
+            return receipt
         except asyncio.TimeoutError:
+            policy.metrics.record(polls, resolved=False)
             raise TimeExhausted(
                 f"Transaction {HexBytes(transaction_hash) !r} is not in the chain "
                 f"after {timeout} seconds"
             )
 
+    def start_block_tracker(self, refresh_interval: float = 1.0) -> AsyncBlockTracker:
+        """
+        Makes wait_finalized consult one shared committed/finalized block tracker,
+        see AsyncBlockTracker.
+        """
+        if self.block_tracker is None:
+            self.block_tracker = AsyncBlockTracker(self, refresh_interval=refresh_interval)
+        self.block_tracker.start()
+        return self.block_tracker
+
+    async def stop_block_tracker(self):
+        if self.block_tracker is not None:
+            await self.block_tracker.stop()
+            self.block_tracker = None
+
+    async def start_token_registry(self,
+                                   snapshot_path: Optional[str] = None,
+                                   refresh_interval: float = 300.0,
+                                   page_size: int = 100,
+                                   concurrency: int = 4) -> AsyncTokenRegistry:
+        """
+        Loads the confirmed tokens index and keeps refreshing it in background,
+        see AsyncTokenRegistry.
+        """
+        if self.token_registry is None:
+            self.token_registry = AsyncTokenRegistry(self,
+                                                     page_size=page_size,
+                                                     concurrency=concurrency,
+                                                     refresh_interval=refresh_interval,
+                                                     snapshot_path=snapshot_path)
+            await self.token_registry.load()
+        self.token_registry.start()
+        return self.token_registry
+
+    async def stop_token_registry(self):
+        if self.token_registry is not None:
+            await self.token_registry.stop()
+            self.token_registry = None
+
+    async def start_fee_oracle(self,
+                               l1_module: Optional[AsyncEth] = None,
+                               sample_interval: float = 5.0,
+                               window: int = 60,
+                               strategy: Union[str, FeeStrategy] = "normal",
+                               estimate_tx: Optional[Transaction] = None,
+                               max_sample_age: Optional[float] = 60.0) -> AsyncFeeOracle:
+        """
+        Samples gas prices in background, contract wrappers take their gas price from it,
+        see AsyncFeeOracle. A running oracle configured differently is replaced.
+        """
+        if self.fee_oracle is not None and not self.fee_oracle.configured_as(l1_module,
+                                                                              sample_interval,
+                                                                              window,
+                                                                              strategy,
+                                                                              estimate_tx):
+            await self.stop_fee_oracle()
+        if self.fee_oracle is None:
+            self.fee_oracle = AsyncFeeOracle(self,
+                                             l1_module=l1_module,
+                                             sample_interval=sample_interval,
+                                             window=window,
+                                             strategy=strategy,
+                                             estimate_tx=estimate_tx,
+                                             max_sample_age=max_sample_age)
+            self.fee_oracle.attach()
+        self.fee_oracle.max_sample_age = max_sample_age
+        self.fee_oracle.start()
+        return self.fee_oracle
+
+    async def stop_fee_oracle(self):
+        if self.fee_oracle is not None:
+            await self.fee_oracle.stop()
+            self.fee_oracle.detach()
+            self.fee_oracle = None
+
     async def wait_finalized(self,
                              transaction_hash: _Hash32,
                              timeout: float = 120,
-                             poll_latency: float = 0.1) -> TxReceipt:
+                             poll_latency: Union[float, PollingPolicy] = 0.1) -> TxReceipt:
+        if self.block_tracker is not None:
+            return await self._wait_finalized_tracked(transaction_hash, timeout, poll_latency)
+
+        policy = as_polling_policy(poll_latency)
+        polls = 0
 
-        async def _wait_finalized_with_timeout(
-                _tx_hash: _Hash32, _poll_latency: float
-        ) -> TxReceipt:
+        async def _wait_finalized_with_timeout(_tx_hash: _Hash32) -> TxReceipt:
+            nonlocal polls
+            delays = policy.delays()
             while True:
+                polls += 1
                 block = await self.get_block('finalized')
                 try:
-                    tx_receipt = await self.get_transaction_receipt(transaction_hash)
+                    tx_receipt = await self.get_transaction_receipt(_tx_hash)
                 except TransactionNotFound:
                     tx_receipt = None
                 if tx_receipt is not None and \
                         tx_receipt["blockHash"] is not None and \
                         block['number'] >= tx_receipt['blockNumber']:
                     break
-                await asyncio.sleep(_poll_latency)
+                await asyncio.sleep(next(delays))
             return tx_receipt
 
         try:
-            return await asyncio.wait_for(
-                _wait_finalized_with_timeout(transaction_hash, poll_latency),
+            receipt = await asyncio.wait_for(
+                _wait_finalized_with_timeout(transaction_hash),
                 timeout=timeout,
             )
+            policy.metrics.record(polls, resolved=True)
+            return receipt
         except asyncio.TimeoutError:
+            policy.metrics.record(polls, resolved=False)
+            raise TimeExhausted(
+                f"Transaction {HexBytes(transaction_hash) !r} is not in the chain "
+                f"after {timeout} seconds"
+            )
+
+    async def _wait_finalized_tracked(self,
+                                      transaction_hash: _Hash32,
+                                      timeout: float,
+                                      poll_latency: Union[float, PollingPolicy]) -> TxReceipt:
+        async def _wait_finalized_with_timeout() -> TxReceipt:
+            tx_receipt = await self.wait_for_transaction_receipt(transaction_hash,
+                                                                 timeout=timeout,
+                                                                 poll_latency=poll_latency)
+            await self.block_tracker.until_finalized(tx_receipt['blockNumber'])
+            return tx_receipt
+
+        try:
+            return await asyncio.wait_for(_wait_finalized_with_timeout(), timeout=timeout)
+        except (asyncio.TimeoutError, TimeExhausted):
             raise TimeExhausted(
                 f"Transaction {HexBytes(transaction_hash) !r} is not in the chain "
                 f"after {timeout} seconds"
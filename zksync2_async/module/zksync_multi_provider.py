@@ -0,0 +1,233 @@
+import asyncio
+import logging
+import time
+from typing import Union, Optional, Any, List, Sequence, Iterable, Tuple
+
+from eth_typing import URI
+from web3.providers import AsyncBaseProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from zksync2_async.module.zksync_provider import AsyncZkSyncProvider
+
+DEFAULT_HEDGED_METHODS = frozenset([
+    "eth_getTransactionReceipt",
+    "eth_getTransactionByHash",
+    "eth_getBlockByNumber",
+    "eth_blockNumber",
+    "eth_chainId",
+    "zks_getL2ToL1LogProof",
+    "zks_getL2ToL1MsgProof",
+    "zks_getTransactionDetails",
+])
+
+DEFAULT_STICKY_METHODS = frozenset([
+    "eth_sendRawTransaction",
+])
+
+
+class RPCEndpointState:
+    """
+    Routing statistics of one endpoint: EWMA of response times, consecutive failures
+    and circuit breaker state.
+    """
+
+    def __init__(self, provider: AsyncBaseProvider):
+        self.provider = provider
+        self.latency: Optional[float] = None
+        self.failures = 0
+        self.open_until = 0.0
+        self.block_number: Optional[int] = None
+        self.lagging = False
+        self.requests = 0
+
+    def __repr__(self):
+        return f"RPCEndpointState({self.provider}, latency={self.latency}, failures={self.failures})"
+
+    def available(self, now: float, failure_threshold: int) -> bool:
+        # INFO: after cooldown the circuit is half-open, one failure opens it again
+        return self.failures < failure_threshold or now >= self.open_until
+
+    def record_success(self, latency: float, alpha: float):
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency = alpha * latency + (1 - alpha) * self.latency
+        self.failures = 0
+        self.open_until = 0.0
+
+    def record_failure(self, now: float, failure_threshold: int, cooldown: float):
+        self.failures += 1
+        if self.failures >= failure_threshold:
+            self.open_until = now + cooldown
+
+
+class AsyncZkSyncMultiProvider(AsyncBaseProvider):
+    """
+    Spreads requests over several zkSync nodes.
+
+    Requests go to the healthy endpoint with the lowest EWMA response time and fail over
+    to the next one on transport errors. An endpoint failing failure_threshold times in a
+    row is skipped for cooldown seconds (circuit breaker). Read-only hedged_methods are
+    also sent to the next endpoint when the first one does not answer within the hedge
+    delay, the first answer wins. sticky_methods (sending raw transactions) keep using
+    the endpoint of the previous send, so the transactions of one account reach one
+    node mempool in nonce order.
+    """
+    logger = logging.getLogger("ZkSyncMultiProvider")
+
+    def __init__(self,
+                 endpoints: Sequence[Union[URI, str, AsyncBaseProvider]],
+                 hedged_methods: Iterable[str] = DEFAULT_HEDGED_METHODS,
+                 sticky_methods: Iterable[str] = DEFAULT_STICKY_METHODS,
+                 hedge_delay: Optional[float] = None,
+                 min_hedge_delay: float = 0.05,
+                 max_parallel: int = 2,
+                 ewma_alpha: float = 0.3,
+                 failure_threshold: int = 3,
+                 cooldown: float = 10.0,
+                 max_block_lag: int = 5,
+                 **provider_kwargs):
+        super(AsyncZkSyncMultiProvider, self).__init__()
+        if len(endpoints) == 0:
+            raise ValueError("At least one endpoint is required")
+        self.endpoints = [RPCEndpointState(AsyncZkSyncProvider(e, **provider_kwargs) if isinstance(e, str) else e)
+                          for e in endpoints]
+        self.hedged_methods = frozenset(hedged_methods)
+        self.sticky_methods = frozenset(sticky_methods)
+        self.hedge_delay = hedge_delay
+        self.min_hedge_delay = min_hedge_delay
+        self.max_parallel = max_parallel
+        self.ewma_alpha = ewma_alpha
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_block_lag = max_block_lag
+        self._sticky: Optional[RPCEndpointState] = None
+        self._health_task: Optional[asyncio.Task] = None
+
+    def __str__(self):
+        return f"Multi RPC connection {[str(e.provider) for e in self.endpoints]}"
+
+    def ranked(self) -> List[RPCEndpointState]:
+        """
+        Returns endpoints in routing order: available and up to date ones by latency first,
+        lagging ones next, endpoints with open circuit last.
+        """
+        now = time.monotonic()
+
+        def _key(endpoint: RPCEndpointState):
+            latency = endpoint.latency if endpoint.latency is not None else 0.0
+            return (not endpoint.available(now, self.failure_threshold),
+                    endpoint.lagging,
+                    latency)
+
+        return sorted(self.endpoints, key=_key)
+
+    def _hedge_delay(self, endpoint: RPCEndpointState) -> float:
+        if self.hedge_delay is not None:
+            return self.hedge_delay
+        if endpoint.latency is None:
+            return self.min_hedge_delay
+        return max(self.min_hedge_delay, 2 * endpoint.latency)
+
+    async def _call(self,
+                    endpoint: RPCEndpointState,
+                    method: RPCEndpoint,
+                    params: Any) -> Tuple[RPCEndpointState, RPCResponse]:
+        start = time.monotonic()
+        endpoint.requests += 1
+        try:
+            response = await endpoint.provider.make_request(method, params)
+        except Exception:
+            endpoint.record_failure(time.monotonic(), self.failure_threshold, self.cooldown)
+            raise
+        endpoint.record_success(time.monotonic() - start, self.ewma_alpha)
+        return endpoint, response
+
+    async def _request(self,
+                       endpoints: List[RPCEndpointState],
+                       method: RPCEndpoint,
+                       params: Any,
+                       max_parallel: int) -> Tuple[RPCEndpointState, RPCResponse]:
+        remaining = list(endpoints)
+        pending = set()
+        error: Optional[BaseException] = None
+        try:
+            while len(remaining) > 0 or len(pending) > 0:
+                timeout = None
+                if len(remaining) > 0 and len(pending) < max_parallel:
+                    endpoint = remaining.pop(0)
+                    pending.add(asyncio.ensure_future(self._call(endpoint, method, params)))
+                    if len(remaining) > 0 and len(pending) < max_parallel:
+                        timeout = self._hedge_delay(endpoint)
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+                    self.logger.warning(f"{method} failed: {error}")
+        finally:
+            for task in pending:
+                task.cancel()
+        raise error
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        endpoints = self.ranked()
+        if method in self.sticky_methods:
+            sticky = self._sticky
+            if sticky is not None and sticky.available(time.monotonic(), self.failure_threshold):
+                endpoints.remove(sticky)
+                endpoints.insert(0, sticky)
+            endpoint, response = await self._request(endpoints, method, params, max_parallel=1)
+            self._sticky = endpoint
+            return response
+        max_parallel = self.max_parallel if method in self.hedged_methods else 1
+        _, response = await self._request(endpoints, method, params, max_parallel=max_parallel)
+        return response
+
+    async def check_health(self):
+        """
+        Requests the latest block of every endpoint, updates latencies and circuit
+        breakers and marks endpoints more than max_block_lag blocks behind as lagging.
+        """
+        async def _block_number(endpoint: RPCEndpointState):
+            try:
+                _, response = await self._call(endpoint, RPCEndpoint("eth_blockNumber"), [])
+            except Exception as err:
+                self.logger.warning(f"Health check of {endpoint.provider} failed: {err}")
+                return
+            result = response.get("result")
+            endpoint.block_number = int(result, 16) if isinstance(result, str) else result
+
+        await asyncio.gather(*[_block_number(e) for e in self.endpoints])
+        heights = [e.block_number for e in self.endpoints if e.block_number is not None]
+        if len(heights) == 0:
+            return
+        top = max(heights)
+        for endpoint in self.endpoints:
+            endpoint.lagging = endpoint.block_number is None or top - endpoint.block_number > self.max_block_lag
+
+    async def _health_loop(self, interval: float):
+        while True:
+            await self.check_health()
+            await asyncio.sleep(interval)
+
+    def start_health_checks(self, interval: float = 5.0):
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.ensure_future(self._health_loop(interval))
+
+    async def stop_health_checks(self):
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+
+    async def is_connected(self, show_traceback: bool = False) -> bool:
+        for endpoint in self.ranked():
+            if await endpoint.provider.is_connected(show_traceback):
+                return True
+        return False
+
+    async def disconnect(self):
+        await self.stop_health_checks()
+        for endpoint in self.endpoints:
+            if hasattr(endpoint.provider, "disconnect"):
+                await endpoint.provider.disconnect()
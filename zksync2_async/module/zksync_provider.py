@@ -1,17 +1,229 @@
+import asyncio
 import logging
-from typing import Union, Optional, Any
+from contextvars import ContextVar
+from typing import Union, Optional, Any, List, Tuple
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
 from web3 import AsyncHTTPProvider
 from eth_typing import URI
+from eth_utils import to_bytes
+from web3._utils.encoding import FriendlyJsonSerde, Web3JsonEncoder
 from web3.types import RPCEndpoint, RPCResponse
 
+RPCCall = Tuple[RPCEndpoint, Any]
+
+_active_batch: ContextVar[Optional["AsyncRPCBatch"]] = ContextVar("zksync_active_rpc_batch", default=None)
+
+
+class AsyncRPCBatch:
+    """
+    Collects RPC calls and sends them to the node as one JSON-RPC array request.
+
+    Inside ``async with provider.batch():`` every request made by the current task, or by
+    tasks created inside the block, is queued instead of sent. Queued requests are
+    dispatched on ``flush()`` and when the block exits, so the calls must be started as
+    tasks (``asyncio.gather``/``asyncio.ensure_future``) rather than awaited one by one.
+    """
+
+    def __init__(self, provider: "AsyncZkSyncProvider"):
+        self.provider = provider
+        self.closed = False
+        self._pending: List[Tuple[RPCCall, asyncio.Future]] = []
+        self._token = None
+
+    def __len__(self):
+        return len(self._pending)
+
+    def add(self, method: RPCEndpoint, params: Any) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append(((method, params), future))
+        return future
+
+    async def flush(self):
+        pending, self._pending = self._pending, []
+        if len(pending) == 0:
+            return
+        try:
+            responses = await self.provider.make_batch_request([call for call, _ in pending])
+        except Exception as err:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(err)
+            return
+        for (_, future), response in zip(pending, responses):
+            if not future.done():
+                future.set_result(response)
+
+    async def __aenter__(self) -> "AsyncRPCBatch":
+        self._token = _active_batch.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        _active_batch.reset(self._token)
+        # INFO: let the tasks started inside the block reach the provider, requests
+        #       issued by middlewares while handling a response are flushed on the next round
+        await asyncio.sleep(0)
+        while len(self._pending) > 0:
+            await self.flush()
+            await asyncio.sleep(0)
+        self.closed = True
+
 
 class AsyncZkSyncProvider(AsyncHTTPProvider):
+    """
+    HTTP provider owning one long-lived aiohttp session, its connection pool is shared
+    by all requests of the provider so sockets are reused by concurrent workers.
+
+    pool_size and limit_per_host bound the open connections (0 - no limit), idle
+    connections are kept for keepalive_timeout seconds and resolved host names are
+    cached for ttl_dns_cache seconds. With accept_compression responses may be
+    gzip/deflate encoded. A session passed by the caller is used as is and not closed
+    by disconnect().
+    """
     logger = logging.getLogger("ZkSyncProvider")
 
-    def __init__(self, url: Optional[Union[URI, str]]):
-        super(AsyncZkSyncProvider, self).__init__(url, request_kwargs={'timeout': 1000})
+    def __init__(self,
+                 url: Optional[Union[URI, str]],
+                 batch_window: Optional[float] = None,
+                 max_batch_size: int = 100,
+                 pool_size: int = 100,
+                 limit_per_host: int = 0,
+                 keepalive_timeout: float = 15.0,
+                 ttl_dns_cache: Optional[int] = 300,
+                 request_timeout: float = 1000,
+                 accept_compression: bool = True,
+                 session: Optional[ClientSession] = None):
+        super(AsyncZkSyncProvider, self).__init__(url)
+        self.batch_window = batch_window
+        self.max_batch_size = max_batch_size
+        self.pool_size = pool_size
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.request_timeout = request_timeout
+        self.accept_compression = accept_compression
+        self._session = session
+        self._own_session = session is None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._window_batch: Optional[AsyncRPCBatch] = None
+        self._window_flushes = set()
+
+    def get_request_headers(self):
+        headers = super(AsyncZkSyncProvider, self).get_request_headers()
+        if self.accept_compression:
+            headers["Accept-Encoding"] = "gzip, deflate"
+        return headers
+
+    def _create_session(self) -> ClientSession:
+        connector = TCPConnector(limit=self.pool_size,
+                                 limit_per_host=self.limit_per_host,
+                                 keepalive_timeout=self.keepalive_timeout,
+                                 ttl_dns_cache=self.ttl_dns_cache,
+                                 use_dns_cache=self.ttl_dns_cache is not None)
+        return ClientSession(connector=connector,
+                             timeout=ClientTimeout(total=self.request_timeout),
+                             raise_for_status=True)
+
+    async def session(self) -> ClientSession:
+        """
+        Returns the provider session, creates it on the first request or when the
+        previous one was closed or belongs to another event loop.
+        """
+        session = self._session
+        loop = asyncio.get_running_loop()
+        if session is None or (self._own_session and (session.closed or self._session_loop is not loop)):
+            session = self._create_session()
+            self._session = session
+            self._session_loop = loop
+            self._own_session = True
+        return session
+
+    async def cache_async_session(self, session: ClientSession) -> ClientSession:
+        await self.disconnect()
+        self._session = session
+        self._own_session = False
+        return session
+
+    async def disconnect(self):
+        session, self._session = self._session, None
+        self._session_loop = None
+        if session is not None and self._own_session and not session.closed:
+            await session.close()
+
+    async def _post(self, data: bytes) -> bytes:
+        session = await self.session()
+        async with session.post(self.endpoint_uri, data=data, **self.get_request_kwargs()) as response:
+            return await response.read()
+
+    async def _make_single_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        raw_response = await self._post(self.encode_rpc_request(method, params))
+        return self.decode_rpc_response(raw_response)
+
+    def batch(self) -> AsyncRPCBatch:
+        return AsyncRPCBatch(self)
 
     async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        batch = _active_batch.get()
+        if batch is not None and not batch.closed and batch.provider is self:
+            return await batch.add(method, params)
+        if self.batch_window is not None:
+            return await self._coalesce_request(method, params)
         self.logger.debug(f"make_request: {method}, params : {params}")
-        response = await AsyncHTTPProvider.make_request(self, method, params)
+        response = await self._make_single_request(method, params)
         return response
+
+    async def make_batch_request(self, calls: List[RPCCall]) -> List[RPCResponse]:
+        """
+        Sends calls as one JSON-RPC array, responses are returned in the order of calls.
+        """
+        if len(calls) == 1:
+            method, params = calls[0]
+            return [await self._make_single_request(method, params)]
+
+        self.logger.debug(f"make_batch_request: {len(calls)} calls")
+        request_ids = []
+        rpc_calls = []
+        for method, params in calls:
+            request_id = next(self.request_counter)
+            request_ids.append(request_id)
+            rpc_calls.append({
+                "jsonrpc": "2.0",
+                "method": method,
+                "params": params or [],
+                "id": request_id
+            })
+        encoded = FriendlyJsonSerde().json_encode(rpc_calls, cls=Web3JsonEncoder)
+        raw_response = await self._post(to_bytes(text=encoded))
+        response = self.decode_rpc_response(raw_response)
+        if not isinstance(response, list):
+            # INFO: node rejected the whole batch, report its error for every call
+            return [response for _ in calls]
+
+        by_id = {r.get("id"): r for r in response}
+        results = []
+        for request_id in request_ids:
+            r = by_id.get(request_id)
+            if r is None:
+                r = {"jsonrpc": "2.0",
+                     "id": request_id,
+                     "error": {"code": -32603, "message": "Missing response in batch"}}
+            results.append(r)
+        return results
+
+    async def _coalesce_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        batch = self._window_batch
+        if batch is None:
+            batch = AsyncRPCBatch(self)
+            self._window_batch = batch
+            asyncio.get_running_loop().call_later(self.batch_window, self._flush_window, batch)
+        future = batch.add(method, params)
+        if len(batch) >= self.max_batch_size:
+            self._flush_window(batch)
+        return await future
+
+    def _flush_window(self, batch: AsyncRPCBatch):
+        if self._window_batch is batch:
+            self._window_batch = None
+            task = asyncio.ensure_future(batch.flush())
+            self._window_flushes.add(task)
+            task.add_done_callback(self._window_flushes.discard)
@@ -1,7 +1,20 @@
+from typing import Optional, Union
+
 from web3 import AsyncWeb3
+from web3.providers import AsyncBaseProvider
 
+from zksync2_async.module.contract_cache import ContractWrapperCache
 from zksync2_async.module.zksync_module import AsyncZkSyncModule
+from zksync2_async.module.zksync_provider import AsyncZkSyncProvider
 
 
 class AsyncZkSyncWeb3(AsyncWeb3):
     zksync: AsyncZkSyncModule
+    zksync_provider: Optional[Union[AsyncZkSyncProvider, AsyncBaseProvider]] = None
+    _contract_cache: Optional[ContractWrapperCache] = None
+
+    @property
+    def contract_cache(self) -> ContractWrapperCache:
+        if self._contract_cache is None:
+            self._contract_cache = ContractWrapperCache()
+        return self._contract_cache
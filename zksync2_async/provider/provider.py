@@ -13,6 +13,8 @@ from zksync2_async.manage_contracts.zksync_contract import AsyncZkSyncContract
 from zksync2_async.core.utils import RecommendedGasLimit, to_bytes, is_eth
 from zksync2_async.core.types import Token, BridgeAddresses, EthBlockParams, ZksMessageProof
 from zksync2_async.module.zksync_web3 import AsyncZkSyncWeb3
+from zksync2_async.module.contract_cache import wrapper_key
+from zksync2_async.module.fee_oracle import suggested_gas_price
 
 
 def check_base_cost(base_cost: int, value: int):
@@ -41,20 +43,39 @@ class AsyncEthereumProvider:
     @property
     async def main_contract(self):
         if not self._main_contract:
-            _main_contract_address = self._zksync_web3.zksync.zks_main_contract()
-            self._main_contract = AsyncZkSyncContract(zksync_main_contract=self._main_contract_address,
-                                                      eth=self._zksync_web3,
-                                                      account=self._l1_account)
+            main_contract_address = await self._zksync_web3.zksync.zks_main_contract()
+            self._main_contract = self._zksync_web3.contract_cache.get_or_create(
+                wrapper_key(AsyncZkSyncContract, main_contract_address, self.address),
+                lambda: AsyncZkSyncContract(zksync_main_contract=main_contract_address,
+                                            eth=self._zksync_web3,
+                                            account=self._l1_account))
         return self._main_contract
 
     @property
     async def l1_bridge(self):
         if not self._l1_bridge:
             bridge_addresses: BridgeAddresses = await self._zksync_web3.zksync.zks_get_bridge_contracts()
-            self._l1_bridge = AsyncL1Bridge(bridge_addresses.erc20_l1_default_bridge,
-                                            self._zksync_web3, self._l1_account)
+            self._l1_bridge = self._l1_bridge_at(bridge_addresses.erc20_l1_default_bridge)
         return self._l1_bridge
 
+    def _erc20(self, token_address: HexStr) -> AsyncERC20Contract:
+        return self._zksync_web3.contract_cache.get_or_create(
+            wrapper_key(AsyncERC20Contract, token_address, self.address),
+            lambda: AsyncERC20Contract(self._zksync_web3.eth, token_address, self._l1_account))
+
+    def _l1_bridge_at(self, bridge_address: HexStr) -> AsyncL1Bridge:
+        return self._zksync_web3.contract_cache.get_or_create(
+            wrapper_key(AsyncL1Bridge, bridge_address, self.address),
+            lambda: AsyncL1Bridge(bridge_address, self._zksync_web3, self._l1_account))
+
+    def _l2_bridge_at(self, bridge_address: HexStr) -> AsyncL2Bridge:
+        # TODO: check should it be different account for L1/L2
+        return self._zksync_web3.contract_cache.get_or_create(
+            wrapper_key(AsyncL2Bridge, bridge_address, self.address),
+            lambda: AsyncL2Bridge(contract_address=bridge_address,
+                                  web3_zks=self._zksync_web3,
+                                  zksync_account=self._l1_account))
+
     @property
     def address(self):
         return self._l1_account.address
@@ -63,16 +84,14 @@ class AsyncEthereumProvider:
         if token.is_eth():
             return await self._zksync_web3.eth.get_balance(self.address, block.value)
         else:
-            token_contract = AsyncERC20Contract(self._zksync_web3.eth,
-                                                token.l1_address,
-                                                self._l1_account)
+            token_contract = self._erc20(token.l1_address)
             return await token_contract.balance_of(self.address)
 
     async def l2_token_address(self, token: Token):
         if token.is_eth():
             return token.l1_address
         else:
-            l1_bridge = await self._l1_bridge
+            l1_bridge = await self.l1_bridge
             return await l1_bridge.l2_token_address(token.l1_address)
 
     async def get_base_cost(self,
@@ -80,7 +99,7 @@ class AsyncEthereumProvider:
                             gas_per_pubdata_byte: int = DEPOSIT_GAS_PER_PUBDATA_LIMIT,
                             gas_price: int = None):
         if gas_price is None:
-            gas_price = await self._zksync_web3.eth.gas_price
+            gas_price = await suggested_gas_price(self._zksync_web3.eth)
         main_contract = await self.main_contract
         return await main_contract.l2_tx_base_cost(gas_price, gas_limit, gas_per_pubdata_byte)
 
@@ -92,9 +111,9 @@ class AsyncEthereumProvider:
         if token.is_eth():
             raise RuntimeError("ETH token can't be approved. The address of the token does not exist on L1")
 
-        erc20 = AsyncERC20Contract(self._zksync_web3.eth, token.l1_address, self._l1_account)
+        erc20 = self._erc20(token.l1_address)
         if bridge_address is None:
-            l1_bridge = await self._l1_bridge
+            l1_bridge = await self.l1_bridge
             bridge_address = l1_bridge.address
 
         if gas_limit is None:
@@ -118,15 +137,13 @@ class AsyncEthereumProvider:
 
         bridge_contract = await self.l1_bridge
         if bridge_address is not None:
-            bridge_contract = AsyncL1Bridge(bridge_address,
-                                            self._zksync_web3,
-                                            self._l1_account)
+            bridge_contract = self._l1_bridge_at(bridge_address)
 
         if to is None:
             to = self.address
 
         if gas_price is None:
-            gas_price = await self._zksync_web3.eth.gas_price
+            gas_price = await suggested_gas_price(self._zksync_web3.eth)
         if gas_limit is None:
             gas_limit = RecommendedGasLimit.DEPOSIT.value
 
@@ -181,7 +198,7 @@ class AsyncEthereumProvider:
         if refund_recipient is None:
             refund_recipient = self.address
         if gas_price is None:
-            gas_price = await self._zksync_web3.eth.gas_price
+            gas_price = await suggested_gas_price(self._zksync_web3.eth)
 
         base_cost = await self.get_base_cost(gas_price=gas_price,
                                              gas_per_pubdata_byte=gas_per_pubdata_byte,
@@ -259,13 +276,8 @@ class AsyncEthereumProvider:
                 message=params["message"],
                 merkle_proof=merkle_proof)
         else:
-            # TODO: check should it be different account for L1/L2
-            l2bridge = AsyncL2Bridge(contract_address=params["sender"],
-                                     web3_zks=self._zksync_web3,
-                                     zksync_account=self._l1_account)
-            l1bridge = AsyncL1Bridge(contract_address=await l2bridge.l1_bridge(),
-                                     web3=self._zksync_web3,
-                                     eth_account=self._l1_account)
+            l2bridge = self._l2_bridge_at(params["sender"])
+            l1bridge = self._l1_bridge_at(await l2bridge.l1_bridge())
             return await l1bridge.finalize_withdrawal(l2_block_number=params["l1_batch_number"],
                                                       l2_msg_index=params["l2_message_index"],
                                                       msg=params["message"],
@@ -286,12 +298,7 @@ class AsyncEthereumProvider:
                 l2_block_number=l2_block_number,
                 l2_message_index=proof.id)
         else:
-            # TODO: check should it be different account for L1/L2
-            l2bridge = AsyncL2Bridge(contract_address=sender,
-                                     web3_zks=self._zksync_web3,
-                                     zksync_account=self._l1_account)
-            l1bridge = AsyncL1Bridge(contract_address=await l2bridge.l1_bridge(),
-                                     web3=self._zksync_web3,
-                                     eth_account=self._l1_account)
+            l2bridge = self._l2_bridge_at(sender)
+            l1bridge = self._l1_bridge_at(await l2bridge.l1_bridge())
             return await l1bridge.is_withdrawal_finalized(l2_block_number=l2_block_number,
                                                           l2_msg_index=proof.id)
@@ -1,22 +1,77 @@
-import web3
 from abc import abstractmethod, ABC
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Sequence
 from eip712_structs import make_domain, EIP712Struct
 from eth_account.datastructures import SignedMessage
 from eth_account.signers.base import BaseAccount
+from eth_keys import keys
 from eth_typing import ChecksumAddress, HexStr
 from eth_utils import keccak
+from hexbytes import HexBytes
 from eth_account.messages import encode_defunct, SignableMessage
 
+from zksync2_async.transaction.transaction712 import Transaction712
+
+EIP712_PREFIX = b'\x19\x01'
+
+
+@lru_cache(maxsize=None)
+def domain_separator(name: str, version: str, chain_id: int) -> bytes:
+    return make_domain(name=name, version=version, chainId=chain_id).hash_struct()
+
+
+def typed_data_digest(domain_hash: bytes, struct_hash: bytes) -> bytes:
+    return keccak(EIP712_PREFIX + domain_hash + struct_hash)
+
+
+def _sign_digest(credentials: BaseAccount, digest: bytes) -> SignedMessage:
+    key = getattr(credentials, "key", None)
+    if key is None:
+        # INFO: accounts without a local key (e.g. remote signers) only provide signHash
+        return credentials.signHash(digest)
+    signature = keys.PrivateKey(bytes(key)).sign_msg_hash(digest)
+    v = signature.v + 27
+    return SignedMessage(messageHash=HexBytes(digest),
+                         r=signature.r,
+                         s=signature.s,
+                         v=v,
+                         signature=HexBytes(signature.to_bytes()[:64] + bytes([v])))
+
+
+def _recover_digest(digest: bytes, signature: HexStr) -> ChecksumAddress:
+    signature = HexBytes(signature)
+    v = signature[64]
+    if v >= 27:
+        v -= 27
+    public_key = keys.Signature(signature[:64] + bytes([v])).recover_public_key_from_msg_hash(digest)
+    return public_key.to_checksum_address()
+
+
+@lru_cache(maxsize=None)
+def _shared_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(thread_name_prefix="zksync-signer")
+
 
 class EthSignerBase:
 
     @abstractmethod
     def sign_typed_data(self, typed_data: EIP712Struct, domain=None) -> SignedMessage:
-        raise NotImplemented
+        raise NotImplementedError
 
     @abstractmethod
     def verify_typed_data(self, sig: HexStr, typed_data: EIP712Struct) -> bool:
-        raise NotImplemented
+        raise NotImplementedError
+
+    @abstractmethod
+    def sign_digest(self, digest: bytes) -> SignedMessage:
+        raise NotImplementedError
+
+    def sign_transaction712(self, tx: Transaction712) -> SignedMessage:
+        """
+        Signers implementing only sign_typed_data sign the EIP712 struct of the transaction.
+        """
+        return self.sign_typed_data(tx.to_eip712_struct())
 
 
 class PrivateKeyEthSigner(EthSignerBase, ABC):
@@ -29,6 +84,7 @@ class PrivateKeyEthSigner(EthSignerBase, ABC):
         self.default_domain = make_domain(name=self._NAME,
                                           version=self._VERSION,
                                           chainId=self.chain_id)
+        self.domain_separator = domain_separator(self._NAME, self._VERSION, self.chain_id)
 
     @property
     def address(self) -> ChecksumAddress:
@@ -48,10 +104,36 @@ class PrivateKeyEthSigner(EthSignerBase, ABC):
     def sign_typed_data(self, typed_data: EIP712Struct, domain=None) -> SignedMessage:
         singable_message = self.typed_data_to_signed_bytes(typed_data, domain)
         msg_hash = keccak(singable_message.body)
-        return self.credentials.signHash(msg_hash)
+        return _sign_digest(self.credentials, msg_hash)
 
     def verify_typed_data(self, sig: HexStr, typed_data: EIP712Struct, domain=None) -> bool:
         singable_message = self.typed_data_to_signed_bytes(typed_data, domain)
         msg_hash = keccak(singable_message.body)
-        address = web3.AsyncWeb3.eth.account.recoverHash(message_hash=msg_hash, signature=sig)
+        address = _recover_digest(msg_hash, sig)
         return address.lower() == self.address.lower()
+
+    def transaction712_digest(self, tx: Transaction712) -> bytes:
+        return typed_data_digest(self.domain_separator, tx.struct_hash())
+
+    def sign_digest(self, digest: bytes) -> SignedMessage:
+        return _sign_digest(self.credentials, digest)
+
+    def sign_transaction712(self, tx: Transaction712) -> SignedMessage:
+        """
+        Same signature as sign_typed_data(tx.to_eip712_struct()), hashes
+        0x1901 || domainSeparator || structHash directly.
+        """
+        return self.sign_digest(self.transaction712_digest(tx))
+
+    def sign_many(self,
+                  txs: Sequence[Transaction712],
+                  executor: Optional[Executor] = None) -> List[SignedMessage]:
+        """
+        Signs txs in executor, a thread pool shared by all signers is used if it's not provided.
+        A ProcessPoolExecutor can be passed to use all cores, credentials must be picklable then.
+        """
+        digests = [self.transaction712_digest(tx) for tx in txs]
+        credentials = [self.credentials] * len(digests)
+        if executor is None:
+            executor = _shared_executor()
+        return list(executor.map(_sign_digest, credentials, digests))
@@ -0,0 +1,88 @@
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Optional, List, Sequence
+
+from eth_account.signers.base import BaseAccount
+
+from zksync2_async.signer.eth_signer import PrivateKeyEthSigner, typed_data_digest, _sign_digest
+from zksync2_async.transaction.transaction712 import Transaction712
+
+
+def _sign_and_encode(credentials: BaseAccount, domain_hash: bytes, tx: Transaction712) -> bytes:
+    signed_message = _sign_digest(credentials, typed_data_digest(domain_hash, tx.struct_hash()))
+    return tx.encode(signed_message)
+
+
+class AsyncSigningService:
+    """
+    Signs and encodes Transaction712 objects in a thread or process pool, so that
+    CPU bound signing never blocks the event loop.
+
+    At most max_pending transactions are queued in the pool, further sign() calls
+    wait until a slot is free (backpressure).
+    """
+
+    def __init__(self,
+                 signer: PrivateKeyEthSigner,
+                 max_workers: Optional[int] = None,
+                 use_processes: bool = False,
+                 max_pending: int = 1024,
+                 executor: Optional[Executor] = None):
+        self.signer = signer
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.max_pending = max_pending
+        self._executor = executor
+        self._own_executor = executor is None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self.pending = 0
+        self.signed_count = 0
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_processes:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="zksync-signer")
+        return self._executor
+
+    async def sign(self, tx: Transaction712) -> bytes:
+        """
+        Returns the signed and encoded transaction, ready for send_raw_transaction.
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+        async with self._slots:
+            self.pending += 1
+            try:
+                encoded = await asyncio.get_running_loop().run_in_executor(self.executor,
+                                                                           _sign_and_encode,
+                                                                           self.signer.credentials,
+                                                                           self.signer.domain_separator,
+                                                                           tx)
+            finally:
+                self.pending -= 1
+        self.signed_count += 1
+        return encoded
+
+    async def sign_many(self, txs: Sequence[Transaction712]) -> List[bytes]:
+        return list(await asyncio.gather(*[self.sign(tx) for tx in txs]))
+
+    def close(self, wait: bool = True):
+        if self._executor is not None and self._own_executor:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    async def __aenter__(self) -> "AsyncSigningService":
+        return self
+
+    async def aclose(self):
+        """
+        Waits for queued signing jobs and shuts the own pool down without blocking the event loop.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
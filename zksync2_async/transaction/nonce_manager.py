@@ -0,0 +1,151 @@
+import asyncio
+import re
+from contextlib import asynccontextmanager
+from typing import Dict, Optional, AsyncIterator, Set
+
+from eth_typing import HexStr
+from web3 import AsyncWeb3
+from web3.eth import AsyncEth
+from web3.types import Nonce
+
+from zksync2_async.core.types import EthBlockParams
+
+_NONCE_ERROR_PATTERN = re.compile(r"nonce.*too (low|high)|(low|high) nonce|invalid nonce", re.IGNORECASE)
+
+
+def is_nonce_error(err: BaseException) -> bool:
+    return _NONCE_ERROR_PATTERN.search(str(err)) is not None
+
+
+class AsyncNonceManager:
+    """
+    Allocates nonces for one account locally.
+
+    The first allocation is seeded from the node (pending transaction count), all
+    following ones are incremented in memory under an asyncio.Lock, so concurrent
+    coroutines sharing an account never get the same nonce and do not query the node
+    per transaction. When the node reports "nonce too low/high" the local counter
+    is resynchronized with the node, but never below a nonce still held by reserve().
+    """
+
+    def __init__(self,
+                 module: AsyncEth,
+                 address: HexStr,
+                 block_identifier: str = EthBlockParams.PENDING.value):
+        self.module = module
+        self.address = AsyncWeb3.to_checksum_address(address)
+        self.block_identifier = block_identifier
+        self._lock = asyncio.Lock()
+        self._next_nonce: Optional[int] = None
+        self._released: Set[int] = set()
+        # INFO: nonces inside reserve() blocks, allocated but not sent yet
+        self._reserved: Set[int] = set()
+        self._node_nonce: Optional[int] = None
+
+    async def _fetch(self) -> int:
+        self._node_nonce = await self.module.get_transaction_count(self.address, self.block_identifier)
+        return self._node_nonce
+
+    async def next_nonce(self) -> Nonce:
+        return await self._allocate(reserved=False)
+
+    async def _allocate(self, reserved: bool) -> Nonce:
+        async with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = await self._fetch()
+            if len(self._released) > 0:
+                nonce = min(self._released)
+                self._released.discard(nonce)
+            else:
+                nonce = self._next_nonce
+                self._next_nonce += 1
+            if reserved:
+                self._reserved.add(nonce)
+            return Nonce(nonce)
+
+    async def peek(self) -> Nonce:
+        async with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = await self._fetch()
+            if len(self._released) > 0:
+                return Nonce(min(self._released))
+            return Nonce(self._next_nonce)
+
+    async def resync(self) -> Nonce:
+        """
+        Reseeds the counter from the node. While nonces are reserved the counter
+        only moves up, the node doesn't know them and would hand them out again.
+        """
+        async with self._lock:
+            nonce = await self._fetch()
+            if self._next_nonce is None or len(self._reserved) == 0 or nonce > self._next_nonce:
+                self._next_nonce = nonce
+                self._released.clear()
+            else:
+                self._released = {n for n in self._released if n >= nonce}
+            return Nonce(self._next_nonce)
+
+    def reset(self):
+        self._next_nonce = None
+        self._released.clear()
+        self._reserved.clear()
+        self._node_nonce = None
+
+    async def handle_error(self, err: BaseException) -> bool:
+        """
+        Resynchronizes the counter if err is a nonce gap reported by the node,
+        returns True in that case.
+        """
+        if not is_nonce_error(err):
+            return False
+        await self.resync()
+        return True
+
+    async def release(self, nonce: Nonce):
+        """
+        Returns an allocated but unused nonce. If it is not the last allocated one
+        it is kept and handed out again before the counter, so the gap is filled
+        without reseeding from the node (which doesn't know reserved nonces).
+        Nonces the node already counted are ignored.
+        """
+        async with self._lock:
+            if self._next_nonce is None or nonce >= self._next_nonce or nonce < self._node_nonce:
+                return
+            self._released.add(nonce)
+            while self._next_nonce - 1 in self._released:
+                self._next_nonce -= 1
+                self._released.discard(self._next_nonce)
+
+    @asynccontextmanager
+    async def reserve(self) -> AsyncIterator[Nonce]:
+        """
+        Allocates a nonce for a single send. If the block fails the nonce is released,
+        after resynchronizing the counter when the node reported a nonce gap.
+        """
+        nonce = await self._allocate(reserved=True)
+        try:
+            yield nonce
+        except Exception as err:
+            self._reserved.discard(nonce)
+            await self.handle_error(err)
+            await self.release(nonce)
+            raise
+        finally:
+            self._reserved.discard(nonce)
+
+
+def nonce_manager(module: AsyncEth, address: HexStr) -> AsyncNonceManager:
+    """
+    Returns the nonce manager shared by everything sending from address through module.
+    """
+    # INFO: kept on the module, managers reference it and a global map keyed by it would never free it
+    managers: Optional[Dict[str, AsyncNonceManager]] = getattr(module, "_nonce_managers", None)
+    if managers is None:
+        managers = dict()
+        module._nonce_managers = managers
+    key = address.lower()
+    manager = managers.get(key)
+    if manager is None:
+        manager = AsyncNonceManager(module, address)
+        managers[key] = manager
+    return manager
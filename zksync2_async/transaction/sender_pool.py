@@ -0,0 +1,226 @@
+import asyncio
+import logging
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import List, Optional, Sequence
+
+from eth_account.signers.base import BaseAccount
+from eth_typing import HexStr
+
+from zksync2_async.signer.eth_signer import PrivateKeyEthSigner
+from zksync2_async.signer.signing_service import AsyncSigningService
+from zksync2_async.transaction.submission_engine import AsyncSubmissionEngine, Submission
+from zksync2_async.transaction.transaction_builders import TxBase
+
+
+class SenderLane:
+    """
+    One account of the pool: its signer, submission engine and locally tracked balance
+    read from the node at balance_block.
+
+    pending_spend is the value and max fee of transactions sent without receipt yet,
+    the node balance doesn't include them.
+    """
+
+    def __init__(self, engine: AsyncSubmissionEngine):
+        self.engine = engine
+        self.pending = 0
+        self.balance: Optional[int] = None
+        self.balance_block: Optional[int] = None
+        self.pending_spend = 0
+
+    @property
+    def address(self) -> HexStr:
+        return self.engine.address
+
+    @property
+    def available(self) -> Optional[int]:
+        if self.balance is None:
+            return None
+        return self.balance - self.pending_spend
+
+    def can_pay(self, cost: int) -> bool:
+        return self.balance is None or self.available >= cost
+
+
+class AsyncSenderPool:
+    """
+    Spreads transactions across several accounts, each sending through its own
+    AsyncSubmissionEngine, so nonce ordering of one account doesn't limit throughput.
+
+    submit() rewrites the sender of the transaction to the lane with the fewest pending
+    transactions among lanes whose available balance covers the value and a fee reserve (the
+    richest one on a tie). The fee reserve is the largest max fee (gas limit * max fee per gas)
+    of sent transactions, at least fee_reserve.
+
+    Balances are read from the node on the first submit() and every refresh_interval seconds
+    after start(). Value and max fee of transactions without receipt are kept as pending spend
+    of the lane, refreshes don't reset it. On a receipt the spent fee (gas used * effective gas
+    price) and the value of a successful transaction are taken from the balance, unless it was
+    read at or after the block of the receipt.
+    """
+    logger = logging.getLogger("SenderPool")
+
+    def __init__(self,
+                 module,
+                 signers: Sequence[PrivateKeyEthSigner],
+                 max_in_flight: int = 16,
+                 refresh_interval: float = 30.0,
+                 fee_reserve: int = 0,
+                 max_workers: Optional[int] = None,
+                 executor: Optional[Executor] = None,
+                 **engine_options):
+        if len(signers) == 0:
+            raise ValueError("Sender pool needs at least one signer")
+        self.module = module
+        self.refresh_interval = refresh_interval
+        self.fee_reserve = fee_reserve
+        # INFO: signing is CPU bound, lanes share one pool instead of a pool per account
+        self._executor = executor
+        self._own_executor = executor is None
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="zksync-signer")
+        self.lanes: List[SenderLane] = [
+            SenderLane(AsyncSubmissionEngine(module,
+                                             AsyncSigningService(signer, executor=self._executor),
+                                             max_in_flight=max_in_flight,
+                                             **engine_options))
+            for signer in signers
+        ]
+        self._refreshed = False
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_accounts(cls, module, accounts: Sequence[BaseAccount], chain_id: int, **kwargs) -> "AsyncSenderPool":
+        return cls(module, [PrivateKeyEthSigner(account, chain_id) for account in accounts], **kwargs)
+
+    @property
+    def addresses(self) -> List[HexStr]:
+        return [lane.address for lane in self.lanes]
+
+    @property
+    def pending(self) -> int:
+        return sum(lane.pending for lane in self.lanes)
+
+    @property
+    def throughput(self) -> float:
+        return sum(lane.engine.throughput for lane in self.lanes)
+
+    async def refresh_balances(self):
+        # INFO: balances are read at one block, receipts up to it are already included
+        block = await self.module.block_number
+        provider = getattr(self.module.w3, "zksync_provider", None)
+        if provider is not None and hasattr(provider, "batch"):
+            async with provider.batch():
+                tasks = [asyncio.ensure_future(self.module.get_balance(lane.address, block)) for lane in self.lanes]
+        else:
+            tasks = [self.module.get_balance(lane.address, block) for lane in self.lanes]
+        balances = await asyncio.gather(*tasks)
+        for lane, balance in zip(self.lanes, balances):
+            lane.balance = balance
+            lane.balance_block = block
+        self._refreshed = True
+
+    def _select(self, cost: int) -> Optional[SenderLane]:
+        funded = [lane for lane in self.lanes if lane.can_pay(cost)]
+        if len(funded) == 0:
+            return None
+        return min(funded, key=lambda lane: (lane.pending, -(lane.available or 0)))
+
+    async def _lane_for(self, cost: int) -> SenderLane:
+        if not self._refreshed:
+            if self._refresh_lock is None:
+                self._refresh_lock = asyncio.Lock()
+            async with self._refresh_lock:
+                if not self._refreshed:
+                    await self.refresh_balances()
+        lane = self._select(cost)
+        if lane is None:
+            await self.refresh_balances()
+            lane = self._select(cost)
+        if lane is None:
+            raise ValueError(f"No account of the sender pool has balance for {cost} (value and fee reserve)")
+        return lane
+
+    async def submit(self, tx: TxBase) -> Submission:
+        """
+        Sends tx from the least loaded funded account, returns once it is sent.
+        """
+        value = tx.tx.get("value") or 0
+        reserved = value + self.fee_reserve
+        lane = await self._lane_for(reserved)
+        # INFO: no await between selection and the reservation, concurrent submits see load and spend
+        lane.pending += 1
+        lane.pending_spend += reserved
+        try:
+            submission = await lane.engine.submit(TxBase(trans=dict(tx.tx, **{"from": lane.address})))
+        except BaseException:
+            lane.pending -= 1
+            lane.pending_spend -= reserved
+            raise
+        fee = submission.tx712.gas_limit * submission.tx712.maxFeePerGas
+        self.fee_reserve = max(self.fee_reserve, fee)
+        cost = value + fee
+        lane.pending_spend += cost - reserved
+        submission.future.add_done_callback(lambda f: self._done(lane, value, fee, f))
+        return submission
+
+    @staticmethod
+    def _done(lane: SenderLane, value: int, fee: int, future: asyncio.Future):
+        lane.pending -= 1
+        lane.pending_spend -= value + fee
+        if lane.balance is None or future.cancelled() or future.exception() is not None:
+            return
+        receipt = future.result()
+        block = receipt.get("blockNumber")
+        # INFO: a balance read at or after the block of the receipt already includes the spend
+        if block is not None and lane.balance_block is not None and block <= lane.balance_block:
+            return
+        gas_used, gas_price = receipt.get("gasUsed"), receipt.get("effectiveGasPrice")
+        if gas_used is not None and gas_price is not None:
+            fee = gas_used * gas_price
+        lane.balance -= fee + (value if receipt.get("status", 1) != 0 else 0)
+
+    async def submit_many(self, txs: Sequence[TxBase]) -> List[Submission]:
+        return list(await asyncio.gather(*[self.submit(tx) for tx in txs]))
+
+    async def drain(self):
+        await asyncio.gather(*[lane.engine.drain() for lane in self.lanes])
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        if not self.running:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh_balances()
+            except Exception as err:
+                self.logger.warning(f"Failed to refresh sender pool balances: {err}")
+
+    async def close(self):
+        await self.stop()
+        await asyncio.gather(*[lane.engine.close() for lane in self.lanes])
+        if self._own_executor:
+            # INFO: waiting for running signing jobs must not block the event loop
+            await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+
+    async def __aenter__(self) -> "AsyncSenderPool":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
@@ -0,0 +1,344 @@
+import asyncio
+import dataclasses
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from hexbytes import HexBytes
+from web3.exceptions import TimeExhausted
+from web3.types import TxReceipt
+
+from zksync2_async.signer.signing_service import AsyncSigningService
+from zksync2_async.transaction.nonce_manager import AsyncNonceManager, nonce_manager, is_nonce_error
+from zksync2_async.transaction.transaction712 import Transaction712
+from zksync2_async.transaction.transaction_builders import TxBase
+
+
+class DroppedTransaction(TimeExhausted):
+    """
+    Transaction without receipt whose nonce the node doesn't know anymore, or a transaction
+    queued after it.
+    """
+
+
+@dataclass
+class SubmissionMetrics:
+    submitted: int = 0
+    sent: int = 0
+    confirmed: int = 0
+    reverted: int = 0
+    failed: int = 0
+    replaced: int = 0
+    resubmitted: int = 0
+    in_flight: int = 0
+    total_latency: float = 0.0
+    started_at: Optional[float] = None
+
+    @property
+    def mean_latency(self) -> float:
+        """
+        Mean seconds from submit() to the receipt.
+        """
+        done = self.confirmed + self.reverted
+        if done == 0:
+            return 0.0
+        return self.total_latency / done
+
+    def throughput(self, now: Optional[float] = None) -> float:
+        """
+        Receipts per second since the first submit().
+        """
+        if self.started_at is None:
+            return 0.0
+        elapsed = (time.monotonic() if now is None else now) - self.started_at
+        if elapsed <= 0:
+            return 0.0
+        return (self.confirmed + self.reverted) / elapsed
+
+
+@dataclass
+class Submission:
+    """
+    Handle of a submitted transaction, future resolves to its receipt.
+    """
+    tx: TxBase
+    tx712: Transaction712
+    future: asyncio.Future
+    submitted_at: float
+    tx_hashes: List[HexBytes] = field(default_factory=list)
+
+    @property
+    def nonce(self) -> int:
+        return self.tx712.nonce
+
+    @property
+    def tx_hash(self) -> HexBytes:
+        """
+        Hash of the last sent version of the transaction.
+        """
+        return self.tx_hashes[-1]
+
+    async def wait(self) -> TxReceipt:
+        return await asyncio.shield(self.future)
+
+
+class AsyncSubmissionEngine:
+    """
+    Sends transactions of one account with at most max_in_flight of them waiting for receipts.
+
+    submit() prepares the transaction (AsyncZkSyncModule.prepare_transaction), allocates the nonce
+    from the account nonce manager, signs it with the signing service and hands it to the provider
+    in nonce order without waiting for the previous send to be answered, then returns a Submission
+    while the receipt is awaited in background through the shared receipt watcher of the module
+    (started unless use_receipt_watcher is False).
+
+    Sends failed with a nonce error are resubmitted with a resynchronized nonce up to
+    max_resubmits times. With replace_after a transaction without receipt is sent again
+    with fees bumped by fee_bump, at most max_replacements times.
+
+    A transaction without receipt after receipt_timeout whose nonce is not counted by the node
+    (dropped from the mempool) is sent again, up to max_resubmits times. Then it fails with
+    DroppedTransaction together with the transactions queued after it, and the nonce counter
+    is resynchronized with the node.
+    """
+    logger = logging.getLogger("SubmissionEngine")
+
+    def __init__(self,
+                 module,
+                 signing_service: AsyncSigningService,
+                 max_in_flight: int = 16,
+                 receipt_timeout: float = 120,
+                 replace_after: Optional[float] = None,
+                 fee_bump: float = 0.125,
+                 max_replacements: int = 3,
+                 max_resubmits: int = 2,
+                 use_receipt_watcher: bool = True,
+                 clock: Callable[[], float] = time.monotonic):
+        self.module = module
+        self.signing_service = signing_service
+        self.address = signing_service.signer.address
+        self.max_in_flight = max_in_flight
+        self.receipt_timeout = receipt_timeout
+        self.replace_after = replace_after
+        self.fee_bump = fee_bump
+        self.max_replacements = max_replacements
+        self.max_resubmits = max_resubmits
+        self.use_receipt_watcher = use_receipt_watcher
+        self.clock = clock
+        self.metrics = SubmissionMetrics()
+        self._window: Optional[asyncio.Semaphore] = None
+        self._last_handoff: Optional[asyncio.Future] = None
+        self._trackers: Dict[asyncio.Task, Submission] = dict()
+
+    @property
+    def nonces(self) -> AsyncNonceManager:
+        return nonce_manager(self.module, self.address)
+
+    @property
+    def pending(self) -> int:
+        return self.metrics.in_flight
+
+    @property
+    def throughput(self) -> float:
+        return self.metrics.throughput(self.clock())
+
+    def _ensure_primitives(self):
+        if self._window is None:
+            self._window = asyncio.Semaphore(self.max_in_flight)
+            if self.use_receipt_watcher:
+                self.module.start_receipt_watcher()
+
+    async def submit(self, tx: TxBase) -> Submission:
+        """
+        Returns once the transaction is sent, waits while max_in_flight transactions have no receipt.
+        """
+        if tx.tx["from"].lower() != self.address.lower():
+            raise ValueError(f"Transaction from {tx.tx['from']} can't be sent by {self.address}")
+        self._ensure_primitives()
+        if self.metrics.started_at is None:
+            self.metrics.started_at = self.clock()
+        self.metrics.submitted += 1
+        submitted_at = self.clock()
+
+        await self._window.acquire()
+        self.metrics.in_flight += 1
+        try:
+            # INFO: estimate doesn't depend on the nonce, it's prepared before the nonce
+            #       is allocated and the nonce is set right before signing
+            prepared = await self.module.prepare_transaction(tx.tx, nonce=0)
+            submission = await self._send(tx, prepared, submitted_at)
+        except BaseException:
+            self.metrics.in_flight -= 1
+            self.metrics.failed += 1
+            self._window.release()
+            raise
+        tracker = asyncio.ensure_future(self._track(submission))
+        self._trackers[tracker] = submission
+        tracker.add_done_callback(lambda t: self._trackers.pop(t, None))
+        return submission
+
+    async def _send(self, tx: TxBase, prepared: Transaction712, submitted_at: float) -> Submission:
+        attempt = 0
+        while True:
+            try:
+                tx712, tx_hash = await self._send_once(prepared)
+            except Exception as err:
+                if attempt >= self.max_resubmits or not is_nonce_error(err):
+                    raise
+                attempt += 1
+                self.metrics.resubmitted += 1
+                self.logger.warning(f"Resubmitting transaction of {self.address}: {err}")
+                continue
+            self.metrics.sent += 1
+            self.module.track_estimate(tx_hash, tx.tx)
+            return Submission(tx=tx,
+                              tx712=tx712,
+                              future=asyncio.get_running_loop().create_future(),
+                              submitted_at=submitted_at,
+                              tx_hashes=[HexBytes(tx_hash)])
+
+    async def _send_once(self, prepared: Transaction712) -> Tuple[Transaction712, HexBytes]:
+        async with self.nonces.reserve() as nonce:
+            # INFO: taken before any await, so hand-offs follow the order nonces were allocated in
+            previous, handed_off = self._last_handoff, asyncio.get_running_loop().create_future()
+            self._last_handoff = handed_off
+            try:
+                tx712 = dataclasses.replace(prepared, nonce=nonce)
+                raw = await self.signing_service.sign(tx712)
+                if previous is not None:
+                    await asyncio.shield(previous)
+                # INFO: the send starts now, later nonces don't wait for the node to answer it
+                sending = asyncio.ensure_future(self.module.send_raw_transaction(raw))
+            finally:
+                if not handed_off.done():
+                    handed_off.set_result(None)
+            return tx712, await sending
+
+    async def _replace(self, submission: Submission):
+        tx712 = dataclasses.replace(
+            submission.tx712,
+            maxFeePerGas=int(submission.tx712.maxFeePerGas * (1 + self.fee_bump)),
+            maxPriorityFeePerGas=int(submission.tx712.maxPriorityFeePerGas * (1 + self.fee_bump)))
+        try:
+            tx_hash = await self.module.send_raw_transaction(await self.signing_service.sign(tx712))
+        except Exception as err:
+            # INFO: the node may reject the replacement, e.g. when the original is already mined
+            self.logger.warning(f"Failed to replace transaction {submission.tx_hash !r}: {err}")
+            return False
+        submission.tx712 = tx712
+        submission.tx_hashes.append(HexBytes(tx_hash))
+        self.metrics.replaced += 1
+        return True
+
+    async def _dropped(self, submission: Submission) -> bool:
+        node_nonce = await self.module.get_transaction_count(self.address, self.nonces.block_identifier)
+        return node_nonce <= submission.nonce
+
+    async def _resend(self, submission: Submission):
+        try:
+            tx_hash = HexBytes(await self.module.send_raw_transaction(
+                await self.signing_service.sign(submission.tx712)))
+        except Exception as err:
+            # INFO: the transaction may have been mined meanwhile, keep waiting for its receipt
+            self.logger.warning(f"Failed to resend transaction {submission.tx_hash !r}: {err}")
+            return
+        self.metrics.resubmitted += 1
+        if tx_hash not in submission.tx_hashes:
+            submission.tx_hashes.append(tx_hash)
+
+    async def _wait_receipt(self, submission: Submission) -> TxReceipt:
+        deadline = self.clock() + self.receipt_timeout
+        replacements = 0
+        resends = 0
+        while True:
+            remaining = deadline - self.clock()
+            if remaining <= 0:
+                if not await self._dropped(submission):
+                    raise TimeExhausted(f"Transaction {submission.tx_hash !r} is not in the chain "
+                                        f"after {self.receipt_timeout} seconds")
+                if resends >= self.max_resubmits:
+                    raise DroppedTransaction(f"Transaction {submission.tx_hash !r} with nonce "
+                                             f"{submission.nonce} was dropped by the node")
+                resends += 1
+                self.logger.warning(f"Resending dropped transaction {submission.tx_hash !r}")
+                await self._resend(submission)
+                deadline = self.clock() + self.receipt_timeout
+                continue
+            replace = self.replace_after is not None and replacements < self.max_replacements
+            timeout = min(remaining, self.replace_after) if replace else remaining
+            waiters = [asyncio.ensure_future(self.module.wait_for_transaction_receipt(h, timeout=timeout))
+                       for h in submission.tx_hashes]
+            try:
+                for waiter in asyncio.as_completed(waiters):
+                    try:
+                        return await waiter
+                    except TimeExhausted:
+                        continue
+            finally:
+                for waiter in waiters:
+                    waiter.cancel()
+            if replace:
+                replacements += 1
+                await self._replace(submission)
+
+    async def _track(self, submission: Submission):
+        try:
+            receipt = await self._wait_receipt(submission)
+        except asyncio.CancelledError:
+            submission.future.cancel()
+            raise
+        except Exception as err:
+            self._fail(submission, err)
+            if isinstance(err, DroppedTransaction):
+                await self._abandon_after(submission.nonce)
+        else:
+            if receipt.get("status", 1) == 0:
+                self.metrics.reverted += 1
+            else:
+                self.metrics.confirmed += 1
+            self.metrics.total_latency += self.clock() - submission.submitted_at
+            submission.future.set_result(receipt)
+        finally:
+            self.metrics.in_flight -= 1
+            self._window.release()
+
+    def _fail(self, submission: Submission, err: Exception):
+        if submission.future.done():
+            return
+        self.metrics.failed += 1
+        submission.future.set_exception(err)
+        # INFO: nobody may wait for the submission, don't report its exception as unretrieved
+        submission.future.exception()
+
+    async def _abandon_after(self, nonce: int):
+        """
+        Fails the transactions queued behind a dropped nonce, they can't be mined anymore.
+        """
+        for tracker, later in list(self._trackers.items()):
+            if later.nonce > nonce and not later.future.done():
+                self._fail(later, DroppedTransaction(f"Transaction {later.tx_hash !r} with nonce {later.nonce} "
+                                                     f"is queued after dropped nonce {nonce}"))
+                tracker.cancel()
+        await self.nonces.resync()
+
+    async def submit_many(self, txs: List[TxBase]) -> List[Submission]:
+        return [await self.submit(tx) for tx in txs]
+
+    async def drain(self):
+        """
+        Waits until all sent transactions have receipts (or failed).
+        """
+        if len(self._trackers) > 0:
+            await asyncio.gather(*list(self._trackers), return_exceptions=True)
+
+    async def close(self):
+        for tracker in list(self._trackers):
+            tracker.cancel()
+        await self.drain()
+
+    async def __aenter__(self) -> "AsyncSubmissionEngine":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
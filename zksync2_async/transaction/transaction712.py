@@ -1,11 +1,10 @@
 from dataclasses import dataclass
-from typing import Union, Optional
+from typing import Union, Optional, List, Tuple
 import rlp
 from eth_account.datastructures import SignedMessage
 from eth_typing import ChecksumAddress, HexStr
-from eth_utils import remove_0x_prefix
-from rlp.sedes import big_endian_int, binary
-from rlp.sedes import List as rlpList
+from eth_utils import remove_0x_prefix, keccak
+from rlp.sedes import big_endian_int
 from web3.types import Nonce
 from zksync2_async.core.request_types import EIP712Meta
 
@@ -14,6 +13,24 @@ from zksync2_async.core.utils import to_bytes, hash_byte_code, encode_address, i
 
 DynamicBytes = Bytes(0)
 
+TRANSACTION_TYPE = "Transaction(uint256 txType,uint256 from,uint256 to,uint256 gasLimit," \
+                   "uint256 gasPerPubdataByteLimit,uint256 maxFeePerGas,uint256 maxPriorityFeePerGas," \
+                   "uint256 paymaster,uint256 nonce,uint256 value,bytes data,bytes32[] factoryDeps," \
+                   "bytes paymasterInput)"
+TRANSACTION_TYPE_HASH = keccak(text=TRANSACTION_TYPE)
+
+_rlp_int = big_endian_int.serialize
+
+
+def _uint256(value: int) -> bytes:
+    return value.to_bytes(32, byteorder='big', signed=False)
+
+
+def _address_to_int(addr: Union[bytes, str]) -> int:
+    if isinstance(addr, bytes):
+        return int.from_bytes(addr, byteorder='big')
+    return int(addr, 16)
+
 
 @dataclass
 class Transaction712:
@@ -30,46 +47,22 @@ class Transaction712:
     from_: Union[bytes, HexStr]
     meta: EIP712Meta
 
-    def encode(self, signature: Optional[SignedMessage] = None) -> bytes:
-        factory_deps_data = []
-        factory_deps_elements = None
+    def _factory_deps(self) -> List[bytes]:
         factory_deps = self.meta.factory_deps
-        if factory_deps is not None and len(factory_deps) > 0:
-            factory_deps_data = factory_deps
-            factory_deps_elements = [binary for _ in range(len(factory_deps_data))]
+        if factory_deps is None:
+            return []
+        return factory_deps
 
-        paymaster_params_data = []
-        paymaster_params_elements = None
+    def _paymaster_params(self) -> Tuple[Optional[HexStr], bytes]:
         paymaster_params = self.meta.paymaster_params
-        if paymaster_params is not None and \
-                paymaster_params.paymaster is not None and \
-                paymaster_params.paymaster_input is not None:
-            paymaster_params_data = [
-                bytes.fromhex(remove_0x_prefix(paymaster_params.paymaster)),
-                paymaster_params.paymaster_input
-            ]
-            paymaster_params_elements = [binary, binary]
-
-        class InternalRepresentation(rlp.Serializable):
-            fields = [
-                ('nonce', big_endian_int),
-                ('maxPriorityFeePerGas', big_endian_int),
-                ('maxFeePerGas', big_endian_int),
-                ('gasLimit', big_endian_int),
-                ('to', binary),
-                ('value', big_endian_int),
-                ('data', binary),
-                ('chain_id', big_endian_int),
-                ('unknown1', binary),
-                ('unknown2', binary),
-                ('chain_id2', big_endian_int),
-                ('from', binary),
-                ('gasPerPubdata', big_endian_int),
-                ('factoryDeps', rlpList(elements=factory_deps_elements, strict=False)),
-                ('signature', binary),
-                ('paymaster_params', rlpList(elements=paymaster_params_elements, strict=False))
-            ]
+        if paymaster_params is None:
+            return None, b''
+        paymaster_input = paymaster_params.paymaster_input
+        if paymaster_input is None:
+            paymaster_input = b''
+        return paymaster_params.paymaster, paymaster_input
 
+    def encode(self, signature: Optional[SignedMessage] = None) -> bytes:
         custom_signature = self.meta.custom_signature
         if custom_signature is not None:
             rlp_signature = custom_signature
@@ -78,27 +71,61 @@ class Transaction712:
         else:
             raise RuntimeError("Custom signature and signature can't be None both")
 
-        representation_params = {
-            "nonce": self.nonce,
-            "maxPriorityFeePerGas": self.maxPriorityFeePerGas,
-            "maxFeePerGas": self.maxFeePerGas,
-            "gasLimit": self.gas_limit,
-            "to": encode_address(self.to),
-            "value": self.value,
-            "data": to_bytes(self.data),
-            "chain_id": self.chain_id,
-            "unknown1": b'',
-            "unknown2": b'',
-            "chain_id2": self.chain_id,
-            "from": encode_address(self.from_),
-            "gasPerPubdata": self.meta.gas_per_pub_data,
-            "factoryDeps": factory_deps_data,
-            "signature": rlp_signature,
-            "paymaster_params": paymaster_params_data
-        }
-        representation = InternalRepresentation(**representation_params)
-        encoded_rlp = rlp.encode(representation, infer_serializer=True, cache=False)
-        return int_to_bytes(self.EIP_712_TX_TYPE) + encoded_rlp
+        paymaster_params_data = []
+        paymaster_params = self.meta.paymaster_params
+        if paymaster_params is not None and \
+                paymaster_params.paymaster is not None and \
+                paymaster_params.paymaster_input is not None:
+            paymaster_params_data = [
+                bytes.fromhex(remove_0x_prefix(paymaster_params.paymaster)),
+                paymaster_params.paymaster_input
+            ]
+
+        chain_id = _rlp_int(self.chain_id)
+        representation = [
+            _rlp_int(self.nonce),
+            _rlp_int(self.maxPriorityFeePerGas),
+            _rlp_int(self.maxFeePerGas),
+            _rlp_int(self.gas_limit),
+            encode_address(self.to),
+            _rlp_int(self.value),
+            to_bytes(self.data),
+            chain_id,
+            b'',
+            b'',
+            chain_id,
+            encode_address(self.from_),
+            _rlp_int(self.meta.gas_per_pub_data),
+            list(self._factory_deps()),
+            rlp_signature,
+            paymaster_params_data
+        ]
+        return _EIP_712_TX_TYPE_PREFIX + rlp.encode(representation)
+
+    def struct_hash(self) -> bytes:
+        """
+        EIP-712 hashStruct of the transaction, same value as to_eip712_struct().hash_struct()
+        computed directly from the field values.
+        """
+        paymaster, paymaster_input = self._paymaster_params()
+        factory_deps_hashes = b''.join([hash_byte_code(bytecode) for bytecode in self._factory_deps()])
+        encoded = b''.join([
+            TRANSACTION_TYPE_HASH,
+            _EIP_712_TX_TYPE_WORD,
+            _uint256(_address_to_int(self.from_)),
+            _uint256(_address_to_int(self.to)),
+            _uint256(self.gas_limit),
+            _uint256(self.meta.gas_per_pub_data),
+            _uint256(self.maxFeePerGas),
+            _uint256(self.maxPriorityFeePerGas),
+            _uint256(0 if paymaster is None else _address_to_int(paymaster)),
+            _uint256(self.nonce),
+            _uint256(self.value),
+            keccak(to_bytes(self.data)),
+            keccak(factory_deps_hashes),
+            keccak(to_bytes(paymaster_input))
+        ])
+        return keccak(encoded)
 
     def to_eip712_struct(self) -> EIP712Struct:
         class Transaction(EIP712Struct):
@@ -153,3 +180,7 @@ class Transaction712:
         return Transaction(**kwargs)
 
 
+_EIP_712_TX_TYPE_PREFIX = int_to_bytes(Transaction712.EIP_712_TX_TYPE)
+_EIP_712_TX_TYPE_WORD = _uint256(Transaction712.EIP_712_TX_TYPE)
+
+
@@ -1,50 +1,139 @@
 import json
 import importlib.resources as pkg_resources
-from zksync2_async.utils import contract_abi
-
-zksync_abi_cache = {}
+import threading
+from typing import Dict, List, Optional, Type
+
+from eth_utils import function_abi_to_4byte_selector, event_abi_to_log_topic
+from web3._utils.abi import abi_to_signature
+from web3.contract import AsyncContract
+from web3.eth import AsyncEth
+
+from zksync2_async.utils import contract_abi as contract_abi_package
+
+
+class ContractABI:
+    """
+    Parsed ABI of a bundled contract with precomputed function selectors
+    and event topics.
+    """
+
+    def __init__(self, name: str, abi: List[dict]):
+        self.name = name
+        self.abi = abi
+        self.selectors: Dict[str, bytes] = dict()
+        self.functions: Dict[str, List[dict]] = dict()
+        self.event_topics: Dict[str, bytes] = dict()
+        for entry in abi:
+            if entry.get("type") == "function":
+                self.selectors[abi_to_signature(entry)] = function_abi_to_4byte_selector(entry)
+                self.functions.setdefault(entry["name"], []).append(entry)
+            elif entry.get("type") == "event":
+                self.event_topics[entry["name"]] = event_abi_to_log_topic(entry)
+
+    def __repr__(self):
+        return f"ContractABI({self.name}, functions={len(self.selectors)}, events={len(self.event_topics)})"
+
+    def selector(self, fn_name: str) -> bytes:
+        """
+        Selector of a not overloaded function by its name.
+        """
+        functions = self.functions.get(fn_name)
+        if functions is None:
+            raise ValueError(f"{self.name} has no function {fn_name}")
+        if len(functions) > 1:
+            raise ValueError(f"{self.name} function {fn_name} is overloaded, use selectors by signature")
+        return self.selectors[abi_to_signature(functions[0])]
+
+    def event_topic(self, event_name: str) -> bytes:
+        return self.event_topics[event_name]
+
+
+_abi_registry: Dict[str, ContractABI] = dict()
+_abi_registry_lock = threading.Lock()
+
+
+def contract_abi(abi_file: str) -> ContractABI:
+    """
+    Returns the bundled ABI, the file is parsed once per process on first use.
+    """
+    registered = _abi_registry.get(abi_file)
+    if registered is not None:
+        return registered
+    with _abi_registry_lock:
+        registered = _abi_registry.get(abi_file)
+        if registered is None:
+            with pkg_resources.files(contract_abi_package).joinpath(abi_file).open(mode='r') as json_file:
+                data = json.load(json_file)
+            # INFO: some bundled files hold the bare ABI list instead of compiled contract
+            abi = data['abi'] if isinstance(data, dict) else data
+            registered = ContractABI(abi_file, abi)
+            _abi_registry[abi_file] = registered
+    return registered
+
+
+def contract_factory(module: AsyncEth, abi_file: str) -> Type[AsyncContract]:
+    """
+    Returns the contract class of the bundled ABI bound to the module, one per module,
+    wrappers create their contract instances from it instead of rebuilding the class.
+    """
+    # INFO: kept on the module, the classes reference its web3 and a global map keyed by it would never free it
+    factories: Optional[Dict[str, Type[AsyncContract]]] = getattr(module, "_contract_factories", None)
+    if factories is None:
+        factories = dict()
+        module._contract_factories = factories
+    factory = factories.get(abi_file)
+    if factory is None:
+        factory = module.contract(abi=contract_abi(abi_file).abi)
+        factories[abi_file] = factory
+    return factory
 
 
-# todo: remove global cache var
 def _zksync_abi(abi_file: str):
-    global zksync_abi_cache
+    return contract_abi(abi_file).abi
 
-    abi_cache = zksync_abi_cache.get(abi_file)
-    if abi_cache is None:
-        with pkg_resources.path(contract_abi, abi_file) as p:
-            with p.open(mode='r') as json_file:
-                data = json.load(json_file)
-                zksync_abi_cache[abi_file] = data['abi']
-    return abi_cache
+
+ZKSYNC_ABI = "IZkSync.json"
+CONTRACT_DEPLOYER_ABI = "ContractDeployer.json"
+ERC20_ABI = "IERC20.json"
+ETH_TOKEN_ABI = "IEthToken.json"
+L1_BRIDGE_ABI = "IL1Bridge.json"
+L2_BRIDGE_ABI = "IL2Bridge.json"
+NONCE_HOLDER_ABI = "INonceHolder.json"
+PAYMASTER_FLOW_ABI = "IPaymasterFlow.json"
+MULTICALL3_ABI = "IMulticall3.json"
 
 
 def zksync_abi_default():
-    return _zksync_abi("IZkSync.json")
+    return _zksync_abi(ZKSYNC_ABI)
 
 
 def contract_deployer_abi_default():
-    return _zksync_abi("ContractDeployer.json")
+    return _zksync_abi(CONTRACT_DEPLOYER_ABI)
 
 
 def erc_20_abi_default():
-    return _zksync_abi("IERC20.json")
+    return _zksync_abi(ERC20_ABI)
 
 
 def eth_token_abi_default():
-    return _zksync_abi("IEthToken.json")
+    return _zksync_abi(ETH_TOKEN_ABI)
 
 
 def l1_bridge_abi_default():
-    return _zksync_abi("IL1Bridge.json")
+    return _zksync_abi(L1_BRIDGE_ABI)
 
 
 def l2_bridge_abi_default():
-    return _zksync_abi("IL2Bridge.json")
+    return _zksync_abi(L2_BRIDGE_ABI)
 
 
 def nonce_holder_abi_default():
-    return _zksync_abi("INonceHolder.json")
+    return _zksync_abi(NONCE_HOLDER_ABI)
 
 
 def paymaster_flow_abi_default():
-    return _zksync_abi("IPaymasterFlow.json")
+    return _zksync_abi(PAYMASTER_FLOW_ABI)
+
+
+def multicall3_abi_default():
+    return _zksync_abi(MULTICALL3_ABI)
@@ -1,5 +1,6 @@
+from functools import lru_cache
+
 from eth_utils import to_checksum_address, is_address
-from eth_utils.curried import apply_formatter_to_array
 
 from eth_utils.curried import apply_formatter_at_index
 from web3.module import Module
@@ -23,7 +24,7 @@ from zksync2_async.core.types import BridgeAddresses, ZksMessageProof, Token, Fe
 from zksync2_async.core.request_types import *
 from eth_utils import remove_0x_prefix
 from eth_utils.toolz import compose
-from typing import Any, Callable, List, Union, Dict
+from typing import Any, Callable, List, Optional, Union, Dict
 
 from zksync2_async.utils.rpc_endpoints import eth_estimate_gas_rpc, zks_estimate_fee_rpc, zks_get_confirmed_tokens_rpc, \
     zks_get_bridge_contracts_rpc, zks_get_all_account_balances_rpc, zks_get_l2_to_l1_log_proof_prc, \
@@ -31,30 +32,63 @@ from zksync2_async.utils.rpc_endpoints import eth_estimate_gas_rpc, zks_estimate
 
 
 def bytes_to_list(v: bytes) -> List[int]:
-    return [int(e) for e in v]
+    return list(v)
+
+
+def bytes_to_hex(v: bytes) -> HexStr:
+    return HexStr("0x" + bytes(v).hex())
+
+
+META_BYTES_FORMATTERS: Dict[str, Callable[[bytes], Any]] = {
+    "list": bytes_to_list,
+    "hex": bytes_to_hex,
+}
+
 
+def meta_bytes_formatter(encoding: str) -> Callable[[bytes], Any]:
+    """
+    Encoding of factory deps and paymaster input in eip712Meta of requests:
+    "list" (default) sends arrays of byte values, "hex" sends 0x strings which are
+    much smaller, use it only with nodes which accept hex encoded bytes.
+    """
+    if encoding not in META_BYTES_FORMATTERS:
+        raise ValueError(f"Unknown meta bytes encoding {encoding}, use one of {sorted(META_BYTES_FORMATTERS)}")
+    return META_BYTES_FORMATTERS[encoding]
 
-def meta_formatter(eip712: EIP712Meta) -> dict:
+
+def meta_formatter(eip712: Union[EIP712Meta, dict], bytes_formatter: Callable[[bytes], Any] = bytes_to_list) -> dict:
+    if isinstance(eip712, dict):
+        # INFO: already formatted by zksync_transaction_munger with the encoding of the module
+        return eip712
     ret = {
         "gasPerPubdata": integer_to_hex(eip712.gas_per_pub_data)
     }
     if eip712.custom_signature is not None:
         ret["customSignature"] = eip712.custom_signature.hex()
 
-    factory_formatter = apply_formatter_to_array(bytes_to_list)
     if eip712.factory_deps is not None:
-        ret["factoryDeps"] = factory_formatter(eip712.factory_deps)
+        ret["factoryDeps"] = [bytes_formatter(dep) for dep in eip712.factory_deps]
 
     pp_params = eip712.paymaster_params
     if pp_params is not None:
-        paymaster_input = bytes_to_list(pp_params.paymaster_input)
         ret["paymasterParams"] = {
             "paymaster": pp_params.paymaster,
-            "paymasterInput": paymaster_input
+            "paymasterInput": bytes_formatter(pp_params.paymaster_input)
         }
     return ret
 
 
+def zksync_transaction_munger(module: "Module", transaction: Transaction) -> List[Any]:
+    """
+    Formats eip712Meta of the transaction with meta_bytes_encoding of the module.
+    """
+    meta = transaction.get("eip712Meta")
+    encoding = getattr(module, "meta_bytes_encoding", "list")
+    if meta is None or isinstance(meta, dict) or encoding == "list":
+        return [transaction]
+    return [dict(transaction, eip712Meta=meta_formatter(meta, meta_bytes_formatter(encoding)))]
+
+
 ZKS_TRANSACTION_PARAMS_FORMATTERS = {
     'data': to_ascii_if_bytes,
     'from': apply_formatter_if(is_address, to_checksum_address),
@@ -125,9 +159,11 @@ ZKSYNC_RESULT_FORMATTERS: Dict[RPCEndpoint, Callable[..., Any]] = {
 }
 
 
+@lru_cache(maxsize=None)
 def zksync_get_request_formatters(
         method_name: Union[RPCEndpoint, Callable[..., RPCEndpoint]]
 ) -> Dict[str, Callable[..., Any]]:
+    # INFO: formatter maps are static, the composed chain is built once per method
     request_formatter_maps = (
         ZKSYNC_REQUEST_FORMATTERS,
         ABI_REQUEST_FORMATTERS,
@@ -142,15 +178,22 @@ def zksync_get_result_formatters(
         method_name: Union[RPCEndpoint, Callable[..., RPCEndpoint]],
         module: "Module",
 ) -> Dict[str, Callable[..., Any]]:
-    # formatters = combine_formatters((PYTHONIC_RESULT_FORMATTERS,), method_name)
-    # formatters_requiring_module = combine_formatters(
-    #     (FILTER_RESULT_FORMATTERS,), method_name
-    # )
-    # partial_formatters = apply_module_to_formatters(
-    #     formatters_requiring_module, module, method_name
-    # )
-    # return compose(*partial_formatters, *formatters)
-
+    # INFO: kept on the module, filter formatters are bound to it and a global map keyed by it would never free it
+    module_formatters: Optional[Dict[Any, Callable[..., Any]]] = getattr(module, "_result_formatters", None)
+    if module_formatters is None:
+        module_formatters = dict()
+        module._result_formatters = module_formatters
+    formatter = module_formatters.get(method_name)
+    if formatter is None:
+        formatter = _build_result_formatters(method_name, module)
+        module_formatters[method_name] = formatter
+    return formatter
+
+
+def _build_result_formatters(
+        method_name: Union[RPCEndpoint, Callable[..., RPCEndpoint]],
+        module: "Module",
+) -> Callable[..., Any]:
     formatters = combine_formatters(
         (ZKSYNC_RESULT_FORMATTERS,
          PYTHONIC_RESULT_FORMATTERS),